@@ -0,0 +1,122 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.special import ndtri
+
+# Jumlah percobaan Monte Carlo per jurusan
+DEFAULT_TRIALS = 10_000
+
+# Tingkat peluang (0-1) tempat kuantil nilai minimum disimpan; peluang di antaranya diinterpolasi
+CHANCE_LEVELS = np.linspace(0.0, 1.0, 51)
+
+# Korelasi nilai rapor (SNBP) dengan kemampuan akademik, dan simpangan nilai tes (SNBT)
+# terhadap kemampuan (faktor hari ujian)
+RAPOR_CORRELATION = 0.6
+TEST_NOISE = 0.35
+
+# Pendaftar jurusan yang lebih ketat rata-rata lebih kuat: pergeseran rata-rata kemampuan
+# pendaftar per simpangan baku log(Rasio Keketatan), dan ketidakpastiannya per percobaan
+SELECTIVITY_SHIFT = 0.25
+POOL_SHIFT_NOISE = 0.1
+
+# Nilai minimum dibatasi ke rentang z ini (jalur tanpa persaingan bernilai -inf)
+Z_LIMIT = 8.0
+
+# Batas elemen (jurusan x percobaan) per batch
+BATCH_ELEMENTS = 1 << 21
+
+# Di bawah jumlah jurusan ini simulasi berjalan di proses yang sama
+PARALLEL_MIN_ROWS = 5_000
+
+
+# Nilai ambang ke-k tertinggi dari n pendaftar N(mean, scale) tanpa membangkitkan n nilai:
+# statistik urutan ke-(n-k+1) dari n sampel uniform berdistribusi Beta(n-k+1, k).
+# Bila kursi >= pendaftar semua pendaftar diterima (ambang -inf).
+def _cutoff(rng, applicants, seats, mean, scale):
+    full = applicants <= seats
+    a = np.where(full, 1, applicants - seats + 1)
+    b = np.broadcast_to(np.maximum(seats, 1), a.shape)
+    cutoff = mean + scale * ndtri(rng.beta(a, b))
+    return np.where(full, -np.inf, cutoff)
+
+
+# Simulasi satu batch jurusan. Setiap percobaan:
+# 1. jumlah pendaftar tahun depan ~ Poisson(Peminat 2024), kemampuan pendaftar ~ N(mu, 1)
+#    dengan mu bergantung keketatan jurusan;
+# 2. SNBP mengambil kursi Daya Tampung SNBP dari peringkat nilai rapor teratas;
+# 3. sisa pendaftar bersaing untuk kursi Daya Tampung SNBT dengan nilai tes.
+# Untuk tiap percobaan dihitung kemampuan minimum (skala z) agar pengguna lolos di salah satu
+# jalur; kuantil nilai minimum tersebut pada CHANCE_LEVELS adalah kurva peluang jurusan.
+def _simulate(task):
+    batch_index, seed, peminat, snbp, snbt, shift, trials = task
+    rng = np.random.default_rng([seed, batch_index])
+    shape = (len(peminat), trials)
+    applicants = rng.poisson(np.broadcast_to(peminat[:, None], shape))
+    mu = shift[:, None] + POOL_SHIFT_NOISE * rng.standard_normal(shape)
+
+    rapor_noise = np.sqrt(1 - RAPOR_CORRELATION ** 2)
+    test_scale = np.sqrt(1 + TEST_NOISE ** 2)
+    rapor_cutoff = _cutoff(rng, applicants, snbp[:, None], RAPOR_CORRELATION * mu, 1.0)
+    test_cutoff = _cutoff(rng, np.maximum(applicants - snbp[:, None], 0), snbt[:, None], mu, test_scale)
+
+    # Kemampuan minimum pengguna: rapor = rho*z + noise > ambang SNBP, atau z + noise tes > ambang SNBT
+    need_rapor = (rapor_cutoff - rapor_noise * rng.standard_normal(shape)) / RAPOR_CORRELATION
+    need_test = test_cutoff - TEST_NOISE * rng.standard_normal(shape)
+    required = np.clip(np.minimum(need_rapor, need_test), -Z_LIMIT, Z_LIMIT)
+    return np.quantile(required, CHANCE_LEVELS, axis=1).T.astype(np.float32)
+
+
+def _tasks(df, trials, seed):
+    peminat = df['Peminat 2024'].to_numpy(dtype=np.float64)
+    snbp = df['Daya Tampung SNBP 2025'].to_numpy(dtype=np.int64)
+    snbt = df['Daya Tampung SNBT 2025'].to_numpy(dtype=np.int64)
+    log_ratio = np.log(np.maximum(df['Rasio Keketatan'].to_numpy(dtype=np.float64), 1e-3))
+    std = log_ratio.std()
+    shift = SELECTIVITY_SHIFT * (log_ratio - log_ratio.mean()) / (std if std > 0 else 1.0)
+    batch_rows = max(1, BATCH_ELEMENTS // trials)
+    for batch_index, start in enumerate(range(0, len(df), batch_rows)):
+        stop = start + batch_rows
+        yield (batch_index, seed, peminat[start:stop], snbp[start:stop], snbt[start:stop],
+               shift[start:stop], trials)
+
+
+# Kuantil kemampuan minimum untuk lolos (jurusan x CHANCE_LEVELS), dihitung per batch jurusan
+# secara vektor dan di process pool bila katalognya besar. Hasil deterministik untuk seed yang
+# sama berapapun jumlah worker karena setiap batch memakai generator acaknya sendiri.
+def simulate_admission(df, trials=DEFAULT_TRIALS, seed=42, workers=None):
+    if len(df) == 0:
+        return np.zeros((0, len(CHANCE_LEVELS)), dtype=np.float32)
+    tasks = _tasks(df, trials, seed)
+    workers = workers or (os.cpu_count() or 1)
+    if workers == 1 or len(df) < PARALLEL_MIN_ROWS:
+        results = [_simulate(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_simulate, tasks))
+    return np.vstack(results)
+
+
+# Estimasi peluang masuk setiap jurusan dari simulasi Monte Carlo pendaftar dan daya tampung
+# SNBP/SNBT. Simulasi dijalankan sekali per versi dataset; peluang untuk persentil nilai
+# pengguna berapapun dibaca dari kurva kuantil tersimpan tanpa simulasi ulang.
+class AdmissionModel:
+    def __init__(self, df, trials=DEFAULT_TRIALS, seed=42, workers=None):
+        self.trials = trials
+        self.quantiles = simulate_admission(df, trials, seed, workers)
+
+    # Peluang masuk (0-1) per jurusan untuk pengguna pada persentil nilai tertentu (1-99)
+    # di antara seluruh peserta; interpolasi linear pada kurva kuantil
+    def chance(self, percentile, rows=None):
+        q = self.quantiles if rows is None else self.quantiles[rows]
+        z = ndtri(np.clip(percentile, 0.5, 99.5) / 100)
+        below = (q <= z).sum(axis=1)
+        inner = (below > 0) & (below < q.shape[1])
+        result = (below == q.shape[1]).astype(np.float64)
+        i = below[inner]
+        lo = q[inner, i - 1].astype(np.float64)
+        hi = q[inner, i].astype(np.float64)
+        span = np.where(hi > lo, hi - lo, 1.0)
+        frac = np.clip((z - lo) / span, 0.0, 1.0)
+        result[inner] = CHANCE_LEVELS[i - 1] + frac * (CHANCE_LEVELS[i] - CHANCE_LEVELS[i - 1])
+        return result
@@ -1,16 +1,21 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
-import pickle
-import joblib
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics.pairwise import cosine_similarity
 import os
+from concurrent.futures import ThreadPoolExecutor
+import charts
+import ranking
+import recommender
+from components import ChartPool, paginated_table, recommendation_cards_html, similar_programs
+from assets import StaticAssets
+from artifacts import ArtifactStore, CLUSTER_FEATURES, CORRELATION_COLUMNS, SUNBURST_TITLE
+from cubes import CATEGORICAL_COLUMNS, DRILLDOWN_COLUMNS, GEO_LEVELS
+from geo import KOTA_COORDS
+from indexes import top_k
+from profiling import RerunProfiler
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -20,435 +25,63 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS
-def load_css():
-    st.markdown("""
-    <style>
-        /* Base styles */
-        body {
-            background-color: #121212;
-            color: white;
-        }
-        .main {
-            background-color: #121212;
-            color: white;
-        }
-        
-        /* Metric value styling */
-        div[data-testid="stMetricValue"] {
-            font-size: 24px;
-            font-weight: 700;
-            color: #4A6FE3;
-        }
-        
-        /* Metric label styling */
-        [data-testid="stMetricLabel"] {
-            font-size: 14px;
-            font-weight: 500;
-            color: #DDDDDD;
-        }
-        
-        /* Header styling */
-        h1, h2, h3, h4, h5, h6 {
-            color: white;
-        }
-        
-        /* Highlight text */
-        .highlight {
-            color: #4A6FE3;
-            font-weight: 600;
-        }
-        
-        /* Button styling */
-        .stButton>button {
-            background-color: #4A6FE3;
-            color: white;
-            border-radius: 8px;
-            padding: 10px 20px;
-            font-weight: 500;
-            border: none;
-            transition: all 0.3s ease;
-        }
-        .stButton>button:hover {
-            background-color: #3A5FD3;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            transform: translateY(-2px);
-        }
-        
-        /* Tabs styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 10px;
-            background-color: #1E1E1E;
-            padding: 10px;
-            border-radius: 10px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            background-color: #333333;
-            border-radius: 8px;
-            padding: 10px 20px;
-            color: white;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #4A6FE3 !important;
-            color: white !important;
-            box-shadow: 0 2px 5px rgba(74, 111, 227, 0.3) !important;
-        }
-        
-        /* Table styling */
-        .dataframe {
-            background-color: #1E1E1E !important;
-            color: white !important;
-        }
-        
-        /* Radio buttons */
-        .st-cc {
-            color: white;
-        }
-
-        /* Fix any white backgrounds */
-        .element-container, .stDataFrame, .stPlotlyChart, .stText {
-            color: white !important;
-            background-color: transparent !important;
-        }
-        
-        /* Badge styles */
-        .badge {
-            display: inline-block;
-            padding: 5px 10px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-right: 8px;
-        }
-        .badge-primary {
-            background-color: #4A6FE3;
-            color: white;
-        }
-        .badge-success {
-            background-color: #2BBD7E;
-            color: white;
-        }
-        .badge-warning {
-            background-color: #FFC107;
-            color: #333;
-        }
-        .badge-danger {
-            background-color: #E74C3C;
-            color: white;
-        }
-        
-        /* Credit footer */
-        .footer {
-            position: fixed;
-            bottom: 0;
-            left: 0;
-            width: 335px;
-            padding: 10px;
-            background-color: #1E1E1E;
-            color: #DDDDDD;
-            text-align: center;
-            font-size: 12px;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+# Mode profiling rerun (opt-in): env INSIGHT_PROFILE=1 atau query param ?profile=1
+profiler = RerunProfiler(
+    enabled=os.environ.get('INSIGHT_PROFILE') == '1' or st.query_params.get('profile') == '1'
+)
 
-# Fungsi untuk memuat data
-@st.cache_data
-def load_data():
-    try:
-        df = pd.read_csv('dataset/Dataset_Kelompok_10D.csv')
-        return df
-    except FileNotFoundError:
-        try:
-            df = pd.read_csv('Dataset_Kelompok_10D.csv')
-            return df
-        except FileNotFoundError:
-            st.error("❌ File data tidak ditemukan. Harap pastikan file Dataset_Kelompok_10D.csv tersedia.")
-            return None
+# Aset statis (CSS dan gambar) dipublikasikan sekali per proses dengan nama ber-hash isi
+@st.cache_resource
+def get_static_assets():
+    return StaticAssets(serving=st.get_option('server.enableStaticServing'))
 
-# Fungsi untuk memuat model
+# Penyimpan artefak bersama antar sesi: watcher memantau dataset/ dan models/ lalu
+# membangun ulang artefak turunan di latar belakang dan menukarnya secara atomik
 @st.cache_resource
-def load_models():
-    models = {}
+def get_artifact_store():
+    return ArtifactStore().start_watcher()
+
+# Fungsi untuk memuat data dan artefak versi terakhir
+def load_artifacts():
     try:
-        models['kmeans'] = joblib.load('models/kmeans_model.pkl')
-        models['scaler'] = joblib.load('models/scaler.pkl')
-        models['pca'] = joblib.load('models/pca_model.pkl')
-        models['rf'] = joblib.load('models/random_forest_model.pkl')
-        return models
+        return get_artifact_store().get()
     except FileNotFoundError:
-        st.warning("⚠️ Model belum tersedia. Jalankan script train_models.py terlebih dahulu untuk melatih model.")
-        return None
-
-# Fungsi untuk sistem rekomendasi
-def get_recommendations(df, preferences, n=5):
-    # Fitur untuk perbandingan
-    features = ['Rasio Keketatan', 'Tingkat Kelulusan (%)', 'Maks. Waktu Tunggu Kerja (Bulan)', 
-                'Gaji Awal Min', 'Gaji Awal Max']
-    
-    # Membuat DataFrame preferensi
-    user_pref = pd.DataFrame([preferences], columns=features)
-    
-    # Gabungkan preferensi pengguna dengan data jurusan untuk perhitungan similarity
-    combined_data = pd.concat([df[features], user_pref])
-    
-    # Normalisasi data
-    scaler = StandardScaler()
-    scaled_data = scaler.fit_transform(combined_data)
-    
-    # Hitung similarity
-    similarity = cosine_similarity(scaled_data[-1].reshape(1, -1), scaled_data[:-1])
-    
-    # Dapatkan indeks jurusan dengan similarity tertinggi
-    similar_indices = similarity[0].argsort()[::-1][:n]
-    
-    # Kembalikan jurusan yang direkomendasikan
-    return df.iloc[similar_indices]
-
-# Fungsi untuk visualisasi
-def create_histogram(df, column, title, color):
-    fig = px.histogram(df, x=column, title=title, color_discrete_sequence=[color])
-    fig.update_layout(
-        xaxis_title=column,
-        yaxis_title="Jumlah",
-        bargap=0.2,
-        showlegend=False,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
-
-def create_scatter(df, x, y, color, title):
-    fig = px.scatter(df, x=x, y=y, color=color, title=title,
-                    hover_data=['Nama Jurusan', 'Nama PTN', 'Fakultas'])
-    fig.update_layout(
-        xaxis_title=x,
-        yaxis_title=y,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
+        st.error("❌ File data tidak ditemukan. Harap pastikan file Dataset_Kelompok_10D.csv tersedia.")
+        st.stop()
 
-# Fungsi untuk membuat peta Indonesia dengan data jurusan
-def create_indonesia_map(df):
-    # Koordinat kota-kota di Indonesia
-    # Sumber: Google Maps atau sumber terbuka lainnya
-    kota_coords = {
-        'Jakarta': [-6.2088, 106.8456],
-        'Bandung': [-6.9175, 107.6191],
-        'Surabaya': [-7.2575, 112.7521],
-        'Yogyakarta': [-7.7971, 110.3688],
-        'Makassar': [-5.1477, 119.4327],
-        'Semarang': [-7.0051, 110.4381],
-        'Medan': [3.5896, 98.6739],
-        'Malang': [-7.9797, 112.6304],
-        'Padang': [-0.9198, 100.3531],
-        'Denpasar': [-8.6705, 115.2126],
-        'Aceh': [4.6951, 96.7494],
-        'Palembang': [-2.9761, 104.7754],
-        'Banjarmasin': [-3.3186, 114.5944],
-        'Manado': [1.4748, 124.8420],
-        'Lampung': [-5.4531, 105.2522],
-        'Jember': [-8.1690, 113.7007],
-        'Samarinda': [-0.5022, 117.1536],
-        'Purwokerto': [-7.4249, 109.2353],
-        'Solo': [-7.5695, 110.8274],
-        'Bogor': [-6.5971, 106.8060],
-        'Depok': [-6.4025, 106.7942],
-        'Mataram': [-8.5833, 116.1167],
-        'Pekanbaru': [0.5103, 101.4478],
-        'Pontianak': [-0.0263, 109.3425],
-        'Jayapura': [-2.5916, 140.6690],
-        'Kupang': [-10.1771, 123.6070],
-        'Ambon': [-3.6554, 128.1908],
-        'Gorontalo': [0.5387, 123.0622],
-        'Bengkulu': [-3.7928, 102.2608],
-        'Jambi': [-1.6101, 103.6131],
-        'Palangkaraya': [-2.2136, 113.9108],
-        'Kendari': [-3.9985, 122.5127],
-        'Palu': [-0.9003, 119.8779],
-        'Ternate': [0.7833, 127.3833],
-        'Sorong': [-0.8663, 131.2507]
-    }
-    
-    # Menghitung jumlah jurusan per lokasi
-    lokasi_counts = df['Lokasi'].value_counts().reset_index()
-    lokasi_counts.columns = ['Lokasi', 'Jumlah Jurusan']
-    
-    # Menambahkan rata-rata gaji per lokasi
-    lokasi_gaji = df.groupby('Lokasi')['Gaji Awal Max'].mean().reset_index()
-    lokasi_gaji.columns = ['Lokasi', 'Rata-rata Gaji Max']
-    
-    # Menggabungkan informasi
-    lokasi_info = pd.merge(lokasi_counts, lokasi_gaji, on='Lokasi')
-    
-    # Menambahkan koordinat ke dataframe
-    lokasi_info['lat'] = lokasi_info['Lokasi'].map(lambda x: kota_coords.get(x, [0, 0])[0])
-    lokasi_info['lon'] = lokasi_info['Lokasi'].map(lambda x: kota_coords.get(x, [0, 0])[1])
-    
-    # Hanya ambil data dengan koordinat valid
-    lokasi_info = lokasi_info[(lokasi_info['lat'] != 0) & (lokasi_info['lon'] != 0)]
-    
-    # Buat peta menggunakan px.scatter_mapbox
-    fig = px.scatter_mapbox(
-        lokasi_info,
-        lat='lat',
-        lon='lon',
-        color='Jumlah Jurusan',
-        size='Jumlah Jurusan',
-        hover_name='Lokasi',
-        hover_data=['Jumlah Jurusan', 'Rata-rata Gaji Max'],
-        color_continuous_scale='viridis',
-        size_max=25,
-        zoom=4,
-        title='🗺️ Distribusi Jurusan IPS di Indonesia',
-        center={"lat": -2.5, "lon": 118.0},  # Tengah Indonesia
-        mapbox_style="carto-darkmatter"  # Pilihan: "open-street-map", "carto-positron", "carto-darkmatter", "stamen-terrain", "stamen-toner", "stamen-watercolor"
-    )
-    
-    fig.update_layout(
-        height=600,
-        margin={"r": 0, "t": 30, "l": 0, "b": 0},
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    
-    return fig, lokasi_info
-
-def create_box_plot(df, y, title):
-    fig = px.box(df, y=y, title=title)
-    fig.update_layout(
-        yaxis_title=y,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
-
-def create_violin_plot(df, x, y, title):
-    fig = px.violin(df, x=x, y=y, box=True, title=title)
-    fig.update_layout(
-        xaxis_title=x,
-        yaxis_title=y,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
-
-def create_bubble_chart(df, x, y, size, color, title):
-    fig = px.scatter(
-        df, 
-        x=x, 
-        y=y, 
-        size=size, 
-        color=color,
-        hover_name='Nama Jurusan',
-        hover_data=['Nama PTN', 'Fakultas'],
-        title=title,
-        size_max=30
-    )
-    fig.update_layout(
-        xaxis_title=x,
-        yaxis_title=y,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
-
-def create_sunburst(df, title):
-    fig = px.sunburst(
-        df, 
-        path=['Fakultas', 'Tingkat Kesulitan', 'Tingkat Persaingan Kerja'],
-        values='Peminat 2024',
-        color='Kebutuhan Industri',
-        title=title,
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
-    fig.update_layout(
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white")
-    )
-    return fig
+# Thread pool bersama untuk membangun figure plotly secara paralel
+@st.cache_resource
+def get_chart_executor():
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="chart")
 
-def create_ridgeline_plot(df, selected_columns, title):
-    fig = go.Figure()
-    
-    y_offset = 0
-    for column in selected_columns:
-        kde = sns.kdeplot(df[column], bw_adjust=0.5).get_lines()[0].get_data()
-        x_kde, y_kde = kde
-        
-        # Normalisasi KDE untuk skala yang sama
-        y_kde = y_kde / np.max(y_kde) * 0.9 + y_offset
-        
-        # Tambahkan outline untuk KDE
-        fig.add_trace(go.Scatter(
-            x=x_kde, 
-            y=y_kde,
-            mode='lines',
-            line=dict(color='rgba(255, 255, 255, 0.8)', width=2),
-            name=column
-        ))
-        
-        # Tambahkan area di bawah KDE
-        fig.add_trace(go.Scatter(
-            x=np.concatenate([x_kde, [x_kde[-1], x_kde[0]]]),
-            y=np.concatenate([y_kde, [y_offset, y_offset]]),
-            fill='toself',
-            mode='none',
-            name=column,
-            showlegend=False,
-            fillcolor='rgba(74, 111, 227, 0.5)'
-        ))
-        
-        y_offset += 1
-    
-    # Tambahkan label teks
-    for i, column in enumerate(selected_columns):
-        fig.add_annotation(
-            x=df[column].min(), 
-            y=i + 0.45, 
-            text=column,
-            showarrow=False,
-            font=dict(color="white", size=14)
-        )
-    
-    fig.update_layout(
-        title=title,
-        showlegend=False,
-        plot_bgcolor='rgba(30, 30, 30, 0.8)',
-        paper_bgcolor='rgba(30, 30, 30, 0.8)',
-        font=dict(color="white"),
-        height=600,
-        xaxis=dict(
-            showgrid=False,
-            title="Nilai",
-            color="white"
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            showgrid=False,
-            zeroline=False,
-            color="white"
-        )
-    )
-    
-    return fig
+# Builder grafik dan rekomendasi dibungkus profiler agar waktunya tercatat saat mode profiling aktif
+get_recommendations = profiler.profile(recommender.get_recommendations)
+create_histogram = profiler.profile(charts.create_histogram)
+create_scatter = profiler.profile(charts.create_scatter)
+create_indonesia_map = profiler.profile(charts.create_indonesia_map)
+create_box_plot = profiler.profile(charts.create_box_plot)
+create_violin_plot = profiler.profile(charts.create_violin_plot)
+create_bubble_chart = profiler.profile(charts.create_bubble_chart)
+create_sunburst = profiler.profile(charts.create_sunburst)
+create_ridgeline_plot = profiler.profile(charts.create_ridgeline_plot)
+create_correlation_heatmap = profiler.profile(charts.create_correlation_heatmap)
+create_top_bar = profiler.profile(charts.create_top_bar)
+rank_jurusan = profiler.profile(ranking.rank)
 
 # Memuat CSS
-load_css()
+with profiler.section("load_css"):
+    static_assets = get_static_assets()
+    st.markdown(static_assets.stylesheet(), unsafe_allow_html=True)
 
-# Memuat data
-df = load_data()
+# Memuat data (salinan dangkal agar kolom tambahan halaman tidak mengubah artefak bersama)
+with profiler.section("load_data"):
+    artifacts = load_artifacts()
+    df = artifacts.df.copy(deep=False)
 
 # Menambahkan sidebar
-st.sidebar.image("image1.webp", use_container_width=True)
+with profiler.section("sidebar_image"):
+    st.logo(static_assets.image('logo'))
+    st.sidebar.image(static_assets.image('sidebar'), use_container_width=True)
 st.sidebar.title("📋 Navigasi")
 
 # Menu navigasi
@@ -467,9 +100,11 @@ st.sidebar.markdown("""
 """, unsafe_allow_html=True)
 
 # Konten berdasarkan menu
+profiler.start(menu)
+
 if menu == "🏠 Beranda":
     # Placeholder untuk gambar landscape di atas
-    st.image("image2.webp", use_container_width=True)
+    st.image(static_assets.image('banner'), use_container_width=True)
     
     # Judul Aplikasi
     st.markdown("<h1 style='text-align: center;'>🎓 Insight 4: Jurusan IPS di Perguruan Tinggi Negeri di Indonesia</h1>", unsafe_allow_html=True)
@@ -547,7 +182,7 @@ if menu == "🏠 Beranda":
             paper_bgcolor='rgba(30, 30, 30, 0.8)',
             font=dict(color="white")
         )
-        st.plotly_chart(fig_kesulitan, use_container_width=True)
+        profiler.plotly_chart(fig_kesulitan, use_container_width=True)
     
     with col2:
         # Distribusi Kebutuhan Industri
@@ -568,12 +203,12 @@ if menu == "🏠 Beranda":
             paper_bgcolor='rgba(30, 30, 30, 0.8)',
             font=dict(color="white")
         )
-        st.plotly_chart(fig_kebutuhan, use_container_width=True)
+        profiler.plotly_chart(fig_kebutuhan, use_container_width=True)
     
     # Sunburst chart untuk hubungan fakultas-tingkat kesulitan-persaingan
     st.markdown("<br>", unsafe_allow_html=True)
-    fig_sunburst = create_sunburst(df, "🧩 Hierarki Jurusan berdasarkan Fakultas, Tingkat Kesulitan, dan Persaingan Kerja")
-    st.plotly_chart(fig_sunburst, use_container_width=True)
+    fig_sunburst = artifacts.figure(create_sunburst, df, SUNBURST_TITLE)
+    profiler.plotly_chart(fig_sunburst, use_container_width=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -601,11 +236,14 @@ if menu == "🏠 Beranda":
         xaxis=dict(title='Jumlah Peminat 2024', color="white"),
         yaxis=dict(title='Gaji Awal Maksimum (Rp)', color="white")
     )
-    st.plotly_chart(fig_scatter, use_container_width=True)
+    profiler.plotly_chart(fig_scatter, use_container_width=True)
 
 elif menu == "📊 Visualisasi Data":
     st.markdown("## 📊 Visualisasi Data")
     
+    # Grafik dibangun paralel; setiap grafik tampil di placeholder-nya begitu selesai
+    chart_pool = ChartPool(get_chart_executor(), lambda fig: profiler.plotly_chart(fig, use_container_width=True))
+    
     # Tab untuk visualisasi yang berbeda
     tabs = st.tabs(["📈 Persebaran Data", "🔄 Hubungan Antar Variabel", "🗺️ Distribusi Geografis", "🏆 Top Jurusan"])
     
@@ -642,23 +280,19 @@ elif menu == "📊 Visualisasi Data":
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = create_histogram(df, selected_metric1, f"Distribusi {selected_metric1}", "#1f77b4")
-            st.plotly_chart(fig, use_container_width=True)
+            chart_pool.submit(artifacts.figure, create_histogram, df, selected_metric1, f"Distribusi {selected_metric1}", "#1f77b4")
             
         with col2:
-            fig = create_histogram(df, selected_metric2, f"Distribusi {selected_metric2}", "#ff7f0e")
-            st.plotly_chart(fig, use_container_width=True)
+            chart_pool.submit(artifacts.figure, create_histogram, df, selected_metric2, f"Distribusi {selected_metric2}", "#ff7f0e")
         
         # Box plot untuk melihat outlier
         col1, col2 = st.columns(2)
         
         with col1:
-            fig = create_box_plot(df, selected_metric1, f"Box Plot {selected_metric1}")
-            st.plotly_chart(fig, use_container_width=True)
+            chart_pool.submit(artifacts.figure, create_box_plot, df, selected_metric1, f"Box Plot {selected_metric1}")
             
         with col2:
-            fig = create_box_plot(df, selected_metric2, f"Box Plot {selected_metric2}")
-            st.plotly_chart(fig, use_container_width=True)
+            chart_pool.submit(artifacts.figure, create_box_plot, df, selected_metric2, f"Box Plot {selected_metric2}")
             
         # Analisis/Storytelling untuk Persebaran Data
         st.markdown("### 📝 Analisis Persebaran Data")
@@ -710,25 +344,19 @@ elif menu == "📊 Visualisasi Data":
         
         st.markdown("<br>", unsafe_allow_html=True)
         
-        fig = create_scatter(df, x_var, y_var, color_var, f"Hubungan antara {x_var} dan {y_var}")
-        st.plotly_chart(fig, use_container_width=True)
+        chart_pool.submit(artifacts.figure, create_scatter, df, x_var, y_var, color_var, f"Hubungan antara {x_var} dan {y_var}")
         
-        # Heatmap korelasi
-        numeric_cols = ['Peminat 2024', 'Daya Tampung SNBP 2025', 'Daya Tampung SNBT 2025', 
-                         'Rasio Keketatan', 'Lama Studi Rata-rata (Bulan)', 'Tingkat Kelulusan (%)',
-                         'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
+        # Heatmap korelasi dari statistik streaming yang sudah dihitung di artefak
+        correlation_options = {"Pearson": 'pearson', "Spearman (perkiraan berbasis rank)": 'spearman'}
+        correlation_choice = st.radio("Metode Korelasi:", list(correlation_options), horizontal=True)
+        correlation_method = correlation_options[correlation_choice]
+        corr, column_summary = artifacts.correlations[correlation_method]
         
-        corr = df[numeric_cols].corr()
+        chart_pool.submit(create_correlation_heatmap, df, CORRELATION_COLUMNS, correlation_method, corr)
         
-        fig = px.imshow(
-            corr, 
-            text_auto=True, 
-            aspect="auto",
-            color_continuous_scale='RdBu_r',
-            title="Matriks Korelasi Antar Variabel Numerik"
-        )
-        fig.update_layout(height=600)
-        st.plotly_chart(fig, use_container_width=True)
+        with st.expander("📐 Rata-rata dan Variansi per Variabel"):
+            st.dataframe(column_summary.style.format({'Rata-rata': '{:,.2f}', 'Variansi': '{:,.2f}'}),
+                         use_container_width=True)
         
         # Analisis/Storytelling untuk Hubungan Antar Variabel
         st.markdown("### 📝 Analisis Hubungan Antar Variabel")
@@ -772,98 +400,21 @@ elif menu == "📊 Visualisasi Data":
         peluang pendidikan tinggi IPS di Indonesia.
         """)
         
-        # Koordinat kota-kota di Indonesia
-        kota_coords = {
-            'Jakarta': [-6.2088, 106.8456],
-            'Bandung': [-6.9175, 107.6191],
-            'Surabaya': [-7.2575, 112.7521],
-            'Yogyakarta': [-7.7971, 110.3688],
-            'Makassar': [-5.1477, 119.4327],
-            'Semarang': [-7.0051, 110.4381],
-            'Medan': [3.5896, 98.6739],
-            'Malang': [-7.9797, 112.6304],
-            'Padang': [-0.9198, 100.3531],
-            'Denpasar': [-8.6705, 115.2126],
-            'Aceh': [4.6951, 96.7494],
-            'Palembang': [-2.9761, 104.7754],
-            'Banjarmasin': [-3.3186, 114.5944],
-            'Manado': [1.4748, 124.8420],
-            'Lampung': [-5.4531, 105.2522],
-            'Jember': [-8.1690, 113.7007],
-            'Samarinda': [-0.5022, 117.1536],
-            'Purwokerto': [-7.4249, 109.2353],
-            'Solo': [-7.5695, 110.8274],
-            'Bogor': [-6.5971, 106.8060],
-            'Depok': [-6.4025, 106.7942],
-            'Mataram': [-8.5833, 116.1167],
-            'Pekanbaru': [0.5103, 101.4478],
-            'Pontianak': [-0.0263, 109.3425],
-            'Jayapura': [-2.5916, 140.6690],
-            'Kupang': [-10.1771, 123.6070],
-            'Ambon': [-3.6554, 128.1908],
-            'Gorontalo': [0.5387, 123.0622],
-            'Bengkulu': [-3.7928, 102.2608],
-            'Jambi': [-1.6101, 103.6131],
-            'Palangkaraya': [-2.2136, 113.9108],
-            'Kendari': [-3.9985, 122.5127],
-            'Palu': [-0.9003, 119.8779],
-            'Ternate': [0.7833, 127.3833],
-            'Sorong': [-0.8663, 131.2507]
-        }
+        # Tingkat wilayah: ringkasan dibaca dari kubus rollup (kota -> provinsi -> pulau) di artefak
+        geo_level = st.radio("Tingkat Wilayah:", GEO_LEVELS, horizontal=True)
+        lokasi_info = artifacts.geo_cube.level(geo_level)
         
         try:
-            # Menghitung jumlah jurusan per lokasi
-            lokasi_counts = df['Lokasi'].value_counts().reset_index()
-            lokasi_counts.columns = ['Lokasi', 'Jumlah Jurusan']
-            
-            # Menambahkan rata-rata gaji per lokasi
-            lokasi_gaji = df.groupby('Lokasi')['Gaji Awal Max'].mean().reset_index()
-            lokasi_gaji.columns = ['Lokasi', 'Rata-rata Gaji Max']
-            
-            # Menggabungkan informasi
-            lokasi_info = pd.merge(lokasi_counts, lokasi_gaji, on='Lokasi')
-            
-            # Menambahkan koordinat ke dataframe
-            lokasi_info['lat'] = lokasi_info['Lokasi'].map(lambda x: kota_coords.get(x, [0, 0])[0])
-            lokasi_info['lon'] = lokasi_info['Lokasi'].map(lambda x: kota_coords.get(x, [0, 0])[1])
-            
-            # Hanya ambil data dengan koordinat valid
-            lokasi_info = lokasi_info[(lokasi_info['lat'] != 0) & (lokasi_info['lon'] != 0)]
-            
-            # Buat peta menggunakan px.scatter_mapbox
-            fig = px.scatter_mapbox(
-                lokasi_info,
-                lat='lat',
-                lon='lon',
-                color='Jumlah Jurusan',
-                size='Jumlah Jurusan',
-                hover_name='Lokasi',
-                hover_data=['Jumlah Jurusan', 'Rata-rata Gaji Max'],
-                color_continuous_scale='viridis',
-                size_max=25,
-                zoom=4,
-                title='🗺️ Distribusi Jurusan IPS di Indonesia',
-                center={"lat": -2.5, "lon": 118.0},  # Tengah Indonesia
-                mapbox_style="carto-darkmatter"  # Pilihan: "open-street-map", "carto-positron", "carto-darkmatter", "stamen-terrain", "stamen-toner", "stamen-watercolor"
-            )
-            
-            fig.update_layout(
-                height=600,
-                margin={"r": 0, "t": 30, "l": 0, "b": 0},
-                plot_bgcolor='rgba(30, 30, 30, 0.8)',
-                paper_bgcolor='rgba(30, 30, 30, 0.8)',
-                font=dict(color="white")
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            fig, _ = create_indonesia_map(df, geo_level, cube=artifacts.geo_cube)
+            profiler.plotly_chart(fig, use_container_width=True)
             
-            st.markdown("""
+            st.markdown(f"""
             #### 🗺️ Tentang Visualisasi Geografis
             
-            Peta di atas menunjukkan distribusi jurusan IPS di berbagai kota di Indonesia. 
-            - Ukuran lingkaran menunjukkan jumlah jurusan di lokasi tersebut
+            Peta di atas menunjukkan distribusi jurusan IPS per {geo_level.lower()} di Indonesia. 
+            - Ukuran lingkaran menunjukkan jumlah jurusan di wilayah tersebut
             - Warna menunjukkan jumlah jurusan (dari rendah ke tinggi)
-            - Hover untuk melihat detail jumlah jurusan dan rata-rata gaji maksimum di lokasi tersebut
+            - Hover untuk melihat rata-rata gaji maksimum, peminat, dan rasio keketatan di wilayah tersebut
             
             Visualisasi ini membantu melihat konsentrasi jurusan IPS di berbagai wilayah Indonesia.
             """)
@@ -872,19 +423,27 @@ elif menu == "📊 Visualisasi Data":
             st.error(f"❌ Error dalam membuat peta: {e}")
             
             # Fallback untuk visualisasi geografis
-            lokasi_counts = df['Lokasi'].value_counts().reset_index()
-            lokasi_counts.columns = ['Lokasi', 'Jumlah Jurusan']
-            
             fig = px.bar(
-                lokasi_counts.head(15), 
-                x='Lokasi', 
+                lokasi_info.head(15), 
+                x=geo_level, 
                 y='Jumlah Jurusan',
-                title='📍 15 Lokasi Teratas berdasarkan Jumlah Jurusan',
+                title=f'📍 15 {geo_level} Teratas berdasarkan Jumlah Jurusan',
                 color='Jumlah Jurusan',
                 color_continuous_scale='Viridis'
             )
             fig.update_layout(xaxis_tickangle=-45)
-            st.plotly_chart(fig, use_container_width=True)
+            profiler.plotly_chart(fig, use_container_width=True)
+        
+        # Ringkasan wilayah dari kubus
+        st.dataframe(
+            lokasi_info.drop(columns=['lat', 'lon']).style.format({
+                'Rata-rata Gaji Max': 'Rp {:,.0f}',
+                'Rata-rata Peminat': '{:,.0f}',
+                'Rata-rata Rasio Keketatan': '{:.2f}',
+            }),
+            use_container_width=True,
+            hide_index=True
+        )
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -900,7 +459,7 @@ elif menu == "📊 Visualisasi Data":
             color='Jumlah Jurusan',
             color_continuous_scale='Viridis'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        profiler.plotly_chart(fig, use_container_width=True)
         
         # Analisis/Storytelling untuk Distribusi Geografis
         st.markdown("### 📝 Analisis Distribusi Geografis")
@@ -958,23 +517,18 @@ elif menu == "📊 Visualisasi Data":
         
         st.markdown("<br>", unsafe_allow_html=True)
         
-        # Mengurutkan dan mengambil top-n jurusan
-        if asc_order:
-            top_jurusan = df.sort_values(by=sort_metric).head(top_n)
-        else:
-            top_jurusan = df.sort_values(by=sort_metric, ascending=False).head(top_n)
+        # Mengambil top-n jurusan dari permutasi terurut yang dihitung sekali per versi dataset;
+        # metrik di luar indeks memakai seleksi top-k
+        with profiler.section("top_jurusan: index"):
+            table_index = artifacts.table_index
+            if sort_metric in table_index.sort_columns:
+                top_rows = table_index.top(sort_metric, top_n, ascending=asc_order)
+            else:
+                top_rows = top_k(df[sort_metric].to_numpy(), top_n, ascending=asc_order)
+            top_jurusan = df.iloc[top_rows]
         
         # Visualisasi bar chart
-        fig = px.bar(
-            top_jurusan,
-            x='Nama Jurusan',
-            y=sort_metric,
-            color='Nama PTN',
-            hover_data=['Fakultas', 'Lokasi', 'Akreditasi'],
-            title=f"Top {top_n} Jurusan berdasarkan {sort_metric}"
-        )
-        fig.update_layout(xaxis_tickangle=-45)
-        st.plotly_chart(fig, use_container_width=True)
+        chart_pool.submit(create_top_bar, top_jurusan, sort_metric, top_n)
         
         # Tampilkan tabel
         st.write("Detail Top Jurusan:")
@@ -1018,6 +572,10 @@ elif menu == "📊 Visualisasi Data":
            Beberapa jurusan yang tidak masuk dalam daftar teratas dari metrik populer mungkin masih menawarkan keseimbangan 
            yang lebih baik antara prospek karir, kemudahan masuk, dan kualitas pendidikan.
         """)
+    
+    # Mengisi placeholder grafik semua tab sesuai urutan selesai dibangun
+    with profiler.section("chart_pool: wait"):
+        chart_pool.wait()
 
 elif menu == "🧩 Analisis Cluster":
     st.markdown("## 🧩 Analisis Cluster")
@@ -1050,27 +608,30 @@ elif menu == "🧩 Analisis Cluster":
     
     try:
         # Memuat model
-        models = load_models()
+        # Model dan hasil prediksi cluster berasal dari artefak versi terakhir
+        models = artifacts.models
+        if models is None:
+            st.warning("⚠️ Model belum tersedia. Jalankan script train_models.py terlebih dahulu untuk melatih model.")
+            raise FileNotFoundError("model clustering tidak ditemukan di direktori models/")
         
         # Membuat fitur untuk clustering
-        features = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)', 
-                    'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
-        
-        X = df[features].copy()
+        features = CLUSTER_FEATURES
         
-        # Transformasi data
-        X_scaled = models['scaler'].transform(X)
+        # Jumlah cluster: model utama atau keluarga model k=2..10 yang sudah dilatih dan disimpan artefak
+        k_values = sorted(artifacts.cluster_views)
+        if len(k_values) > 1:
+            n_clusters = st.select_slider("🔢 Jumlah Cluster (k):", options=k_values, value=artifacts.default_k,
+                                          help="Setiap nilai k sudah dilatih saat training; mengganti k tidak melatih ulang model.")
+        else:
+            n_clusters = artifacts.default_k
+        cluster_view = artifacts.cluster_views[n_clusters]
         
-        # Prediksi cluster
-        df['Cluster'] = models['kmeans'].predict(X_scaled)
+        # Label cluster dan proyeksi PCA sudah dihitung saat artefak dibangun
+        cluster_labels, X_pca = cluster_view.labels, artifacts.X_pca
+        df['Cluster'] = cluster_labels
         
         # Mapping nama cluster yang lebih informatif
-        cluster_names = {
-            0: "🟢 Sepi Peminat, Prospek Bagus",
-            1: "🟡 Sepi Peminat, Prospek Sedang",
-            2: "🔵 Banyak Peminat, Prospek Bagus",
-            3: "🟠 Banyak Peminat, Prospek Sedang"
-        }
+        cluster_names = cluster_view.names
         
         # Tambahkan nama cluster
         df['Nama Cluster'] = df['Cluster'].map(lambda x: cluster_names.get(x, f"Cluster {x}"))
@@ -1094,7 +655,7 @@ elif menu == "🧩 Analisis Cluster":
             xaxis=dict(title="Cluster", color="white"),
             yaxis=dict(title="Jumlah Jurusan", color="white")
         )
-        st.plotly_chart(fig, use_container_width=True)
+        profiler.plotly_chart(fig, use_container_width=True)
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -1102,8 +663,6 @@ elif menu == "🧩 Analisis Cluster":
         col1, col2 = st.columns(2)
         
         with col1:
-            X_pca = models['pca'].transform(X_scaled)
-            
             pca_df = pd.DataFrame(
                 data=X_pca, 
                 columns=['PC1', 'PC2']
@@ -1133,7 +692,7 @@ elif menu == "🧩 Analisis Cluster":
                 xaxis=dict(title="PC1", color="white"),
                 yaxis=dict(title="PC2", color="white")
             )
-            st.plotly_chart(fig, use_container_width=True)
+            profiler.plotly_chart(fig, use_container_width=True)
             
             st.markdown("""
             ##### 🔍 Cara Membaca PCA Plot
@@ -1163,7 +722,7 @@ elif menu == "🧩 Analisis Cluster":
                 xaxis=dict(title="Peminat 2024", color="white"),
                 yaxis=dict(title="Gaji Awal Max", color="white")
             )
-            st.plotly_chart(fig, use_container_width=True)
+            profiler.plotly_chart(fig, use_container_width=True)
             
             st.markdown("""
             ##### 💰 Cara Membaca Scatter Plot Cluster
@@ -1179,8 +738,8 @@ elif menu == "🧩 Analisis Cluster":
         # Analisis karakteristik cluster
         st.markdown("<h3 style='text-align: center;'>📊 Karakteristik Setiap Cluster</h3>", unsafe_allow_html=True)
         
-        # Mendapatkan rata-rata fitur per cluster
-        cluster_means = df.groupby('Nama Cluster')[features].mean().reset_index()
+        # Rata-rata fitur per cluster sudah dihitung di artefak
+        cluster_means = cluster_view.means
         
         # Membuat radar chart untuk setiap cluster
         fig = go.Figure()
@@ -1228,7 +787,7 @@ elif menu == "🧩 Analisis Cluster":
             paper_bgcolor='rgba(30, 30, 30, 0.8)',
             font=dict(color="white")
         )
-        st.plotly_chart(fig, use_container_width=True)
+        profiler.plotly_chart(fig, use_container_width=True)
         
         st.markdown("""
         ##### 📊 Interpretasi Radar Chart
@@ -1248,18 +807,46 @@ elif menu == "🧩 Analisis Cluster":
         # Tabel karakteristik cluster
         st.write("📋 Nilai Rata-Rata Fitur per Cluster:")
         st.dataframe(cluster_means, use_container_width=True)
-        
+
+        # Stabilitas cluster dari analisis bootstrap stability.py (hanya untuk model utama)
+        stability = artifacts.cluster_stability
+        if stability is not None and n_clusters == stability.k:
+            with st.expander("🎯 Stabilitas Cluster dan Interval Kepercayaan (Bootstrap)"):
+                mean_ari, low_ari, high_ari = stability.ari_summary()
+                col1, col2, col3 = st.columns(3)
+                col1.metric("🔁 Sampel Bootstrap", f"{stability.n_bootstrap:,}")
+                col2.metric("📏 Adjusted Rand Index", f"{mean_ari:.3f}",
+                            help="Kesamaan label cluster model bootstrap dengan model utama (1 = identik, 0 = acak).")
+                col3.metric("✅ Keyakinan Rata-rata", f"{stability.confidence.mean():.0%}")
+                st.caption(f"Interval 95% Adjusted Rand Index antar sampel: {low_ari:.3f} - {high_ari:.3f}")
+
+                st.write("📋 Rata-rata Fitur per Cluster dengan Interval Kepercayaan 95%:")
+                st.dataframe(stability.mean_table().round(2), use_container_width=True)
+
+                st.write("✅ Keyakinan Cluster (proporsi sampel bootstrap dengan cluster yang sama):")
+                st.dataframe(stability.cluster_confidence(cluster_labels).round(3), use_container_width=True)
+
+                st.write("⚠️ Jurusan dengan Keyakinan Cluster Terendah:")
+                lowest = np.argsort(stability.confidence, kind='stable')[:10]
+                lowest_table = df.iloc[lowest][['Nama Jurusan', 'Nama PTN']].copy()
+                lowest_table['Nama Cluster'] = [cluster_view.names.get(c, f"Cluster {c}") for c in cluster_labels[lowest]]
+                lowest_table['Keyakinan Cluster (%)'] = (stability.confidence[lowest] * 100).round(1)
+                st.dataframe(lowest_table.reset_index(drop=True), use_container_width=True)
+        elif stability is not None:
+            st.caption(f"Analisis stabilitas bootstrap tersedia untuk k = {stability.k}.")
+
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Analisis cluster berdasarkan variabel kategorikal
         st.markdown("<h3 style='text-align: center;'>📊 Distribusi Variabel Kategorikal dalam Cluster</h3>", unsafe_allow_html=True)
         
-        categorical_vars = ['Tingkat Kesulitan', 'Tingkat Persaingan Kerja', 'Kebutuhan Industri', 'Akreditasi']
+        categorical_vars = CATEGORICAL_COLUMNS
         selected_cat = st.selectbox("🔍 Pilih Variabel Kategorikal:", categorical_vars)
         
-        # Buat crosstab
-        cross_tab = pd.crosstab(df['Nama Cluster'], df[selected_cat])
-        cross_tab_norm = cross_tab.div(cross_tab.sum(axis=1), axis=0)
+        # Ambil tabel silang dari kubus kontingensi (dibangun sekali per versi dataset & model)
+        with profiler.section("contingency_cube"):
+            cube = cluster_view.cube
+            cross_tab_norm = cube.table(selected_cat, normalize=True)
         
         # Visualisasi heatmap
         fig = px.imshow(
@@ -1274,7 +861,7 @@ elif menu == "🧩 Analisis Cluster":
             paper_bgcolor='rgba(30, 30, 30, 0.8)',
             font=dict(color="white")
         )
-        st.plotly_chart(fig, use_container_width=True)
+        profiler.plotly_chart(fig, use_container_width=True)
         
         st.markdown(f"""
         ##### 📊 Interpretasi Distribusi {selected_cat}
@@ -1285,22 +872,71 @@ elif menu == "🧩 Analisis Cluster":
         
         Ini membantu memahami karakteristik dominan setiap cluster dari segi {selected_cat}.
         """)
-        
+
+        # Drilldown dua arah dari kubus kontingensi, misalnya Lokasi x Fakultas dalam satu cluster
+        with st.expander("🔎 Drilldown Dua Arah per Cluster"):
+            drill_vars = DRILLDOWN_COLUMNS + CATEGORICAL_COLUMNS
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                drill_row = st.selectbox("Variabel Baris:", drill_vars, index=0)
+
+            with col2:
+                drill_col = st.selectbox("Variabel Kolom:", [v for v in drill_vars if v != drill_row], index=0)
+
+            with col3:
+                drill_cluster = st.selectbox("Cluster:", ["Semua Cluster"] + cube.cluster_names)
+
+            cluster_id = None if drill_cluster == "Semua Cluster" else cube.cluster_names.index(drill_cluster)
+            with profiler.section("contingency_cube: drilldown"):
+                drill_table = cube.drilldown(drill_row, drill_col, cluster=cluster_id)
+
+            if drill_table.empty:
+                st.info("Tidak ada jurusan untuk kombinasi ini.")
+            else:
+                fig = px.imshow(
+                    drill_table,
+                    text_auto=True,
+                    aspect="auto",
+                    color_continuous_scale='Blues',
+                    title=f"📊 Jumlah Jurusan: {drill_row} × {drill_col} ({drill_cluster})"
+                )
+                fig.update_layout(
+                    height=max(400, 22 * len(drill_table)),
+                    plot_bgcolor='rgba(30, 30, 30, 0.8)',
+                    paper_bgcolor='rgba(30, 30, 30, 0.8)',
+                    font=dict(color="white")
+                )
+                profiler.plotly_chart(fig, use_container_width=True)
+
         st.markdown("<br>", unsafe_allow_html=True)
         
         # Tabel jurusan per cluster
         st.markdown("<h3 style='text-align: center;'>📋 Daftar Jurusan dalam Cluster</h3>", unsafe_allow_html=True)
         
-        selected_cluster = st.selectbox("🔍 Pilih Cluster:", sorted(df['Nama Cluster'].unique()))
-        
-        cluster_jurusan = df[df['Nama Cluster'] == selected_cluster]
-        st.write(f"Jumlah jurusan dalam {selected_cluster}: {len(cluster_jurusan)}")
+        # Pilihan cluster (urut abjad) sesuai kode grup pada indeks tabel per cluster
+        cluster_options = list(cluster_view.options)
+        selected_cluster = st.selectbox("🔍 Pilih Cluster:", cluster_options)
+        selected_code = cluster_options.index(selected_cluster)
+        table_index = cluster_view.table_index
+        st.write(f"Jumlah jurusan dalam {selected_cluster}: {table_index.count(group=selected_code)}")
         
         columns_to_show = ['Nama Jurusan', 'Nama PTN', 'Fakultas', 'Peminat 2024', 
                            'Gaji Awal Min', 'Gaji Awal Max', 'Tingkat Kelulusan (%)',
                            'Tingkat Kesulitan', 'Tingkat Persaingan Kerja']
         
-        st.dataframe(cluster_jurusan[columns_to_show], use_container_width=True)
+        paginated_table(df, table_index, columns_to_show, key="cluster_table",
+                        group=selected_code, default_sort='Gaji Awal Max')
+        
+        # Jurusan serupa (lintas cluster) untuk satu jurusan di cluster terpilih, dari graf kNN artefak
+        with st.expander("🧬 Jurusan Serupa"):
+            member_rows = np.flatnonzero(cluster_view.codes == selected_code)
+            member_labels = (df['Nama Jurusan'].iloc[member_rows] + " - " + df['Nama PTN'].iloc[member_rows]).tolist()
+            selected_member = st.selectbox("Pilih Jurusan:", range(len(member_rows)),
+                                           format_func=lambda i: member_labels[i], key="similar_member")
+            with profiler.section("neighbor_graph"):
+                similar = similar_programs(df, artifacts.neighbor_graph, member_rows[selected_member])
+            st.dataframe(similar, use_container_width=True, hide_index=True)
         
         st.markdown(f"""
         ##### 💡 Rekomendasi untuk Cluster {selected_cluster}
@@ -1347,6 +983,23 @@ elif menu == "🔍 Sistem Rekomendasi":
     
     st.markdown("<br>", unsafe_allow_html=True)
     
+    # Pencarian teks lintas Nama Jurusan, Prospek Kerja dan Keterampilan Utama (indeks terbalik)
+    st.markdown("### 🔎 Cari Jurusan, Prospek Kerja, atau Keterampilan")
+    kata_kunci = st.text_input("Kata kunci:", placeholder="Contoh: data, konsultan, hukum")
+    if kata_kunci.strip():
+        with profiler.section("text_search"):
+            rows, scores, n_matches = artifacts.text_index.search(kata_kunci, limit=20)
+        if n_matches:
+            st.caption(f"Menampilkan {len(rows)} dari {n_matches:,} jurusan yang cocok dengan \"{kata_kunci}\".")
+            hasil_cari = df.iloc[rows][['Nama Jurusan', 'Nama PTN', 'Lokasi', 'Prospek Kerja Utama',
+                                        'Prospek Kerja Alternatif', 'Keterampilan Utama']].copy()
+            hasil_cari['Relevansi'] = scores.round(2)
+            st.dataframe(hasil_cari, use_container_width=True, hide_index=True)
+        else:
+            st.info("Tidak ada jurusan yang cocok dengan kata kunci tersebut.")
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
     st.markdown("### ⚙️ Masukkan Preferensi Anda")
     
     col1, col2 = st.columns(2)
@@ -1419,6 +1072,53 @@ elif menu == "🔍 Sistem Rekomendasi":
         'Gaji Awal Max': gaji_max
     }
     
+    # Batasan wajib: slider tidak hanya menjadi target similarity, tetapi juga menyaring jurusan
+    batasan_wajib = st.checkbox(
+        "🔒 Jadikan preferensi sebagai batasan wajib",
+        help="Hanya jurusan dengan kelulusan ≥ minimal, waktu tunggu ≤ maksimum, gaji awal min ≥ pilihan "
+             "dan rasio keketatan ≤ maksimal yang dipertimbangkan."
+    )
+    constraints = {
+        'Tingkat Kelulusan (%)': (tingkat_kelulusan, None),
+        'Maks. Waktu Tunggu Kerja (Bulan)': (None, waktu_tunggu),
+        'Gaji Awal Min': (gaji_min, None),
+        'Rasio Keketatan': (None, keketatan),
+    } if batasan_wajib else None
+    
+    # Rentang gaji target dari dua slider gaji di atas
+    salary_options = {
+        "Tidak difilter": None,
+        "Beririsan dengan rentang gaji saya": 'overlap',
+        "Mencakup seluruh rentang gaji saya": 'contains',
+        "Berada di dalam rentang gaji saya": 'within',
+    }
+    salary_choice = st.selectbox(
+        "💰 Filter Rentang Gaji Awal:",
+        list(salary_options),
+        help="Membandingkan rentang [Gaji Awal Min, Gaji Awal Max] tiap jurusan dengan rentang gaji pilihan Anda."
+    )
+    salary_mode = salary_options[salary_choice]
+    salary_range = (min(gaji_min, gaji_max), max(gaji_min, gaji_max)) if salary_mode else None
+    
+    # Peluang masuk dari kurva Monte Carlo artefak untuk persentil nilai pengguna
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        persentil_nilai = st.slider(
+            "📝 Perkiraan Persentil Nilai Anda:", 1, 99, 70,
+            help="Posisi nilai Anda di antara seluruh peserta (mis. 70 = lebih tinggi dari 70% peserta). "
+                 "Dipakai untuk memperkirakan peluang masuk lewat jalur SNBP dan SNBT."
+        )
+    
+    with col2:
+        utamakan_peluang = st.checkbox(
+            "🎯 Utamakan jurusan dengan peluang masuk tinggi",
+            help="Urutan rekomendasi memakai kecocokan preferensi dikali peluang masuk."
+        )
+    
+    with profiler.section("admission_chance"):
+        peluang_masuk = pd.Series(artifacts.admission.chance(persentil_nilai), index=df.index)
+    
     # Filter dataset
     filtered_df = df.copy()
     
@@ -1428,23 +1128,87 @@ elif menu == "🔍 Sistem Rekomendasi":
     if selected_difficulty:
         filtered_df = filtered_df[filtered_df['Tingkat Kesulitan'].isin(selected_difficulty)]
     
+    # Indeks rentang dan interval artefak hanya berlaku untuk katalog lengkap (tanpa filter lokasi/kesulitan)
+    full_catalog = len(filtered_df) == len(df)
+    if constraints or salary_range:
+        with profiler.section("range_filter"):
+            filtered_df = recommender.apply_constraints(
+                filtered_df, constraints, artifacts.range_index if full_catalog else None,
+                salary_range, salary_mode or 'overlap', artifacts.salary_index if full_catalog else None
+            )
+        st.caption(f"🔒 {len(filtered_df):,} jurusan memenuhi batasan wajib dan filter rentang gaji.")
+    
+    # Pencarian geografis dari kota asal: filter radius dan kampus terdekat (BallTree haversine)
+    campus_index = artifacts.campus_index
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        kota_asal = st.selectbox("🏠 Kota Asal:", ["Tidak ditentukan"] + sorted(KOTA_COORDS))
+    
+    with col2:
+        radius_km = st.slider("📏 Radius dari Kota Asal (km):", 50, 3000, 500, step=50,
+                              disabled=kota_asal == "Tidak ditentukan")
+    
+    asal = campus_index.location(kota_asal)
+    if asal is not None:
+        # Posisi baris hasil filter di katalog lengkap, sebagai mask untuk query indeks
+        allowed = np.zeros(len(df), dtype=bool)
+        allowed[df.index.get_indexer(filtered_df.index)] = True
+        
+        with st.expander(f"🧭 Kampus Terdekat dari {kota_asal}"):
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                jurusan_dicari = st.selectbox("Jurusan:", ["Semua Jurusan"] + sorted(df['Nama Jurusan'].unique()))
+            with col2:
+                jumlah_terdekat = st.number_input("Jumlah:", min_value=1, max_value=50, value=5)
+            
+            nearest_allowed = allowed
+            if jurusan_dicari != "Semua Jurusan":
+                nearest_allowed = allowed & (df['Nama Jurusan'] == jurusan_dicari).to_numpy()
+            with profiler.section("campus_nearest"):
+                rows, distances = campus_index.nearest(*asal, int(jumlah_terdekat), nearest_allowed)
+            if len(rows):
+                terdekat = df.iloc[rows][['Nama Jurusan', 'Nama PTN', 'Lokasi', 'Akreditasi']].copy()
+                terdekat['Jarak (km)'] = distances.round(1)
+                st.dataframe(terdekat, use_container_width=True, hide_index=True)
+            else:
+                st.info("Tidak ada kampus yang cocok dengan filter saat ini.")
+        
+        # Filter radius: hanya jurusan dalam radius dari kota asal, dengan kolom jarak
+        with profiler.section("campus_radius"):
+            rows, distances = campus_index.within_radius(*asal, radius_km, allowed)
+        order = np.argsort(rows)
+        filtered_df = df.iloc[rows[order]].copy()
+        filtered_df['Jarak (km)'] = distances[order].round(1)
+        st.caption(f"📏 {len(filtered_df):,} jurusan berada dalam radius {radius_km:,} km dari {kota_asal}.")
+    
     # Prioritas (jurusan sepi peminat atau tidak)
     prioritas_sepi = st.checkbox("🔍 Prioritaskan Jurusan Sepi Peminat")
     
+    # Jumlah rekomendasi yang ditampilkan
+    jumlah_rekomendasi = st.slider("🔢 Jumlah Rekomendasi:", 5, 100, 10, step=5)
+    
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Tombol untuk mendapatkan rekomendasi
     if st.button("🔎 Dapatkan Rekomendasi"):
         if len(filtered_df) > 0:
             # Jumlah rekomendasi
-            num_recommendations = min(10, len(filtered_df))
-            
-            # Dapatkan rekomendasi
-            recommendations = get_recommendations(filtered_df, preferences, n=num_recommendations)
+            num_recommendations = min(jumlah_rekomendasi, len(filtered_df))
             
-            # Jika prioritas jurusan sepi peminat
+            # Jika prioritas jurusan sepi peminat: peringkat multi-tujuan (Pareto front atas peminat rendah,
+            # gaji tinggi, waktu tunggu singkat dan kelulusan tinggi) pada seluruh katalog hasil filter
             if prioritas_sepi:
-                recommendations = recommendations.sort_values(['Peminat 2024', 'Gaji Awal Max'], ascending=[True, False])
+                # Tanpa filter, skyline seluruh katalog sudah tersedia di artefak
+                pareto = artifacts.pareto if len(filtered_df) == len(df) else None
+                recommendations, front_size = rank_jurusan(filtered_df, k=num_recommendations, pareto=pareto)
+                st.caption(f"🏅 {front_size:,} jurusan berada di Pareto front (tidak ada jurusan lain yang lebih baik di semua aspek).")
+            else:
+                # Dapatkan rekomendasi
+                recommendations = get_recommendations(filtered_df, preferences, n=num_recommendations,
+                                                      chances=peluang_masuk if utamakan_peluang else None)
+            recommendations = recommendations.assign(
+                **{'Peluang Masuk (%)': (peluang_masuk.loc[recommendations.index] * 100).round(1)})
             
             # Tampilkan rekomendasi
             st.markdown("<h3 style='text-align: center;'>🎯 Jurusan yang Direkomendasikan Untuk Anda</h3>", unsafe_allow_html=True)
@@ -1472,40 +1236,21 @@ elif menu == "🔍 Sistem Rekomendasi":
             
             st.markdown("<br>", unsafe_allow_html=True)
             
-            # Untuk setiap rekomendasi, buat card
-            for i, (idx, row) in enumerate(recommendations.iterrows()):
-                col1, col2 = st.columns([1, 3])
-                
-                with col1:
-                    # Placeholder untuk gambar
-                    st.markdown(f"### {i+1}")
-                
-                with col2:
-                    st.markdown(f"### {row['Nama Jurusan']}")
-                    st.markdown(f"**{row['Nama PTN']}** - {row['Fakultas']}")
-                    st.markdown(f"**Lokasi:** {row['Lokasi']} | **Akreditasi:** {row['Akreditasi']}")
-                    
-                    met1, met2, met3 = st.columns(3)
-                    with met1:
-                        st.metric("👥 Peminat 2024", row['Peminat 2024'])
-                    with met2:
-                        st.metric("💰 Gaji Awal", f"Rp {row['Gaji Awal Min']:,} - {row['Gaji Awal Max']:,}")
-                    with met3:
-                        st.metric("🎓 Kelulusan", f"{row['Tingkat Kelulusan (%)']}%")
-                    
-                    st.markdown(f"**💼 Prospek Kerja Utama:** {row['Prospek Kerja Utama']}")
-                    st.markdown(f"**🔄 Prospek Kerja Alternatif:** {row['Prospek Kerja Alternatif']}")
-                    st.markdown(f"**📚 Tingkat Kesulitan:** {row['Tingkat Kesulitan']} | **⚔️ Persaingan Kerja:** {row['Tingkat Persaingan Kerja']}")
-                    
-                    # Tambahkan saran khusus untuk jurusan ini
-                    st.markdown(f"""
-                    **💡 Saran untuk jurusan ini:**
-                    - {"✅ Jurusan ini memiliki gaji tinggi dengan peminat relatif sedikit, peluang bagus!" if row['Peminat 2024'] < avg_peminat and row['Gaji Awal Max'] > avg_gaji else "⚠️ Perhatikan rasio keketatan untuk menilai peluang masuk"}
-                    - {"✅ Waktu tunggu kerja singkat, prospek cepat bekerja" if row['Maks. Waktu Tunggu Kerja (Bulan)'] < 24 else "⚠️ Siapkan diri untuk waktu tunggu kerja yang moderat"}
-                    - {"✅ Kebutuhan industri tinggi, peluang kerja jangka panjang baik" if row['Kebutuhan Industri'] == 'Tinggi' else "⚠️ Perlu keterampilan tambahan untuk meningkatkan daya saing"}
-                    """)
-                
-                st.markdown("---")
+            # Semua card rekomendasi dirender sekaligus sebagai satu elemen HTML
+            with profiler.section("recommendation_cards"):
+                st.markdown(recommendation_cards_html(recommendations, avg_peminat, avg_gaji), unsafe_allow_html=True)
+            
+            # Jurusan serupa untuk 5 rekomendasi teratas; tab tidak memicu rerun sehingga hasil tetap tampil
+            st.markdown("<h3 style='text-align: center;'>🧬 Jurusan Serupa</h3>", unsafe_allow_html=True)
+            top_rows = df.index.get_indexer(recommendations.index[:5])
+            similar_tabs = st.tabs([f"#{i + 1} {name}" for i, name in enumerate(recommendations['Nama Jurusan'].iloc[:5])])
+            for tab, row in zip(similar_tabs, top_rows):
+                with tab:
+                    st.caption(f"Mirip dengan {df['Nama Jurusan'].iloc[row]} - {df['Nama PTN'].iloc[row]}")
+                    st.dataframe(similar_programs(df, artifacts.neighbor_graph, row),
+                                 use_container_width=True, hide_index=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
             
             # Visualisasi perbandingan rekomendasi
             st.markdown("<h3 style='text-align: center;'>📊 Perbandingan Rekomendasi</h3>", unsafe_allow_html=True)
@@ -1563,7 +1308,7 @@ elif menu == "🔍 Sistem Rekomendasi":
                 font=dict(color="white")
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            profiler.plotly_chart(fig, use_container_width=True)
             
             st.markdown("""
             #### 📌 Selanjutnya, Anda bisa:
@@ -1692,4 +1437,7 @@ elif menu == "ℹ️ Tentang Aplikasi":
     Aplikasi ini dikembangkan untuk tujuan pendidikan dan dapat digunakan secara bebas oleh calon mahasiswa, orang tua, guru, dan pihak lain yang berkepentingan.
     
     Data yang disajikan dalam aplikasi ini bersifat informatif dan sebaiknya dikonfirmasi dengan sumber resmi sebelum pengambilan keputusan.
-    """)
\ No newline at end of file
+    """)
+
+profiler.stop(menu)
+profiler.finish(menu=menu)
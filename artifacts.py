@@ -0,0 +1,374 @@
+import copy
+import os
+import pickle
+import shutil
+import threading
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+import charts
+from admission import AdmissionModel
+from clusters import ClusterView, name_clusters
+from cubes import GeoRollupCube
+from data_loader import MODELS_DIR, read_dataset, read_models, dataset_version, models_version
+from geo import CampusIndex
+from indexes import IntervalIndex, RangeIndex, TableIndex, TextIndex
+from moments import CORRELATION_METHODS, streaming_statistics
+from neighbors import NeighborGraph
+from ranking import ParetoIndex
+
+# Fitur yang dipakai model clustering
+CLUSTER_FEATURES = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)',
+                    'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
+
+# Kolom yang dapat diurutkan dan dicari pada tabel berhalaman
+TABLE_SORT_COLUMNS = ['Gaji Awal Max', 'Peminat 2024', 'Rasio Keketatan', 'Gaji Awal Min', 'Tingkat Kelulusan (%)']
+TABLE_SEARCH_COLUMNS = ['Nama Jurusan', 'Nama PTN']
+
+# Kolom teks untuk kotak pencarian jurusan, prospek kerja dan keterampilan (kolom -> bobot skor)
+TEXT_SEARCH_WEIGHTS = {
+    'Nama Jurusan': 2.0,
+    'Prospek Kerja Utama': 1.5,
+    'Prospek Kerja Alternatif': 1.0,
+    'Keterampilan Utama': 1.0,
+}
+
+# Kolom numerik pada heatmap korelasi tab Hubungan Antar Variabel
+CORRELATION_COLUMNS = ['Peminat 2024', 'Daya Tampung SNBP 2025', 'Daya Tampung SNBT 2025',
+                       'Rasio Keketatan', 'Lama Studi Rata-rata (Bulan)', 'Tingkat Kelulusan (%)',
+                       'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
+
+# Kolom numerik yang dapat dipakai sebagai batasan wajib (filter rentang) rekomendasi
+RANGE_COLUMNS = ['Gaji Awal Min', 'Gaji Awal Max', 'Maks. Waktu Tunggu Kerja (Bulan)',
+                 'Tingkat Kelulusan (%)', 'Rasio Keketatan']
+
+# Direktori cache artefak hasil warmup.py (satu subdirektori per versi)
+CACHE_DIR = 'cache'
+
+# Jumlah percobaan membaca sumber bila dataset/model berubah selama dibaca
+READ_ATTEMPTS = 3
+
+# Format isi cache; dinaikkan setiap kali atribut Artifacts berubah agar cache lama tidak dipakai
+CACHE_FORMAT = 14
+
+SUNBURST_TITLE = "🧩 Hierarki Jurusan berdasarkan Fakultas, Tingkat Kesulitan, dan Persaingan Kerja"
+
+# Grafik tampilan default (nilai awal widget) yang dibangun bersama artefak: (nama builder, argumen setelah df)
+DEFAULT_FIGURES = [
+    ('create_sunburst', (SUNBURST_TITLE,)),
+    ('create_histogram', ('Peminat 2024', "Distribusi Peminat 2024", "#1f77b4")),
+    ('create_histogram', ('Gaji Awal Min', "Distribusi Gaji Awal Min", "#ff7f0e")),
+    ('create_box_plot', ('Peminat 2024', "Box Plot Peminat 2024")),
+    ('create_box_plot', ('Gaji Awal Min', "Box Plot Gaji Awal Min")),
+    ('create_scatter', ('Peminat 2024', 'Gaji Awal Min', 'Tingkat Kesulitan',
+                        "Hubungan antara Peminat 2024 dan Gaji Awal Min")),
+]
+
+
+# Semua artefak turunan untuk satu versi (dataset, model). Objek ini tidak diubah setelah
+# dibangun; pembaruan dilakukan dengan membangun objek baru lalu menukar referensinya.
+class Artifacts:
+    def __init__(self, version, df, models):
+        self.version = version
+        self.df = df
+        self.models = models
+        self.built_at = time.time()
+        self.build_seconds = None
+
+        # Indeks tabel seluruh dataset (Top Jurusan)
+        self.table_index = TableIndex(df, TABLE_SORT_COLUMNS, TABLE_SEARCH_COLUMNS)
+
+        # Indeks teks terbalik (token, prefiks dan trigram) untuk kotak pencarian
+        self.text_index = TextIndex(df, list(TEXT_SEARCH_WEIGHTS), TEXT_SEARCH_WEIGHTS)
+
+        # Indeks rentang untuk batasan wajib pada sistem rekomendasi
+        self.range_index = RangeIndex(df, RANGE_COLUMNS)
+
+        # Interval tree rentang gaji awal [Gaji Awal Min, Gaji Awal Max]
+        self.salary_index = IntervalIndex.from_columns(df, 'Gaji Awal Min', 'Gaji Awal Max')
+
+        # Indeks geospasial kampus (BallTree haversine atas koordinat kota)
+        self.campus_index = CampusIndex(df)
+
+        # Kubus rollup geografis (kota -> provinsi -> pulau) untuk peta Distribusi Geografis
+        self.geo_cube = GeoRollupCube(df)
+
+        # Graf k tetangga terdekat pada fitur clustering terstandar untuk panel "Jurusan Serupa"
+        self.neighbor_graph = NeighborGraph(df, CLUSTER_FEATURES)
+
+        # Kurva peluang masuk per jurusan dari simulasi Monte Carlo daya tampung SNBP/SNBT
+        self.admission = AdmissionModel(df)
+
+        # Matriks korelasi (Pearson dan Spearman mendekati) dan ringkasan per kolom dari statistik streaming
+        self.correlations = {method: streaming_statistics(df, CORRELATION_COLUMNS, method)
+                             for method in CORRELATION_METHODS}
+
+        # Pareto front seluruh katalog untuk prioritas jurusan sepi peminat
+        self.pareto = ParetoIndex(df)
+
+        # Artefak clustering hanya tersedia bila model sudah dilatih. Satu ClusterView per k:
+        # model utama training.py dan keluarga model k=2..10, yang labelnya diambil dari centroid
+        # terdekat tanpa fitting ulang. Semua k diberi nama dengan aturan derive_cluster_names.
+        self.X_pca = None
+        self.default_k = None
+        self.cluster_views = {}
+        self.cluster_stability = None
+        if models is not None:
+            X_scaled = models['scaler'].transform(df[CLUSTER_FEATURES])
+            self.X_pca = models['pca'].transform(X_scaled)
+            self.default_k = models['kmeans'].n_clusters
+            labels = models['kmeans'].predict(X_scaled)
+            self.cluster_views[self.default_k] = ClusterView(
+                df, labels, name_clusters(df, labels, CLUSTER_FEATURES), CLUSTER_FEATURES,
+                TABLE_SORT_COLUMNS, TABLE_SEARCH_COLUMNS)
+            family = models.get('cluster_family')
+            if family is not None:
+                for k in family.k_values:
+                    if k not in self.cluster_views:
+                        self.cluster_views[k] = ClusterView(
+                            df, family.assign(df, k), family.names(k), CLUSTER_FEATURES,
+                            TABLE_SORT_COLUMNS, TABLE_SEARCH_COLUMNS)
+            # Stabilitas bootstrap model utama; dipakai hanya bila dihitung untuk model KMeans,
+            # fitur dan dataset yang sama (hasil training ulang tanpa stability.py diabaikan)
+            stability = models.get('cluster_stability')
+            if stability is not None and stability.matches(models['kmeans'], CLUSTER_FEATURES, len(df),
+                                                           version.split('-')[0]):
+                self.cluster_stability = stability
+
+        self.figures = {}
+
+    def build_figures(self):
+        for name, args in DEFAULT_FIGURES:
+            self.figures[name, args] = getattr(charts, name)(self.df, *args)
+
+    # Grafik dari cache bila argumennya sama dengan tampilan default, selain itu dibangun.
+    # Salinan dikembalikan agar figure bersama tidak ikut berubah oleh pemanggil.
+    def figure(self, builder, df, *args):
+        cached = self.figures.get((builder.__name__, args))
+        if cached is not None:
+            return go.Figure(cached)
+        return builder(df, *args)
+
+
+# Versi sumber saat ini: hash isi dataset dan file model (model boleh belum ada)
+def source_version(dataset_path=None, models_dir=MODELS_DIR):
+    try:
+        model_part = models_version(models_dir)
+    except FileNotFoundError:
+        model_part = 'tanpa-model'
+    return f"{dataset_version(dataset_path)}-{model_part}"
+
+
+# Membaca dataset dan model sesuai versi yang diharapkan. Versi dihitung ulang setelah
+# membaca; bila file diganti di tengah pembacaan (mis. saat watcher mendeteksi file baru),
+# pembacaan diulang dengan versi barunya agar artefak tidak diberi label versi yang salah.
+def read_sources(dataset_path=None, models_dir=MODELS_DIR, version=None):
+    version = version or source_version(dataset_path, models_dir)
+    for _ in range(READ_ATTEMPTS):
+        df = read_dataset(dataset_path)
+        try:
+            models = read_models(models_dir)
+        except FileNotFoundError:
+            models = None
+        current = source_version(dataset_path, models_dir)
+        if current == version:
+            return version, df, models
+        version = current
+    raise RuntimeError(f"Dataset atau model terus berubah selama dibaca ({READ_ATTEMPTS} percobaan)")
+
+
+# Membangun artefak dari sumber (atau memuatnya dari cache bila versinya sudah ada).
+# Dengan share=True hasil build ditulis ke cache lalu dipetakan ulang (mmap), sehingga
+# proses Streamlit lain pada mesin yang sama memakai halaman memori yang sama.
+# Versi artefak adalah versi byte yang benar-benar dibaca (bisa berbeda dari argumen version).
+def build_artifacts(dataset_path=None, models_dir=MODELS_DIR, version=None, cache_dir=CACHE_DIR,
+                    use_cache=True, share=False):
+    start = time.perf_counter()
+    version = version or source_version(dataset_path, models_dir)
+    if use_cache:
+        artifacts = load_cached_artifacts(version, cache_dir)
+        if artifacts is not None:
+            return artifacts
+    version, df, models = read_sources(dataset_path, models_dir, version)
+    artifacts = Artifacts(version, df, models)
+    artifacts.build_figures()
+    artifacts.build_seconds = time.perf_counter() - start
+    if share:
+        try:
+            save_artifacts(artifacts, cache_dir)
+            artifacts = load_cached_artifacts(version, cache_dir) or artifacts
+        except OSError:
+            # Direktori cache tidak dapat ditulis: tetap pakai salinan di memori proses ini
+            pass
+    return artifacts
+
+
+# Direktori cache satu versi; format cache ikut di nama agar cache format lama diabaikan
+def cache_path(version, cache_dir=CACHE_DIR):
+    return os.path.join(cache_dir, f"{version}-f{CACHE_FORMAT}")
+
+
+# Menyimpan artefak ke cache/<versi>/:
+# - dataset.parquet: dataset lengkap (kolumnar); saat dimuat hanya kolom teks yang dibaca
+# - artifacts.joblib: kolom numerik, label cluster, PCA, kode kategori, indeks dan array model
+#   sebagai array numpy tanpa kompresi sehingga dapat dipetakan langsung dengan mmap
+# - figures.pkl: grafik tampilan default
+# Ditulis ke direktori sementara lalu di-rename agar pembaca tidak pernah melihat cache
+# setengah jadi. Versi yang sudah ada tidak ditimpa (kecuali overwrite=True) karena file
+# tersebut mungkin sedang dipetakan proses lain. Hanya `keep` versi terbaru yang dipertahankan.
+def save_artifacts(artifacts, cache_dir=CACHE_DIR, keep=3, overwrite=False):
+    target = cache_path(artifacts.version, cache_dir)
+    if not overwrite and os.path.exists(os.path.join(target, 'artifacts.joblib')):
+        return target
+    tmp = f"{target}.tmp-{os.getpid()}-{threading.get_ident()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    os.makedirs(tmp)
+
+    df = artifacts.df
+    df.to_parquet(os.path.join(tmp, 'dataset.parquet'), index=False)
+    # Figure plotly berisi array objek (teks hover) yang tidak bisa di-mmap dan lambat dibaca
+    # lewat unpickler joblib, jadi disimpan terpisah dengan pickle biasa
+    with open(os.path.join(tmp, 'figures.pkl'), 'wb') as f:
+        pickle.dump(artifacts.figures, f, protocol=pickle.HIGHEST_PROTOCOL)
+    rest = copy.copy(artifacts)
+    rest.df = None
+    rest.figures = {}
+    payload = {
+        'artifacts': rest,
+        'columns': list(df.columns),
+        'numeric': {column: df[column].to_numpy() for column in df.select_dtypes('number').columns},
+    }
+    joblib.dump(payload, os.path.join(tmp, 'artifacts.joblib'))
+    if overwrite:
+        shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        # Proses lain sudah lebih dulu menulis versi yang sama
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    versions = [
+        os.path.join(cache_dir, name) for name in os.listdir(cache_dir)
+        if '.tmp-' not in name and os.path.isdir(os.path.join(cache_dir, name))
+    ]
+    versions.sort(key=os.path.getmtime, reverse=True)
+    for old in versions[keep:]:
+        shutil.rmtree(old, ignore_errors=True)
+    return target
+
+
+# Memuat artefak dari cache. Dengan mmap=True array numpy dipetakan read-only dari file
+# (halaman dibagi lewat page cache OS antar worker); kolom numerik DataFrame memakai
+# array tersebut tanpa salinan, hanya kolom teks yang dibaca dari Parquet.
+def load_cached_artifacts(version, cache_dir=CACHE_DIR, mmap=True):
+    path = cache_path(version, cache_dir)
+    if not os.path.exists(os.path.join(path, 'artifacts.joblib')):
+        return None
+    try:
+        payload = joblib.load(os.path.join(path, 'artifacts.joblib'), mmap_mode='r' if mmap else None)
+        artifacts = payload['artifacts']
+        with open(os.path.join(path, 'figures.pkl'), 'rb') as f:
+            artifacts.figures = pickle.load(f)
+        numeric = payload['numeric']
+        text_columns = [column for column in payload['columns'] if column not in numeric]
+        text = pd.read_parquet(os.path.join(path, 'dataset.parquet'), columns=text_columns)
+        artifacts.df = pd.DataFrame(
+            {column: np.asarray(numeric[column]) if column in numeric else text[column]
+             for column in payload['columns']},
+            copy=False,
+        )
+    except Exception:
+        # Cache rusak atau format lama: bangun ulang dari sumber
+        return None
+    return artifacts
+
+
+# Penyimpan artefak bersama untuk semua sesi. Watcher memeriksa dataset/ dan models/
+# secara berkala (hash isi, di-memo per mtime), membangun ulang artefak di thread latar
+# belakang, lalu menukar referensi secara atomik. Permintaan pengguna selalu membaca
+# versi lengkap terakhir dan tidak pernah menunggu proses rebuild.
+class ArtifactStore:
+    def __init__(self, dataset_path=None, models_dir=MODELS_DIR, interval=5.0, share=True):
+        self.dataset_path = dataset_path
+        self.models_dir = models_dir
+        self.interval = interval
+        self.share = share
+        self.last_error = None
+        self._current = None
+        self._pending_version = None
+        self._failed_version = None
+        self._building = False
+        self._lock = threading.Lock()
+        self._watcher = None
+
+    # Artefak versi terakhir; hanya pemanggilan pertama (belum ada versi sama sekali) yang menunggu build
+    def get(self):
+        current = self._current
+        if current is not None:
+            return current
+        with self._lock:
+            if self._current is None:
+                self._current = build_artifacts(self.dataset_path, self.models_dir, share=self.share)
+            return self._current
+
+    @property
+    def building(self):
+        return self._building
+
+    # Memeriksa perubahan sumber. Versi baru harus terlihat sama pada dua pemeriksaan
+    # berturut-turut (debounce) agar file yang masih ditulis tidak ikut dibangun.
+    def check(self):
+        try:
+            version = source_version(self.dataset_path, self.models_dir)
+        except (FileNotFoundError, OSError) as e:
+            self.last_error = e
+            return False
+        current = self._current
+        if current is None or version == current.version or version == self._failed_version:
+            self._pending_version = None
+            return False
+        if version != self._pending_version:
+            self._pending_version = version
+            return False
+        return self.rebuild(version)
+
+    # Memulai rebuild di thread latar belakang (tidak dilakukan bila rebuild lain sedang berjalan)
+    def rebuild(self, version=None):
+        with self._lock:
+            if self._building:
+                return False
+            self._building = True
+        threading.Thread(target=self._rebuild, args=(version,), name="artifact-rebuild", daemon=True).start()
+        return True
+
+    def _rebuild(self, version):
+        try:
+            artifacts = build_artifacts(self.dataset_path, self.models_dir, version=version, share=self.share)
+            # Penukaran referensi tunggal: pembaca melihat versi lama atau versi baru yang lengkap
+            self._current = artifacts
+            self.last_error = None
+            self._failed_version = None
+        except Exception as e:
+            self.last_error = e
+            self._failed_version = version
+        finally:
+            self._pending_version = None
+            self._building = False
+
+    def start_watcher(self):
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, name="artifact-watcher", daemon=True)
+            self._watcher.start()
+        return self
+
+    def _watch(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.check()
+            except Exception as e:
+                self.last_error = e
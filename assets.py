@@ -0,0 +1,72 @@
+import hashlib
+import os
+import shutil
+
+# Aset statis aplikasi (nama -> file sumber)
+ASSET_SOURCES = {
+    'style': 'style.css',
+    'sidebar': 'image1.webp',
+    'banner': 'image2.webp',
+    'logo': 'logo.png',
+}
+
+# Folder yang dilayani Streamlit di /app/static/ bila server.enableStaticServing aktif
+STATIC_DIR = 'static'
+STATIC_URL = '/app/static'
+
+
+# Hash isi file (potongan SHA-256) untuk nama file versi
+def content_hash(path, length=12):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()[:length]
+
+
+# Menyalin aset ke folder static dengan nama ber-hash isi (mis. image1.3f2a9c01b4de.webp).
+# Nama berubah hanya bila isi berubah, sehingga browser aman menyimpan aset di cache;
+# versi lama dari aset yang sama dihapus. Mengembalikan nama -> nama file ber-hash.
+def publish_assets(sources=ASSET_SOURCES, static_dir=STATIC_DIR):
+    os.makedirs(static_dir, exist_ok=True)
+    published = {}
+    for name, source in sources.items():
+        stem, ext = os.path.splitext(os.path.basename(source))
+        filename = f"{stem}.{content_hash(source)}{ext}"
+        target = os.path.join(static_dir, filename)
+        if not os.path.exists(target):
+            tmp = f"{target}.tmp"
+            shutil.copyfile(source, tmp)
+            os.replace(tmp, target)
+        for existing in os.listdir(static_dir):
+            old_stem, old_ext = os.path.splitext(existing)
+            if existing != filename and old_ext == ext and old_stem.rsplit('.', 1)[0] == stem:
+                os.remove(os.path.join(static_dir, existing))
+        published[name] = filename
+    return published
+
+
+class StaticAssets:
+    def __init__(self, sources=ASSET_SOURCES, static_dir=STATIC_DIR, serving=True):
+        self.sources = sources
+        self.serving = serving
+        self.files = publish_assets(sources, static_dir) if serving else {}
+        # Tanpa static serving: CSS dibaca sekali dan gambar disimpan sebagai bytes di memori
+        self.contents = {}
+        if not serving:
+            for name, source in sources.items():
+                with open(source, 'rb') as f:
+                    self.contents[name] = f.read()
+
+    # URL aset ber-hash (static serving) atau bytes isi aset (fallback) untuk st.image / st.logo
+    def image(self, name):
+        if self.serving:
+            return f"{STATIC_URL}/{self.files[name]}"
+        return self.contents[name]
+
+    # Elemen <style> kecil yang mengimpor stylesheet ber-hash; tanpa static serving
+    # CSS disisipkan langsung dari isi yang sudah dibaca
+    def stylesheet(self, name='style'):
+        if self.serving:
+            return f"<style>@import url('{STATIC_URL}/{self.files[name]}');</style>"
+        return f"<style>{self.contents[name].decode('utf-8')}</style>"
@@ -0,0 +1,339 @@
+# Benchmark pemuatan data, clustering, rekomendasi, pembuatan grafik dan training
+# di luar Streamlit, dibandingkan dengan baseline yang disimpan di benchmarks/baseline.json
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import cache
+
+import charts
+import ranking
+import recommender
+import synthetic_data
+from cubes import GEO_LEVELS, GEO_MEASURES, GeoRollupCube
+from data_loader import DATASET_PATH, read_dataset, read_models
+from geo import KOTA_COORDS, KOTA_PROVINSI, PROVINSI_PULAU, WILAYAH_LAIN, CampusIndex
+from admission import AdmissionModel
+from artifacts import CORRELATION_COLUMNS, TEXT_SEARCH_WEIGHTS
+from indexes import IntervalIndex, RangeIndex, TableIndex, TextIndex
+from moments import streaming_statistics
+from neighbors import NeighborGraph
+from stability import bootstrap_stability
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+LATEST_PATH = os.path.join(ROOT, 'benchmarks', 'latest.json')
+
+CLUSTER_FEATURES = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)',
+                    'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
+
+# Preferensi default halaman Sistem Rekomendasi
+DEFAULT_PREFERENCES = {
+    'Rasio Keketatan': 7.0,
+    'Tingkat Kelulusan (%)': 85,
+    'Maks. Waktu Tunggu Kerja (Bulan)': 36,
+    'Gaji Awal Min': 4500000,
+    'Gaji Awal Max': 8500000
+}
+
+RIDGELINE_COLUMNS = ['Peminat 2024', 'Rasio Keketatan', 'Gaji Awal Max']
+
+# Batasan wajib dari slider default (Kelulusan >= 85, Waktu Tunggu <= 36, Gaji Awal Min >= 4,5 jt,
+# Rasio Keketatan <= 7)
+DEFAULT_CONSTRAINTS = {
+    'Tingkat Kelulusan (%)': (85, None),
+    'Maks. Waktu Tunggu Kerja (Bulan)': (None, 36),
+    'Gaji Awal Min': (4500000, None),
+    'Rasio Keketatan': (None, 7.0),
+}
+
+# Rentang gaji target dari slider default Gaji Awal Minimum / Maksimum
+DEFAULT_SALARY_RANGE = (4500000, 8500000)
+# Rentang sempit di ekor atas distribusi gaji (hasil kecil, menguji query O(log n + k))
+SELECTIVE_SALARY_RANGE = (11000000, 13000000)
+
+# Kota asal dan radius untuk pencarian kampus terdekat
+HOME_CITY = 'Yogyakarta'
+HOME_RADIUS_KM = 200
+
+# Kata kunci kotak pencarian: token utuh, prefiks, dua kata dan salah ketik (fuzzy)
+SEARCH_QUERIES = ['data', 'hukum', 'ilmu kom', 'konsultn']
+
+# Graf kNN dibangun pada paling banyak sekian baris pertama agar satu putaran benchmark tetap singkat
+KNN_MAX_ROWS = 100_000
+
+# Simulasi peluang masuk dijalankan pada paling banyak sekian jurusan pertama (biayanya linear per jurusan)
+ADMISSION_MAX_ROWS = 1_000
+
+# Bootstrap stabilitas cluster: jumlah sampel dan baris maksimum per putaran benchmark
+STABILITY_BOOTSTRAP = 50
+STABILITY_MAX_ROWS = 10_000
+
+# Metrik yang dapat diurutkan di tab Top Jurusan
+TOP_METRICS = ['Peminat 2024', 'Gaji Awal Max', 'Rasio Keketatan', 'Tingkat Kelulusan (%)']
+
+
+def time_case(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return {'min_s': round(min(timings), 6), 'median_s': round(statistics.median(timings), 6), 'repeat': repeat}
+
+
+# Menjalankan training.py pada direktori kerja sementara dan membaca waktu per tahap
+# dari models/training_report.json
+def run_training(csv_path, n_rows, workdir):
+    command = [sys.executable, os.path.join(ROOT, 'training.py'), '--data', csv_path]
+    if n_rows > 10_000:
+        command.append('--skala-besar')
+    subprocess.run(command, cwd=workdir, check=True, stdout=subprocess.DEVNULL)
+    with open(os.path.join(workdir, 'models', 'training_report.json'), encoding='utf-8') as f:
+        report = json.load(f)
+    return {f"training/{s['stage']}": {'min_s': s['wall_s'], 'median_s': s['wall_s'], 'repeat': 1}
+            for s in report['stages']}
+
+
+def run_scale(n_rows, args, models, workdir):
+    print(f"\n== {n_rows:,} baris ==")
+    csv_path = os.path.join(workdir, f'synthetic_{n_rows}.csv')
+    parquet_path = os.path.join(workdir, f'synthetic_{n_rows}.parquet')
+    if not os.path.exists(csv_path) or not os.path.exists(parquet_path):
+        synthetic = synthetic_data.generate(n_rows, seed=args.seed, source=read_dataset(os.path.join(ROOT, DATASET_PATH)))
+        synthetic.to_csv(csv_path, index=False)
+        synthetic.to_parquet(parquet_path, index=False)
+        del synthetic
+    df = read_dataset(csv_path)
+
+    def cluster_assignment():
+        X_scaled = models['scaler'].transform(df[CLUSTER_FEATURES])
+        models['kmeans'].predict(X_scaled)
+        models['pca'].transform(X_scaled)
+
+    # Fixture (indeks, kubus, graf, model) dibangun hanya bila kasus yang memakainya dijalankan,
+    # sekali per skala dan di luar waktu yang diukur, sehingga --only tetap murah
+    table_index = cache(lambda: TableIndex(df, TOP_METRICS))
+
+    def top_jurusan_sort():
+        for metric in TOP_METRICS:
+            df.sort_values(by=metric, ascending=False).head(50)
+
+    def top_jurusan_index():
+        for metric in TOP_METRICS:
+            df.iloc[table_index().top(metric, 50)]
+
+    range_index = cache(lambda: RangeIndex(df, list(DEFAULT_CONSTRAINTS)))
+    salary_index = cache(lambda: IntervalIndex.from_columns(df, 'Gaji Awal Min', 'Gaji Awal Max'))
+
+    def salary_queries(salary_range, index):
+        for mode in recommender.SALARY_MODES:
+            recommender.salary_rows(df, salary_range, mode, index)
+
+    campus_index = cache(lambda: CampusIndex(df))
+    geo_cube = cache(lambda: GeoRollupCube(df))
+
+    # Pergantian tingkat wilayah peta: lookup kubus, dibandingkan dengan groupby ulang per interaksi
+    def geo_rollup_groupby():
+        provinces = df['Lokasi'].map(KOTA_PROVINSI).fillna(WILAYAH_LAIN)
+        islands = provinces.map(PROVINSI_PULAU).fillna(WILAYAH_LAIN)
+        for keys in (df['Lokasi'], provinces, islands):
+            df.groupby(keys)[list(GEO_MEASURES.values())].agg(['mean', 'size'])
+
+    def geo_rollup_cube():
+        for level in GEO_LEVELS:
+            geo_cube().level(level)
+    home = KOTA_COORDS[HOME_CITY]
+
+    knn_df = df.head(KNN_MAX_ROWS)
+    neighbor_graph = cache(lambda: NeighborGraph(knn_df, CLUSTER_FEATURES))
+    similar_row = knn_df.iloc[0]
+
+    admission_df = df.head(ADMISSION_MAX_ROWS)
+    admission = cache(lambda: AdmissionModel(admission_df))
+
+    text_index = cache(lambda: TextIndex(df, list(TEXT_SEARCH_WEIGHTS), TEXT_SEARCH_WEIGHTS))
+
+    # Pencarian substring per kolom (tanpa indeks, tanpa toleransi salah ketik)
+    def text_search_contains():
+        for query in SEARCH_QUERIES:
+            mask = False
+            for column in TEXT_SEARCH_WEIGHTS:
+                mask = mask | df[column].str.contains(query, case=False, regex=False)
+            df[mask].head(20)
+
+    def text_search_index():
+        for query in SEARCH_QUERIES:
+            text_index().search(query, limit=20)
+
+    # Nama kasus -> fungsi, atau (fixture yang dipakai, fungsi) untuk kasus query atas fixture
+    cases = {
+        'load_data': lambda: read_dataset(csv_path),
+        'load_data_parquet': lambda: read_dataset(parquet_path),
+        'cluster_assignment': cluster_assignment,
+        'get_recommendations': lambda: recommender.get_recommendations(df, DEFAULT_PREFERENCES, n=10),
+        'range_filter_mask': lambda: recommender.apply_constraints(df, DEFAULT_CONSTRAINTS),
+        'range_filter_index': ([range_index], lambda: recommender.apply_constraints(
+            df, DEFAULT_CONSTRAINTS, range_index())),
+        'range_index_build': lambda: RangeIndex(df, list(DEFAULT_CONSTRAINTS)),
+        'recommend_constrained': ([range_index], lambda: recommender.get_recommendations(
+            df, DEFAULT_PREFERENCES, n=10, constraints=DEFAULT_CONSTRAINTS, range_index=range_index())),
+        'salary_filter_scan': lambda: salary_queries(DEFAULT_SALARY_RANGE, None),
+        'salary_filter_interval': ([salary_index], lambda: salary_queries(DEFAULT_SALARY_RANGE, salary_index())),
+        'salary_selective_scan': lambda: salary_queries(SELECTIVE_SALARY_RANGE, None),
+        'salary_selective_interval': ([salary_index], lambda: salary_queries(SELECTIVE_SALARY_RANGE, salary_index())),
+        'interval_index_build': lambda: IntervalIndex.from_columns(df, 'Gaji Awal Min', 'Gaji Awal Max'),
+        'campus_index_build': lambda: CampusIndex(df),
+        'campus_radius': ([campus_index], lambda: campus_index().within_radius(*home, HOME_RADIUS_KM)),
+        'campus_nearest': ([campus_index], lambda: campus_index().nearest(*home, 10)),
+        'text_index_build': lambda: TextIndex(df, list(TEXT_SEARCH_WEIGHTS), TEXT_SEARCH_WEIGHTS),
+        'text_search_contains': text_search_contains,
+        'text_search_index': ([text_index], text_search_index),
+        'knn_graph_build': lambda: NeighborGraph(knn_df, CLUSTER_FEATURES),
+        'similar_scan': lambda: recommender.get_recommendations(
+            knn_df, similar_row[list(DEFAULT_PREFERENCES)].to_dict(), n=11),
+        'similar_graph': ([neighbor_graph], lambda: neighbor_graph().similar(0)),
+        'admission_simulate': lambda: AdmissionModel(admission_df),
+        'admission_chance': ([admission], lambda: admission().chance(70)),
+        'cluster_bootstrap': lambda: bootstrap_stability(df.head(STABILITY_MAX_ROWS), models, CLUSTER_FEATURES, {},
+                                                         n_bootstrap=STABILITY_BOOTSTRAP),
+        'correlation_pandas': lambda: df[CORRELATION_COLUMNS].corr(),
+        'correlation_streaming': lambda: streaming_statistics(df, CORRELATION_COLUMNS),
+        'correlation_streaming_parquet': lambda: streaming_statistics(parquet_path, CORRELATION_COLUMNS),
+        'spearman_pandas': lambda: df[CORRELATION_COLUMNS].corr(method='spearman'),
+        'spearman_sketch': lambda: streaming_statistics(df, CORRELATION_COLUMNS, 'spearman'),
+        'pareto_rank': lambda: ranking.rank(df, k=10),
+        'table_index_build': lambda: TableIndex(df, TOP_METRICS),
+        'top_jurusan_sort': top_jurusan_sort,
+        'top_jurusan_index': ([table_index], top_jurusan_index),
+        'create_indonesia_map': lambda: charts.create_indonesia_map(df),
+        'geo_cube_build': lambda: GeoRollupCube(df),
+        'geo_rollup_groupby': geo_rollup_groupby,
+        'geo_rollup_cube': ([geo_cube], geo_rollup_cube),
+        'geo_map_from_cube': ([geo_cube], lambda: charts.create_indonesia_map(df, 'Provinsi', cube=geo_cube())),
+        'create_ridgeline_plot': lambda: charts.create_ridgeline_plot(df, RIDGELINE_COLUMNS, "Ridgeline"),
+    }
+
+    results = {}
+    for name, case in cases.items():
+        if args.only and name not in args.only:
+            continue
+        fixtures, func = case if isinstance(case, tuple) else ((), case)
+        try:
+            for fixture in fixtures:
+                fixture()
+            results[name] = time_case(func, args.repeat)
+            print(f"  {name:<28} {results[name]['min_s'] * 1000:>12.2f} ms")
+        except Exception as e:
+            results[name] = {'error': str(e)}
+            print(f"  {name:<28} error: {e}")
+
+    if not args.no_training and (not args.only or 'training' in args.only):
+        training_dir = os.path.join(workdir, f'training_{n_rows}')
+        os.makedirs(training_dir, exist_ok=True)
+        for name, result in run_training(csv_path, n_rows, training_dir).items():
+            results[name] = result
+            print(f"  {name:<28} {result['min_s'] * 1000:>12.2f} ms")
+    return results
+
+
+# Membandingkan hasil dengan baseline; regresi jika lebih lambat dari toleransi
+# dan selisihnya melebihi ambang noise absolut. Kasus tanpa entri baseline dilaporkan
+# agar tidak lolos dari pemeriksaan tanpa disadari.
+def compare(results, baseline, tolerance, min_delta_s):
+    regressions = []
+    missing = []
+    print("\n== Perbandingan dengan baseline ==")
+    for scale, cases in results.items():
+        for name, current in cases.items():
+            if 'min_s' not in current:
+                continue
+            base = baseline.get('results', {}).get(scale, {}).get(name)
+            if not base or 'min_s' not in base:
+                missing.append((scale, name))
+                print(f"  {scale:>9} {name:<28} {'-':>10} -> {current['min_s'] * 1000:>10.2f} ms  tanpa baseline")
+                continue
+            ratio = current['min_s'] / base['min_s'] if base['min_s'] > 0 else float('inf')
+            regressed = ratio > 1 + tolerance and current['min_s'] - base['min_s'] > min_delta_s
+            status = "REGRESI" if regressed else "ok"
+            print(f"  {scale:>9} {name:<28} {base['min_s'] * 1000:>10.2f} -> {current['min_s'] * 1000:>10.2f} ms  x{ratio:.2f}  {status}")
+            if regressed:
+                regressions.append((scale, name, ratio))
+    if missing:
+        print(f"\n{len(missing)} kasus belum memiliki baseline; jalankan dengan --save-baseline untuk menambahkannya.")
+    return regressions
+
+
+def machine_info():
+    return {
+        'platform': platform.platform(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard Insight PTN")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1_000, 100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis yang diuji")
+    parser.add_argument('--repeat', type=int, default=3, help="Jumlah pengulangan per kasus (diambil waktu minimum)")
+    parser.add_argument('--only', nargs='+', help="Hanya jalankan kasus tertentu (nama kasus atau 'training')")
+    parser.add_argument('--no-training', action='store_true', help="Lewati benchmark tahap training")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', help="Direktori untuk menyimpan/memakai ulang dataset sintetis")
+    parser.add_argument('--save-baseline', action='store_true', help="Simpan hasil sebagai baseline baru")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Toleransi perlambatan relatif sebelum dianggap regresi")
+    parser.add_argument('--min-delta-ms', type=float, default=5.0, help="Selisih absolut minimal (ms) untuk dianggap regresi")
+    args = parser.parse_args()
+
+    models = read_models(os.path.join(ROOT, 'models'))
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.data_dir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        results = {str(n): run_scale(n, args, models, workdir) for n in args.scales}
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': machine_info(),
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(LATEST_PATH), exist_ok=True)
+    with open(LATEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        # Hasil digabung ke baseline yang ada sehingga run --only hanya memperbarui kasus yang dijalankan
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, encoding='utf-8') as f:
+                saved = json.load(f)
+            for scale, cases in saved.get('results', {}).items():
+                report['results'][scale] = {**cases, **report['results'].get(scale, {})}
+        with open(BASELINE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline disimpan di {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("\nBaseline belum ada. Jalankan dengan --save-baseline untuk membuatnya.")
+        return 0
+
+    with open(BASELINE_PATH, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('machine', {}).get('cpu_count') != report['machine']['cpu_count']:
+        print("\nPeringatan: baseline dibuat di mesin dengan jumlah CPU berbeda, perbandingan bisa tidak akurat.")
+    regressions = compare(results, baseline, args.tolerance, args.min_delta_ms / 1000)
+    if regressions:
+        print(f"\n{len(regressions)} kasus mengalami regresi performa.")
+        return 1
+    print("\nTidak ada regresi performa.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
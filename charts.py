@@ -0,0 +1,235 @@
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+import plotly.express as px
+import plotly.graph_objects as go
+
+from cubes import GeoRollupCube
+from moments import streaming_statistics
+
+# Fungsi untuk visualisasi
+def create_histogram(df, column, title, color):
+    fig = px.histogram(df, x=column, title=title, color_discrete_sequence=[color])
+    fig.update_layout(
+        xaxis_title=column,
+        yaxis_title="Jumlah",
+        bargap=0.2,
+        showlegend=False,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+def create_scatter(df, x, y, color, title):
+    fig = px.scatter(df, x=x, y=y, color=color, title=title,
+                    hover_data=['Nama Jurusan', 'Nama PTN', 'Fakultas'])
+    fig.update_layout(
+        xaxis_title=x,
+        yaxis_title=y,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+# px.scatter_mapbox sudah dihapus di plotly 7; gunakan px.scatter_map (MapLibre) bila tersedia
+def scatter_map(data_frame, map_style, **kwargs):
+    if hasattr(px, 'scatter_map'):
+        return px.scatter_map(data_frame, map_style=map_style, **kwargs)
+    return px.scatter_mapbox(data_frame, mapbox_style=map_style, **kwargs)
+
+# Fungsi untuk membuat peta Indonesia dengan data jurusan pada tingkat wilayah tertentu
+# (Kota, Provinsi atau Pulau). Ringkasan wilayah dibaca dari GeoRollupCube; tanpa `cube`
+# kubus dibangun sekali dari df.
+def create_indonesia_map(df, level='Kota', cube=None):
+    if cube is None:
+        cube = GeoRollupCube(df)
+    lokasi_info = cube.level(level)
+    
+    # Hanya ambil wilayah dengan koordinat valid
+    map_info = lokasi_info.dropna(subset=['lat', 'lon'])
+    
+    fig = scatter_map(
+        map_info,
+        lat='lat',
+        lon='lon',
+        color='Jumlah Jurusan',
+        size='Jumlah Jurusan',
+        hover_name=level,
+        hover_data={'Jumlah Jurusan': True, 'Rata-rata Gaji Max': ':,.0f', 'Rata-rata Peminat': ':.0f',
+                    'Rata-rata Rasio Keketatan': ':.2f', 'lat': False, 'lon': False},
+        color_continuous_scale='viridis',
+        size_max=25 if level == 'Kota' else 40,
+        zoom=4 if level == 'Kota' else 3.5,
+        title=f'🗺️ Distribusi Jurusan IPS di Indonesia per {level}',
+        center={"lat": -2.5, "lon": 118.0},  # Tengah Indonesia
+        map_style="carto-darkmatter"
+    )
+    
+    fig.update_layout(
+        height=600,
+        margin={"r": 0, "t": 30, "l": 0, "b": 0},
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    
+    return fig, lokasi_info
+
+def create_box_plot(df, y, title):
+    fig = px.box(df, y=y, title=title)
+    fig.update_layout(
+        yaxis_title=y,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+def create_violin_plot(df, x, y, title):
+    fig = px.violin(df, x=x, y=y, box=True, title=title)
+    fig.update_layout(
+        xaxis_title=x,
+        yaxis_title=y,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+def create_bubble_chart(df, x, y, size, color, title):
+    fig = px.scatter(
+        df, 
+        x=x, 
+        y=y, 
+        size=size, 
+        color=color,
+        hover_name='Nama Jurusan',
+        hover_data=['Nama PTN', 'Fakultas'],
+        title=title,
+        size_max=30
+    )
+    fig.update_layout(
+        xaxis_title=x,
+        yaxis_title=y,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+def create_sunburst(df, title):
+    fig = px.sunburst(
+        df, 
+        path=['Fakultas', 'Tingkat Kesulitan', 'Tingkat Persaingan Kerja'],
+        values='Peminat 2024',
+        color='Kebutuhan Industri',
+        title=title,
+        color_discrete_sequence=px.colors.qualitative.Bold
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white")
+    )
+    return fig
+
+def create_ridgeline_plot(df, selected_columns, title):
+    fig = go.Figure()
+    
+    y_offset = 0
+    for column in selected_columns:
+        # Ambil garis KDE terakhir lalu tutup figure agar tidak menumpuk antar kolom/pemanggilan
+        ax = sns.kdeplot(df[column], bw_adjust=0.5)
+        x_kde, y_kde = ax.get_lines()[-1].get_data()
+        plt.close(ax.figure)
+        
+        # Normalisasi KDE untuk skala yang sama
+        y_kde = y_kde / np.max(y_kde) * 0.9 + y_offset
+        
+        # Tambahkan outline untuk KDE
+        fig.add_trace(go.Scatter(
+            x=x_kde, 
+            y=y_kde,
+            mode='lines',
+            line=dict(color='rgba(255, 255, 255, 0.8)', width=2),
+            name=column
+        ))
+        
+        # Tambahkan area di bawah KDE
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([x_kde, [x_kde[-1], x_kde[0]]]),
+            y=np.concatenate([y_kde, [y_offset, y_offset]]),
+            fill='toself',
+            mode='none',
+            name=column,
+            showlegend=False,
+            fillcolor='rgba(74, 111, 227, 0.5)'
+        ))
+        
+        y_offset += 1
+    
+    # Tambahkan label teks
+    for i, column in enumerate(selected_columns):
+        fig.add_annotation(
+            x=df[column].min(), 
+            y=i + 0.45, 
+            text=column,
+            showarrow=False,
+            font=dict(color="white", size=14)
+        )
+    
+    fig.update_layout(
+        title=title,
+        showlegend=False,
+        plot_bgcolor='rgba(30, 30, 30, 0.8)',
+        paper_bgcolor='rgba(30, 30, 30, 0.8)',
+        font=dict(color="white"),
+        height=600,
+        xaxis=dict(
+            showgrid=False,
+            title="Nilai",
+            color="white"
+        ),
+        yaxis=dict(
+            showticklabels=False,
+            showgrid=False,
+            zeroline=False,
+            color="white"
+        )
+    )
+    
+    return fig
+
+# `corr` (matriks korelasi yang sudah dihitung, mis. dari artefak) dapat diberikan; bila tidak,
+# korelasi dihitung streaming per potongan data
+def create_correlation_heatmap(df, columns, method='pearson', corr=None):
+    if corr is None:
+        corr, _ = streaming_statistics(df, columns, method)
+    
+    title = "Matriks Korelasi Antar Variabel Numerik"
+    if method == 'spearman':
+        title += " (Spearman)"
+    fig = px.imshow(
+        corr, 
+        text_auto=True, 
+        aspect="auto",
+        color_continuous_scale='RdBu_r',
+        title=title
+    )
+    fig.update_layout(height=600)
+    return fig
+
+def create_top_bar(top_jurusan, sort_metric, top_n):
+    fig = px.bar(
+        top_jurusan,
+        x='Nama Jurusan',
+        y=sort_metric,
+        color='Nama PTN',
+        hover_data=['Fakultas', 'Lokasi', 'Akreditasi'],
+        title=f"Top {top_n} Jurusan berdasarkan {sort_metric}"
+    )
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
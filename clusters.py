@@ -0,0 +1,155 @@
+import numpy as np
+import pandas as pd
+
+from cubes import ContingencyCube, CATEGORICAL_COLUMNS, DRILLDOWN_COLUMNS
+from indexes import TableIndex
+
+# Jumlah cluster yang dilatih sekaligus oleh training.py (slider k di halaman Analisis Cluster)
+K_VALUES = list(range(2, 11))
+
+# Tingkat kepercayaan interval hasil analisis stabilitas bootstrap (stability.py)
+CONFIDENCE = 0.95
+
+
+# Status peminat dan prospek kerja sebuah cluster dibandingkan rata-rata keseluruhan
+def cluster_status(avg_peminat, avg_gaji, mean_peminat, mean_gaji):
+    if avg_peminat < mean_peminat:
+        peminat_status = "Sepi Peminat"
+    else:
+        peminat_status = "Banyak Peminat"
+
+    if avg_gaji > mean_gaji:
+        gaji_status = "Prospek Bagus"
+    else:
+        gaji_status = "Prospek Sedang"
+
+    return peminat_status, gaji_status
+
+
+# Nama cluster beremoji dari rata-rata Peminat 2024 dan Gaji Awal Max per cluster. Dengan
+# banyak cluster status yang sama dapat berulang; nama kembar diberi nomor urut menurut
+# gaji rata-rata tertinggi agar tetap unik.
+def derive_cluster_names(cluster_means, overall_means):
+    names = {}
+    for cluster in cluster_means.index:
+        peminat_status, gaji_status = cluster_status(
+            cluster_means.loc[cluster, 'Peminat 2024'], cluster_means.loc[cluster, 'Gaji Awal Max'],
+            overall_means['Peminat 2024'], overall_means['Gaji Awal Max']
+        )
+
+        emoji = "🟢" if peminat_status == "Sepi Peminat" and gaji_status == "Prospek Bagus" else \
+                "🟡" if peminat_status == "Sepi Peminat" and gaji_status == "Prospek Sedang" else \
+                "🔵" if peminat_status == "Banyak Peminat" and gaji_status == "Prospek Bagus" else "🟠"
+
+        names[cluster] = f"{emoji} {peminat_status}, {gaji_status}"
+
+    order = cluster_means['Gaji Awal Max'].sort_values(ascending=False).index
+    for name in set(names.values()):
+        same = [cluster for cluster in order if names[cluster] == name]
+        if len(same) > 1:
+            for i, cluster in enumerate(same):
+                names[cluster] = f"{name} ({i + 1})"
+    return names
+
+
+# Nama cluster untuk label model apapun pada df (aturan yang sama dengan keluarga model k=2..10)
+def name_clusters(df, labels, features):
+    return derive_cluster_names(df[features].groupby(np.asarray(labels)).mean(), df[features].mean())
+
+
+# Keluarga model KMeans k=2..10 hasil training.py (models/cluster_family.pkl), disimpan ringkas:
+# centroid float32 pada ruang fitur terstandar (beserta mean/scale standarisasinya), rata-rata
+# fitur dan ukuran per cluster, inertia, serta nama cluster otomatis. Label per baris tidak
+# disimpan (ukurannya ikut jumlah baris); aplikasi menghitungnya ulang dengan assign().
+class ClusterFamily:
+    def __init__(self, features, center, scale, models):
+        self.features = list(features)
+        self.center = np.asarray(center, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.models = models
+
+    @property
+    def k_values(self):
+        return sorted(self.models)
+
+    # Label cluster untuk data apapun: centroid terdekat (tanpa fitting ulang)
+    def assign(self, df, k):
+        X = (df[self.features].to_numpy(dtype=np.float64) - self.center) / self.scale
+        centroids = self.models[k]['centroids'].astype(np.float64)
+        distances = (X ** 2).sum(axis=1)[:, None] - 2 * X @ centroids.T + (centroids ** 2).sum(axis=1)[None, :]
+        return distances.argmin(axis=1)
+
+    def names(self, k):
+        return self.models[k]['names']
+
+
+# Artefak halaman Analisis Cluster untuk satu nilai k: label, nama, rata-rata fitur per
+# cluster, indeks tabel per cluster dan kubus kontingensi
+class ClusterView:
+    def __init__(self, df, labels, names, features, sort_columns, search_columns):
+        self.labels = np.asarray(labels)
+        self.names = names
+        named = pd.Series(self.labels).map(lambda x: names.get(x, f"Cluster {x}"))
+        self.means = df[features].groupby(named.to_numpy()).mean().rename_axis('Nama Cluster').reset_index()
+        # Kode grup per Nama Cluster (urut abjad seperti pilihan selectbox) untuk indeks tabel
+        self.codes, self.options = pd.factorize(named, sort=True)
+        self.table_index = TableIndex(df, sort_columns, search_columns, group_labels=self.codes)
+        self.cube = ContingencyCube(df, self.labels, names, columns=CATEGORICAL_COLUMNS + DRILLDOWN_COLUMNS,
+                                    drilldown_columns=DRILLDOWN_COLUMNS + CATEGORICAL_COLUMNS)
+
+
+# Hasil analisis stabilitas bootstrap model KMeans utama (models/cluster_stability.pkl):
+# keyakinan cluster per jurusan (float32), ARI setiap sampel terhadap model utama, serta
+# rata-rata fitur per cluster beserta batas bawah/atas interval kepercayaannya (k x fitur).
+# Centroid model referensi disimpan sebagai sidik model yang dianalisis.
+class ClusterStability:
+    def __init__(self, k, n_rows, confidence, ari, means, lower, upper, features, cluster_names,
+                 reference_centers, dataset_version=None, seconds=None):
+        self.k = k
+        self.n_rows = n_rows
+        self.confidence = confidence
+        self.ari = ari
+        self.means = means
+        self.lower = lower
+        self.upper = upper
+        self.features = list(features)
+        self.cluster_names = cluster_names
+        self.reference_centers = np.array(reference_centers, dtype=np.float64)
+        self.dataset_version = dataset_version
+        self.seconds = seconds
+
+    @property
+    def n_bootstrap(self):
+        return len(self.ari)
+
+    # Hasil hanya berlaku untuk model KMeans yang sama (centroid identik), fitur yang sama
+    # dan dataset yang sama dengan saat analisis dijalankan
+    def matches(self, kmeans, features, n_rows, dataset_version=None):
+        centers = np.asarray(kmeans.cluster_centers_, dtype=np.float64)
+        return (self.reference_centers.shape == centers.shape and np.array_equal(self.reference_centers, centers)
+                and self.features == list(features) and self.n_rows == n_rows
+                and self.dataset_version in (None, dataset_version))
+
+    # Rata-rata dan interval persentil ARI antar sampel bootstrap terhadap model utama
+    def ari_summary(self, level=CONFIDENCE):
+        tail = (1 - level) / 2 * 100
+        return float(np.mean(self.ari)), float(np.percentile(self.ari, tail)), float(np.percentile(self.ari, 100 - tail))
+
+    # Tabel rata-rata fitur per cluster dengan interval kepercayaan, satu baris per cluster
+    def mean_table(self):
+        names = [self.cluster_names.get(c, f"Cluster {c}") for c in range(self.k)]
+        table = pd.DataFrame({'Nama Cluster': names})
+        for j, feature in enumerate(self.features):
+            table[feature] = self.means[:, j]
+            table[f"{feature} (batas bawah)"] = self.lower[:, j]
+            table[f"{feature} (batas atas)"] = self.upper[:, j]
+        return table.sort_values('Nama Cluster').reset_index(drop=True)
+
+    # Rata-rata keyakinan cluster (proporsi sampel dengan label sama) per cluster referensi
+    def cluster_confidence(self, labels):
+        frame = pd.DataFrame({'Cluster': labels, 'Keyakinan': self.confidence})
+        summary = frame.groupby('Cluster')['Keyakinan'].agg(['mean', 'min', 'size'])
+        summary.index = [self.cluster_names.get(c, f"Cluster {c}") for c in summary.index]
+        summary.index.name = 'Nama Cluster'
+        summary.columns = ['Keyakinan Rata-rata', 'Keyakinan Terendah', 'Jumlah Jurusan']
+        return summary.sort_index()
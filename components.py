@@ -0,0 +1,167 @@
+import html
+import math
+from concurrent.futures import as_completed
+
+import numpy as np
+import streamlit as st
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+# Tabel berhalaman yang dilayani dari TableIndex: hanya baris pada halaman aktif yang
+# diambil dari DataFrame dan dikirim ke browser. Urutan, jumlah baris dan pencarian
+# (prefiks Nama Jurusan / Nama PTN) seluruhnya berasal dari indeks.
+def paginated_table(df, index, columns, key, group=None, default_sort=None):
+    col1, col2, col3, col4 = st.columns([2, 1, 2, 1])
+
+    with col1:
+        sort_column = st.selectbox(
+            "Urutkan berdasarkan:",
+            index.sort_columns,
+            index=index.sort_columns.index(default_sort) if default_sort in index.sort_columns else 0,
+            key=f"{key}_sort"
+        )
+
+    with col2:
+        ascending = st.checkbox("Urutan Naik", value=False, key=f"{key}_asc")
+
+    with col3:
+        query = st.text_input("🔍 Cari Jurusan / PTN:", key=f"{key}_query", placeholder="Awalan nama...")
+
+    with col4:
+        page_size = st.selectbox("Baris per halaman:", PAGE_SIZES, index=1, key=f"{key}_size")
+
+    # Total baris dulu (dari indeks) agar nomor halaman bisa dibatasi
+    total = index.count(group=group, query=query)
+    n_pages = max(1, math.ceil(total / page_size))
+    page = st.number_input(f"Halaman (dari {n_pages}):", min_value=1, max_value=n_pages,
+                           value=1, step=1, key=f"{key}_page_{n_pages}")
+
+    rows, total = index.page(sort_column, ascending, page - 1, page_size, group=group, query=query)
+    if total == 0:
+        st.info("Tidak ada jurusan yang cocok.")
+        return
+
+    first = (page - 1) * page_size + 1
+    st.caption(f"Menampilkan {first:,}–{first + len(rows) - 1:,} dari {total:,} jurusan")
+    st.dataframe(df.iloc[rows][columns], use_container_width=True)
+
+
+# Pembangun grafik paralel: setiap grafik langsung mendapat placeholder (st.empty) di posisinya,
+# builder dijalankan di thread pool, lalu placeholder diisi sesuai urutan selesai.
+# Builder tidak boleh memanggil st.*; hanya thread skrip yang menulis ke halaman.
+class ChartPool:
+    def __init__(self, executor, render):
+        self.executor = executor
+        self.render = render
+        self.pending = {}
+
+    def submit(self, builder, *args, **kwargs):
+        placeholder = st.empty()
+        placeholder.caption("⏳ Memuat grafik...")
+        future = self.executor.submit(builder, *args, **kwargs)
+        self.pending[future] = placeholder
+        return future
+
+    def wait(self):
+        for future in as_completed(self.pending):
+            placeholder = self.pending[future]
+            try:
+                fig = future.result()
+            except Exception as e:
+                placeholder.error(f"❌ Error dalam membuat grafik: {e}")
+                continue
+            with placeholder.container():
+                self.render(fig)
+        self.pending.clear()
+
+
+CARD_TEMPLATE = (
+    '<div class="rec-card">'
+    '<div class="rec-rank">{rank}</div>'
+    '<div class="rec-body">'
+    '<h3>{jurusan}</h3>'
+    '<p><strong>{ptn}</strong> - {fakultas}</p>'
+    '<p><strong>Lokasi:</strong> {lokasi}{jarak} | <strong>Akreditasi:</strong> {akreditasi}</p>'
+    '<div class="rec-metrics">'
+    '<div class="rec-metric"><span>👥 Peminat 2024</span><b>{peminat}</b></div>'
+    '<div class="rec-metric"><span>💰 Gaji Awal</span><b>Rp {gaji_min:,} - {gaji_max:,}</b></div>'
+    '<div class="rec-metric"><span>🎓 Kelulusan</span><b>{kelulusan}%</b></div>'
+    '{peluang}'
+    '</div>'
+    '<p><strong>💼 Prospek Kerja Utama:</strong> {prospek_utama}</p>'
+    '<p><strong>🔄 Prospek Kerja Alternatif:</strong> {prospek_alternatif}</p>'
+    '<p><strong>📚 Tingkat Kesulitan:</strong> {kesulitan} | <strong>⚔️ Persaingan Kerja:</strong> {persaingan}</p>'
+    '<p><strong>💡 Saran untuk jurusan ini:</strong></p>'
+    '<ul><li>{saran_peluang}</li><li>{saran_tunggu}</li><li>{saran_industri}</li></ul>'
+    '</div>'
+    '</div>'
+)
+
+TEXT_FIELDS = {
+    'jurusan': 'Nama Jurusan',
+    'ptn': 'Nama PTN',
+    'fakultas': 'Fakultas',
+    'lokasi': 'Lokasi',
+    'akreditasi': 'Akreditasi',
+    'prospek_utama': 'Prospek Kerja Utama',
+    'prospek_alternatif': 'Prospek Kerja Alternatif',
+    'kesulitan': 'Tingkat Kesulitan',
+    'persaingan': 'Tingkat Persaingan Kerja',
+}
+
+
+# Semua kartu rekomendasi diformat sekaligus dari array kolom menjadi satu payload HTML,
+# sehingga jumlah elemen yang dikirim ke browser tetap satu berapapun jumlah rekomendasinya
+def recommendation_cards_html(recommendations, avg_peminat, avg_gaji):
+    columns = {key: [html.escape(str(value)) for value in recommendations[column].tolist()]
+               for key, column in TEXT_FIELDS.items()}
+    peminat = recommendations['Peminat 2024'].to_numpy()
+    gaji_max = recommendations['Gaji Awal Max'].to_numpy()
+    saran_peluang = np.where(
+        (peminat < avg_peminat) & (gaji_max > avg_gaji),
+        "✅ Jurusan ini memiliki gaji tinggi dengan peminat relatif sedikit, peluang bagus!",
+        "⚠️ Perhatikan rasio keketatan untuk menilai peluang masuk"
+    )
+    saran_tunggu = np.where(
+        recommendations['Maks. Waktu Tunggu Kerja (Bulan)'].to_numpy() < 24,
+        "✅ Waktu tunggu kerja singkat, prospek cepat bekerja",
+        "⚠️ Siapkan diri untuk waktu tunggu kerja yang moderat"
+    )
+    saran_industri = np.where(
+        recommendations['Kebutuhan Industri'].to_numpy() == 'Tinggi',
+        "✅ Kebutuhan industri tinggi, peluang kerja jangka panjang baik",
+        "⚠️ Perlu keterampilan tambahan untuk meningkatkan daya saing"
+    )
+    # Jarak dari kota asal hanya ada bila filter radius aktif
+    if 'Jarak (km)' in recommendations:
+        jarak = [f" ({value:,} km)" for value in recommendations['Jarak (km)'].tolist()]
+    else:
+        jarak = [''] * len(recommendations)
+    # Peluang masuk hanya ada bila kolom hasil simulasi ditambahkan pemanggil
+    if 'Peluang Masuk (%)' in recommendations:
+        peluang = [f'<div class="rec-metric"><span>🎯 Peluang Masuk</span><b>{value}%</b></div>'
+                   for value in recommendations['Peluang Masuk (%)'].tolist()]
+    else:
+        peluang = [''] * len(recommendations)
+    rows = zip(
+        *columns.values(), jarak, peluang, peminat.tolist(), recommendations['Gaji Awal Min'].tolist(), gaji_max.tolist(),
+        recommendations['Tingkat Kelulusan (%)'].tolist(), saran_peluang, saran_tunggu, saran_industri
+    )
+    keys = list(columns) + ['jarak', 'peluang', 'peminat', 'gaji_min', 'gaji_max', 'kelulusan',
+                            'saran_peluang', 'saran_tunggu', 'saran_industri']
+    cards = [CARD_TEMPLATE.format(rank=i + 1, **dict(zip(keys, row))) for i, row in enumerate(rows)]
+    return '<div class="rec-cards">' + ''.join(cards) + '</div>'
+
+
+SIMILAR_COLUMNS = ['Nama Jurusan', 'Nama PTN', 'Lokasi', 'Peminat 2024', 'Rasio Keketatan',
+                   'Tingkat Kelulusan (%)', 'Gaji Awal Min', 'Gaji Awal Max']
+
+
+# Tabel jurusan serupa untuk satu baris katalog, langsung dari graf tetangga terdekat
+# (tanpa menghitung similarity ulang); makin kecil jarak fitur makin mirip
+def similar_programs(df, graph, row, n=10, columns=SIMILAR_COLUMNS):
+    rows, distances = graph.similar(row, n)
+    similar = df.iloc[rows][columns].copy()
+    similar.insert(0, 'Jarak Fitur', np.round(distances.astype(float), 3))
+    return similar
@@ -0,0 +1,159 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from geo import KOTA_COORDS, KOTA_PROVINSI, PROVINSI_PULAU, WILAYAH_LAIN
+
+# Variabel kategorikal yang dapat dipilih di halaman Analisis Cluster
+CATEGORICAL_COLUMNS = ['Tingkat Kesulitan', 'Tingkat Persaingan Kerja', 'Kebutuhan Industri', 'Akreditasi']
+
+# Kolom tambahan untuk drilldown dua arah (misalnya Lokasi x Fakultas x cluster)
+DRILLDOWN_COLUMNS = ['Lokasi', 'Fakultas']
+
+# Tingkat wilayah peta (dari paling rinci) dan ukuran rata-rata per wilayah (label -> kolom)
+GEO_LEVELS = ['Kota', 'Provinsi', 'Pulau']
+GEO_MEASURES = {
+    'Rata-rata Gaji Max': 'Gaji Awal Max',
+    'Rata-rata Peminat': 'Peminat 2024',
+    'Rata-rata Rasio Keketatan': 'Rasio Keketatan',
+}
+
+
+# Kubus kontingensi cluster x kategori yang dihitung sekali per versi (dataset, model).
+# Setiap kolom kategorikal disimpan sebagai kode integer sehingga tabel silang cukup
+# dihitung dengan np.bincount; pergantian variabel di halaman menjadi lookup biasa.
+# Kubus drilldown untuk setiap pasangan drilldown_columns juga dihitung di sini, sehingga
+# objek tidak berubah lagi setelah dibangun (dipakai bersama oleh semua sesi).
+class ContingencyCube:
+    def __init__(self, df, cluster_labels, cluster_names, columns=CATEGORICAL_COLUMNS, drilldown_columns=()):
+        self.cluster_labels = np.asarray(cluster_labels, dtype=np.int64)
+        self.n_clusters = int(self.cluster_labels.max()) + 1 if len(self.cluster_labels) else 0
+        self.cluster_names = [cluster_names.get(c, f"Cluster {c}") for c in range(self.n_clusters)]
+        self.codes = {}
+        self.categories = {}
+        self.tables = {}
+        self.drilldowns = {}
+        for column in columns:
+            self.add_column(df, column)
+        for row_column, col_column in combinations(drilldown_columns, 2):
+            self.drilldowns[row_column, col_column] = self._drilldown_counts(row_column, col_column)
+
+    # Menyimpan kode integer kolom (kategori diurutkan seperti pd.crosstab) dan tabel cluster x kategori
+    def add_column(self, df, column):
+        codes, categories = pd.factorize(df[column], sort=True)
+        self.codes[column] = codes.astype(np.int64)
+        self.categories[column] = categories
+        self.tables[column] = self._count(self.cluster_labels, codes, len(categories))
+
+    def _count(self, row_codes, col_codes, n_cols, n_rows=None):
+        n_rows = self.n_clusters if n_rows is None else n_rows
+        valid = (row_codes >= 0) & (col_codes >= 0)
+        flat = row_codes[valid] * n_cols + col_codes[valid]
+        return np.bincount(flat, minlength=n_rows * n_cols).reshape(n_rows, n_cols)
+
+    # Setara dengan pd.crosstab(df['Nama Cluster'], df[column]) (dinormalisasi per baris bila diminta)
+    def table(self, column, normalize=False):
+        counts = self.tables[column]
+        present = counts.sum(axis=1) > 0
+        table = pd.DataFrame(
+            counts[present],
+            index=pd.Index(np.array(self.cluster_names, dtype=object)[present], name='Nama Cluster'),
+            columns=pd.Index(self.categories[column], name=column),
+        )
+        # Nama cluster yang sama digabung dan diurutkan seperti index pd.crosstab
+        table = table.loc[:, table.sum(axis=0) > 0].groupby(level=0).sum()
+        if normalize:
+            table = table.div(table.sum(axis=1), axis=0)
+        return table
+
+    # Kubus cluster x baris x kolom untuk satu pasangan kolom
+    def _drilldown_counts(self, row_column, col_column):
+        n_rows = len(self.categories[row_column])
+        n_cols = len(self.categories[col_column])
+        row_codes = self.codes[row_column]
+        col_codes = self.codes[col_column]
+        valid = (row_codes >= 0) & (col_codes >= 0)
+        flat = (self.cluster_labels[valid] * n_rows + row_codes[valid]) * n_cols + col_codes[valid]
+        return np.bincount(flat, minlength=self.n_clusters * n_rows * n_cols).reshape(self.n_clusters, n_rows, n_cols)
+
+    # Drilldown dua arah, misalnya Lokasi x Fakultas untuk satu cluster (atau semua cluster).
+    # Pasangan dengan urutan terbalik dibaca sebagai transpos kubus yang tersimpan.
+    def drilldown(self, row_column, col_column, cluster=None):
+        if (row_column, col_column) in self.drilldowns:
+            cube = self.drilldowns[row_column, col_column]
+        elif (col_column, row_column) in self.drilldowns:
+            cube = self.drilldowns[col_column, row_column].transpose(0, 2, 1)
+        else:
+            raise KeyError(f"Drilldown {row_column} x {col_column} tidak dihitung saat artefak dibangun")
+        counts = cube.sum(axis=0) if cluster is None else cube[cluster]
+        table = pd.DataFrame(
+            counts,
+            index=pd.Index(self.categories[row_column], name=row_column),
+            columns=pd.Index(self.categories[col_column], name=col_column),
+        )
+        return table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+
+
+# Kubus rollup geografis kota -> provinsi -> pulau. Jumlah baris dan jumlah nilai setiap
+# ukuran dihitung sekali per kota (np.bincount berbobot, satu lintasan atas tabel), lalu
+# dijumlahkan ke provinsi dan pulau; rata-rata diturunkan dari jumlah, sehingga setiap
+# tingkat tepat sama dengan groupby langsung. Titik peta wilayah = rata-rata koordinat
+# kota anggotanya, dibobot jumlah jurusan.
+class GeoRollupCube:
+    def __init__(self, df, coords=KOTA_COORDS, provinces=KOTA_PROVINSI, islands=PROVINSI_PULAU,
+                 measures=GEO_MEASURES, location_column='Lokasi'):
+        self.measures = dict(measures)
+        codes, cities = pd.factorize(df[location_column].astype(str), sort=True)
+        cities = np.asarray(cities, dtype=object)
+
+        # Total per kota: jumlah baris, jumlah nilai dan jumlah nilai valid per ukuran
+        totals = {'count': np.bincount(codes, minlength=len(cities)).astype(float)}
+        for label, column in self.measures.items():
+            values = df[column].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            totals[label, 'sum'] = np.bincount(codes[valid], weights=values[valid], minlength=len(cities))
+            totals[label, 'n'] = np.bincount(codes[valid], minlength=len(cities)).astype(float)
+        # Koordinat dikali jumlah jurusan agar rollup menghasilkan pusat berbobot
+        latlon = np.array([coords.get(city, [np.nan, np.nan]) for city in cities], dtype=float).reshape(-1, 2)
+        located = ~np.isnan(latlon).any(axis=1)
+        totals['located'] = np.where(located, totals['count'], 0.0)
+        totals['lat'] = np.where(located, latlon[:, 0] * totals['count'], 0.0)
+        totals['lon'] = np.where(located, latlon[:, 1] * totals['count'], 0.0)
+
+        city_provinces = np.array([provinces.get(city, WILAYAH_LAIN) for city in cities], dtype=object)
+        province_codes, province_names = pd.factorize(city_provinces, sort=True)
+        province_names = np.asarray(province_names, dtype=object)
+        province_islands = np.array([islands.get(name, WILAYAH_LAIN) for name in province_names], dtype=object)
+        island_codes, island_names = pd.factorize(province_islands, sort=True)
+        island_names = np.asarray(island_names, dtype=object)
+
+        province_totals = self._rollup(totals, province_codes, len(province_names))
+        island_totals = self._rollup(province_totals, island_codes, len(island_names))
+        self.levels = {
+            'Kota': self._frame('Kota', cities, totals, parents=city_provinces),
+            'Provinsi': self._frame('Provinsi', province_names, province_totals, parents=province_islands),
+            'Pulau': self._frame('Pulau', island_names, island_totals),
+        }
+
+    # Menjumlahkan total anak ke wilayah induknya
+    @staticmethod
+    def _rollup(totals, parent_codes, size):
+        return {key: np.bincount(parent_codes, weights=values, minlength=size) for key, values in totals.items()}
+
+    def _frame(self, level, names, totals, parents=None):
+        frame = pd.DataFrame({level: names, 'Jumlah Jurusan': totals['count'].astype(np.int64)})
+        if parents is not None:
+            frame[GEO_LEVELS[GEO_LEVELS.index(level) + 1]] = parents
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for label in self.measures:
+                frame[label] = totals[label, 'sum'] / totals[label, 'n']
+            frame['lat'] = totals['lat'] / totals['located']
+            frame['lon'] = totals['lon'] / totals['located']
+        # Urutan seperti value_counts: jumlah jurusan menurun, lalu nama
+        return frame.sort_values(['Jumlah Jurusan', level], ascending=[False, True], kind='stable',
+                                 ignore_index=True)
+
+    # Ringkasan satu tingkat wilayah (lookup, tanpa groupby ulang)
+    def level(self, level):
+        return self.levels[level]
@@ -0,0 +1,72 @@
+import hashlib
+import os
+
+import joblib
+import pandas as pd
+
+DATASET_PATH = 'dataset/Dataset_Kelompok_10D.csv'
+MODELS_DIR = 'models'
+
+
+# Path dataset yang tersedia: dataset/ lebih dulu, lalu direktori kerja
+def resolve_dataset_path(path=None):
+    candidates = [path] if path else [DATASET_PATH, 'Dataset_Kelompok_10D.csv']
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate
+    raise FileNotFoundError(f"File dataset tidak ditemukan: {', '.join(candidates)}")
+
+
+# Membaca dataset dari direktori dataset/ atau dari direktori kerja.
+# File .parquet (format kolumnar) dibaca dengan pd.read_parquet.
+def read_dataset(path=None):
+    path = resolve_dataset_path(path)
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+# Membaca model hasil training.py
+def read_models(models_dir=MODELS_DIR):
+    models = {}
+    models['kmeans'] = joblib.load(f'{models_dir}/kmeans_model.pkl')
+    models['scaler'] = joblib.load(f'{models_dir}/scaler.pkl')
+    models['pca'] = joblib.load(f'{models_dir}/pca_model.pkl')
+    models['rf'] = joblib.load(f'{models_dir}/random_forest_model.pkl')
+    # Keluarga model KMeans k=2..10 (opsional: model dari training lama belum memilikinya)
+    family_path = f'{models_dir}/cluster_family.pkl'
+    models['cluster_family'] = joblib.load(family_path) if os.path.exists(family_path) else None
+    # Hasil analisis stabilitas bootstrap dari stability.py (opsional)
+    stability_path = f'{models_dir}/cluster_stability.pkl'
+    models['cluster_stability'] = joblib.load(stability_path) if os.path.exists(stability_path) else None
+    return models
+
+
+_fingerprints = {}
+
+
+# Hash isi file (SHA-256), disimpan per (path, mtime, ukuran) agar tidak dihitung ulang setiap rerun
+def file_fingerprint(path):
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _fingerprints:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        _fingerprints[key] = digest.hexdigest()
+    return _fingerprints[key]
+
+
+# Versi dataset dan model; artefak turunan (kubus, indeks, dsb.) di-cache per versi ini
+def dataset_version(path=None):
+    return file_fingerprint(resolve_dataset_path(path))[:16]
+
+
+def models_version(models_dir=MODELS_DIR):
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(models_dir)):
+        if name.endswith('.pkl'):
+            digest.update(name.encode('utf-8'))
+            digest.update(file_fingerprint(os.path.join(models_dir, name)).encode('ascii'))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,243 @@
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+# Radius rata-rata bumi (km) untuk metrik haversine
+EARTH_RADIUS_KM = 6371.0088
+
+# Koordinat [lat, lon] kota-kota PTN di Indonesia
+# Sumber: Google Maps atau sumber terbuka lainnya
+KOTA_COORDS = {
+    'Jakarta': [-6.2088, 106.8456],
+    'Bandung': [-6.9175, 107.6191],
+    'Surabaya': [-7.2575, 112.7521],
+    'Yogyakarta': [-7.7971, 110.3688],
+    'Makassar': [-5.1477, 119.4327],
+    'Semarang': [-7.0051, 110.4381],
+    'Medan': [3.5896, 98.6739],
+    'Malang': [-7.9797, 112.6304],
+    'Padang': [-0.9198, 100.3531],
+    'Denpasar': [-8.6705, 115.2126],
+    'Aceh': [4.6951, 96.7494],
+    'Palembang': [-2.9761, 104.7754],
+    'Banjarmasin': [-3.3186, 114.5944],
+    'Manado': [1.4748, 124.8420],
+    'Lampung': [-5.4531, 105.2522],
+    'Jember': [-8.1690, 113.7007],
+    'Samarinda': [-0.5022, 117.1536],
+    'Purwokerto': [-7.4249, 109.2353],
+    'Solo': [-7.5695, 110.8274],
+    'Bogor': [-6.5971, 106.8060],
+    'Depok': [-6.4025, 106.7942],
+    'Mataram': [-8.5833, 116.1167],
+    'Pekanbaru': [0.5103, 101.4478],
+    'Pontianak': [-0.0263, 109.3425],
+    'Jayapura': [-2.5916, 140.6690],
+    'Kupang': [-10.1771, 123.6070],
+    'Ambon': [-3.6554, 128.1908],
+    'Gorontalo': [0.5387, 123.0622],
+    'Bengkulu': [-3.7928, 102.2608],
+    'Jambi': [-1.6101, 103.6131],
+    'Palangkaraya': [-2.2136, 113.9108],
+    'Kendari': [-3.9985, 122.5127],
+    'Palu': [-0.9003, 119.8779],
+    'Ternate': [0.7833, 127.3833],
+    'Sorong': [-0.8663, 131.2507],
+    # Lokasi lain yang muncul di dataset
+    'Banda Aceh': [5.5483, 95.3238],
+    'Bangkalan': [-7.0455, 112.7351],
+    'Banyuwangi': [-8.2192, 114.3691],
+    'Jatinangor': [-6.9261, 107.7756],
+    'Manokwari': [-0.8615, 134.0620],
+    'Pangandaran': [-7.6833, 108.6500],
+    'Pangkalpinang': [-2.1316, 106.1169],
+    'Pematangsiantar': [2.9595, 99.0687],
+    'Serang': [-6.1200, 106.1503],
+    'Sidenreng Rappang': [-3.9175, 119.7860],
+    'Surakarta': [-7.5695, 110.8274],
+    'Tanjungpinang': [0.9186, 104.4665],
+    'Tegal': [-6.8694, 109.1402],
+}
+
+
+# Hierarki wilayah untuk rollup peta: kota -> provinsi -> pulau
+KOTA_PROVINSI = {
+    'Jakarta': 'DKI Jakarta',
+    'Bandung': 'Jawa Barat',
+    'Bogor': 'Jawa Barat',
+    'Depok': 'Jawa Barat',
+    'Jatinangor': 'Jawa Barat',
+    'Pangandaran': 'Jawa Barat',
+    'Serang': 'Banten',
+    'Semarang': 'Jawa Tengah',
+    'Purwokerto': 'Jawa Tengah',
+    'Solo': 'Jawa Tengah',
+    'Surakarta': 'Jawa Tengah',
+    'Tegal': 'Jawa Tengah',
+    'Yogyakarta': 'DI Yogyakarta',
+    'Surabaya': 'Jawa Timur',
+    'Malang': 'Jawa Timur',
+    'Jember': 'Jawa Timur',
+    'Bangkalan': 'Jawa Timur',
+    'Banyuwangi': 'Jawa Timur',
+    'Aceh': 'Aceh',
+    'Banda Aceh': 'Aceh',
+    'Medan': 'Sumatera Utara',
+    'Pematangsiantar': 'Sumatera Utara',
+    'Padang': 'Sumatera Barat',
+    'Pekanbaru': 'Riau',
+    'Tanjungpinang': 'Kepulauan Riau',
+    'Jambi': 'Jambi',
+    'Palembang': 'Sumatera Selatan',
+    'Pangkalpinang': 'Kepulauan Bangka Belitung',
+    'Bengkulu': 'Bengkulu',
+    'Lampung': 'Lampung',
+    'Denpasar': 'Bali',
+    'Mataram': 'Nusa Tenggara Barat',
+    'Kupang': 'Nusa Tenggara Timur',
+    'Pontianak': 'Kalimantan Barat',
+    'Palangkaraya': 'Kalimantan Tengah',
+    'Banjarmasin': 'Kalimantan Selatan',
+    'Samarinda': 'Kalimantan Timur',
+    'Manado': 'Sulawesi Utara',
+    'Gorontalo': 'Gorontalo',
+    'Palu': 'Sulawesi Tengah',
+    'Makassar': 'Sulawesi Selatan',
+    'Sidenreng Rappang': 'Sulawesi Selatan',
+    'Kendari': 'Sulawesi Tenggara',
+    'Ambon': 'Maluku',
+    'Ternate': 'Maluku Utara',
+    'Jayapura': 'Papua',
+    'Manokwari': 'Papua Barat',
+    'Sorong': 'Papua Barat Daya',
+}
+
+PROVINSI_PULAU = {
+    'Aceh': 'Sumatera',
+    'Sumatera Utara': 'Sumatera',
+    'Sumatera Barat': 'Sumatera',
+    'Riau': 'Sumatera',
+    'Kepulauan Riau': 'Sumatera',
+    'Jambi': 'Sumatera',
+    'Sumatera Selatan': 'Sumatera',
+    'Kepulauan Bangka Belitung': 'Sumatera',
+    'Bengkulu': 'Sumatera',
+    'Lampung': 'Sumatera',
+    'DKI Jakarta': 'Jawa',
+    'Jawa Barat': 'Jawa',
+    'Banten': 'Jawa',
+    'Jawa Tengah': 'Jawa',
+    'DI Yogyakarta': 'Jawa',
+    'Jawa Timur': 'Jawa',
+    'Bali': 'Bali & Nusa Tenggara',
+    'Nusa Tenggara Barat': 'Bali & Nusa Tenggara',
+    'Nusa Tenggara Timur': 'Bali & Nusa Tenggara',
+    'Kalimantan Barat': 'Kalimantan',
+    'Kalimantan Tengah': 'Kalimantan',
+    'Kalimantan Selatan': 'Kalimantan',
+    'Kalimantan Timur': 'Kalimantan',
+    'Sulawesi Utara': 'Sulawesi',
+    'Gorontalo': 'Sulawesi',
+    'Sulawesi Tengah': 'Sulawesi',
+    'Sulawesi Selatan': 'Sulawesi',
+    'Sulawesi Tenggara': 'Sulawesi',
+    'Maluku': 'Maluku',
+    'Maluku Utara': 'Maluku',
+    'Papua': 'Papua',
+    'Papua Barat': 'Papua',
+    'Papua Barat Daya': 'Papua',
+}
+
+# Wilayah untuk lokasi yang tidak ada di peta hierarki
+WILAYAH_LAIN = 'Lainnya'
+
+
+# Jarak haversine (km) secara vektor; argumen dalam derajat dan dapat di-broadcast
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=float)) for value in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+# Indeks geospasial kampus: BallTree haversine atas titik koordinat unik (kota), lalu baris
+# jurusan dikelompokkan per titik (offset ala CSR). Query radius dan k-terdekat cukup
+# menelusuri titik; jarak setiap baris diturunkan dari jarak titiknya tanpa memindai tabel.
+class CampusIndex:
+    def __init__(self, df, coords=KOTA_COORDS, location_column='Lokasi'):
+        self.n_rows = len(df)
+        self.coords = coords
+        codes, points = pd.factorize(df[location_column].astype(str), sort=True)
+        self.points = np.asarray(points, dtype=object)
+        known = np.array([point in coords for point in self.points], dtype=bool)
+        self.latlon = np.array([coords.get(point, [np.nan, np.nan]) for point in self.points],
+                               dtype=float).reshape(-1, 2)
+
+        # Titik tanpa koordinat tidak masuk tree; barisnya tidak pernah muncul di hasil
+        self.missing = self.points[~known].tolist()
+        self.tree_points = np.flatnonzero(known)
+        self.tree = BallTree(np.radians(self.latlon[self.tree_points]), metric='haversine') \
+            if len(self.tree_points) else None
+
+        self.point_codes = codes
+        self.point_rows = np.argsort(codes, kind='stable')
+        self.point_offsets = np.searchsorted(codes[self.point_rows], np.arange(len(self.points) + 1))
+
+    # Koordinat (lat, lon) kota asal, atau None bila tidak dikenal
+    def location(self, name):
+        latlon = self.coords.get(name)
+        return None if latlon is None else tuple(latlon)
+
+    # Jarak (km) setiap baris ke titik asal, dihitung per titik lalu disebar ke baris
+    def row_distances(self, lat, lon):
+        distances = haversine_km(lat, lon, self.latlon[:, 0], self.latlon[:, 1])
+        return distances[self.point_codes]
+
+    # Baris (dan jaraknya) untuk titik-titik tree yang dipilih, dibatasi `allowed` (mask baris).
+    # Titik diurutkan menurut jarak (lalu kode titik) dan baris tiap titik sudah urut posisi,
+    # sehingga hasil gabungan langsung terurut menurut jarak tanpa mengurutkan ulang baris.
+    def _expand(self, tree_ids, distances, allowed):
+        order = np.lexsort((tree_ids, distances))
+        points = self.tree_points[tree_ids[order]]
+        distances = distances[order]
+        starts = self.point_offsets[points]
+        counts = self.point_offsets[points + 1] - starts
+        rows = (np.concatenate([self.point_rows[s:s + c] for s, c in zip(starts, counts)])
+                if len(points) else np.empty(0, dtype=np.int64))
+        row_distances = np.repeat(distances, counts)
+        if allowed is not None:
+            keep = allowed[rows]
+            rows, row_distances = rows[keep], row_distances[keep]
+        return rows, row_distances
+
+    # Baris dalam radius (km) dari titik asal, terurut menurut jarak
+    def within_radius(self, lat, lon, radius_km, allowed=None):
+        if self.tree is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        query = np.radians([[lat, lon]])
+        ids, distances = self.tree.query_radius(query, r=radius_km / EARTH_RADIUS_KM, return_distance=True)
+        return self._expand(ids[0], distances[0] * EARTH_RADIUS_KM, allowed)
+
+    # k baris terdekat dari titik asal. Tanpa filter hanya titik yang dibutuhkan untuk k baris
+    # yang dibuka; dengan `allowed` jumlah titik yang ditanyakan ke tree digandakan sampai
+    # baris yang lolos cukup, sehingga filter rekomendasi tetap dihormati.
+    def nearest(self, lat, lon, k, allowed=None):
+        if self.tree is None or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        query = np.radians([[lat, lon]])
+        n_points = len(self.tree_points)
+        n_query = min(n_points, k)
+        while True:
+            distances, ids = self.tree.query(query, k=n_query)
+            ids, distances = ids[0], distances[0] * EARTH_RADIUS_KM
+            if allowed is None:
+                points = self.tree_points[ids]
+                counts = self.point_offsets[points + 1] - self.point_offsets[points]
+                needed = int(np.searchsorted(np.cumsum(counts), k)) + 1
+                # Titik lain yang sejarak dengan titik terakhir tetap diikutkan
+                needed = int(np.searchsorted(distances, distances[min(needed, n_query) - 1], 'right'))
+                ids, distances = ids[:needed], distances[:needed]
+            rows, row_distances = self._expand(ids, distances, allowed)
+            if len(rows) >= k or n_query == n_points:
+                return rows[:k], row_distances[:k]
+            n_query = min(n_points, n_query * 2)
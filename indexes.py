@@ -0,0 +1,423 @@
+import re
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+import pandas as pd
+
+
+# Top-k untuk metrik ad-hoc yang tidak punya permutasi terindeks: seleksi parsial O(n)
+# dengan np.argpartition lalu hanya k kandidat yang diurutkan. Nilai yang sama diurutkan
+# berdasarkan posisi baris, sehingga hasilnya sama dengan argsort stabil.
+def top_k(values, k, ascending=False):
+    values = np.asarray(values, dtype=float)
+    key = values if ascending else -values
+    k = min(k, len(key))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k == len(key):
+        return np.argsort(key, kind='stable')
+    threshold = key[np.argpartition(key, k - 1)[k - 1]]
+    better = np.flatnonzero(key < threshold)
+    ties = np.flatnonzero(key == threshold)[:k - len(better)]
+    candidates = np.concatenate([better, ties])
+    return candidates[np.lexsort((candidates, key[candidates]))]
+
+
+# Indeks tabel untuk paginasi: permutasi terurut per kolom (naik dan turun), baik untuk
+# seluruh tabel maupun per grup (misalnya cluster), sehingga satu halaman data cukup
+# diambil dengan slicing O(ukuran halaman) tanpa mengurutkan ulang DataFrame.
+class TableIndex:
+    def __init__(self, df, sort_columns, search_columns=(), group_labels=None):
+        self.n_rows = len(df)
+        self.sort_columns = list(sort_columns)
+        self.group_labels = None if group_labels is None else np.asarray(group_labels, dtype=np.int64)
+
+        # Offset awal/akhir setiap grup di dalam permutasi per grup
+        self.group_bounds = {}
+        if self.group_labels is not None:
+            groups_sorted = np.sort(self.group_labels)
+            for g in np.unique(groups_sorted):
+                self.group_bounds[int(g)] = (int(np.searchsorted(groups_sorted, g, 'left')),
+                                             int(np.searchsorted(groups_sorted, g, 'right')))
+
+        # Permutasi stabil per kolom dan arah; posisi (rank) dipakai untuk mengurutkan hasil pencarian
+        self.orders = {}
+        self.group_orders = {}
+        self.positions = {}
+        for column in self.sort_columns:
+            values = df[column].to_numpy(dtype=float)
+            for ascending in (True, False):
+                key = values if ascending else -values
+                order = np.argsort(key, kind='stable')
+                position = np.empty(self.n_rows, dtype=np.int64)
+                position[order] = np.arange(self.n_rows)
+                self.orders[column, ascending] = order
+                self.positions[column, ascending] = position
+                if self.group_labels is not None:
+                    # Grup sebagai kunci utama: baris satu grup bersebelahan dan sudah terurut
+                    self.group_orders[column, ascending] = order[np.argsort(self.group_labels[order], kind='stable')]
+
+        # Pencarian prefiks: nama unik (huruf kecil) terurut untuk bisect, dan baris dikelompokkan
+        # per kode nama (offset ala CSR) sehingga nama yang cocok memetakan ke satu rentang baris
+        self.search_keys = []
+        self.search_rows = []
+        self.search_offsets = []
+        for column in search_columns:
+            codes, uniques = pd.factorize(df[column].astype(str).str.lower(), sort=True)
+            order = np.argsort(codes, kind='stable')
+            self.search_keys.append(list(uniques))
+            self.search_rows.append(order)
+            self.search_offsets.append(np.searchsorted(codes[order], np.arange(len(uniques) + 1)))
+
+    # Jumlah baris dalam grup (atau seluruh tabel) langsung dari offset indeks
+    def count(self, group=None, query=None):
+        if query and query.strip():
+            return len(self._matches(query, group))
+        if group is None:
+            return self.n_rows
+        start, end = self.group_bounds.get(int(group), (0, 0))
+        return end - start
+
+    # Posisi baris yang salah satu kolom pencariannya diawali `query`
+    def search(self, query):
+        query = query.strip().lower()
+        matches = [np.empty(0, dtype=np.int64)]
+        for keys, rows, offsets in zip(self.search_keys, self.search_rows, self.search_offsets):
+            start = bisect_left(keys, query)
+            end = bisect_right(keys, query + '\uffff')
+            matches.append(rows[offsets[start]:offsets[end]])
+        return np.unique(np.concatenate(matches))
+
+    # Top-N untuk kolom yang terindeks cukup berupa slice permutasi
+    def top(self, column, n, ascending=False):
+        return self.orders[column, ascending][:n]
+
+    def _matches(self, query, group):
+        rows = self.search(query)
+        if group is not None:
+            rows = rows[self.group_labels[rows] == group]
+        return rows
+
+    # Mengembalikan (posisi baris untuk halaman ini, total baris yang cocok)
+    def page(self, column, ascending=True, page=0, page_size=25, group=None, query=None):
+        if query and query.strip():
+            rows = self._matches(query, group)
+            rows = rows[np.argsort(self.positions[column, ascending][rows])]
+            start = page * page_size
+            return rows[start:start + page_size], len(rows)
+
+        if group is None:
+            order = self.orders[column, ascending]
+            begin, end = 0, self.n_rows
+        else:
+            order = self.group_orders[column, ascending]
+            begin, end = self.group_bounds.get(int(group), (0, 0))
+        start = min(begin + page * page_size, end)
+        return order[start:min(start + page_size, end)], end - begin
+
+
+# Indeks rentang untuk filter numerik: per kolom permutasi terurut plus nilai terurutnya.
+# Predikat rentang dijawab dengan dua searchsorted (slice dari permutasi), lalu himpunan
+# kandidat dipersempit mulai dari predikat paling selektif: kandidat terkecil diperiksa
+# langsung terhadap kolom lain, sehingga biaya mengikuti ukuran hasil, bukan ukuran tabel.
+class RangeIndex:
+    def __init__(self, df, columns):
+        self.n_rows = len(df)
+        self.columns = list(columns)
+        self.values = {}
+        self.orders = {}
+        self.sorted_values = {}
+        for column in self.columns:
+            values = df[column].to_numpy(dtype=float)
+            order = np.argsort(values, kind='stable')
+            self.values[column] = values
+            self.orders[column] = order
+            self.sorted_values[column] = values[order]
+
+    # Offset [awal, akhir) di permutasi kolom untuk low <= nilai <= high (None = tanpa batas)
+    def bounds(self, column, low=None, high=None):
+        sorted_values = self.sorted_values[column]
+        start = 0 if low is None else int(np.searchsorted(sorted_values, low, 'left'))
+        # NaN berada di ujung urutan dan tidak pernah memenuhi predikat
+        end = int(np.searchsorted(sorted_values, np.inf if high is None else high, 'right'))
+        return start, max(start, end)
+
+    # Jumlah baris yang memenuhi satu predikat, tanpa menyentuh baris
+    def count(self, column, low=None, high=None):
+        start, end = self.bounds(column, low, high)
+        return end - start
+
+    # Posisi baris (urut naik) yang memenuhi semua predikat {kolom: (low, high)}
+    def query(self, predicates):
+        predicates = {column: bounds for column, bounds in predicates.items()
+                      if bounds is not None and bounds != (None, None)}
+        if not predicates:
+            return np.arange(self.n_rows)
+        spans = [(self.bounds(column, *bounds), column) for column, bounds in predicates.items()]
+        spans.sort(key=lambda span: span[0][1] - span[0][0])
+        (start, end), column = spans[0]
+        rows = self.orders[column][start:end]
+        for (start, end), column in spans[1:]:
+            if len(rows) == 0:
+                break
+            low, high = predicates[column]
+            values = self.values[column][rows]
+            keep = np.ones(len(rows), dtype=bool)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            rows = rows[keep]
+        return np.sort(rows)
+
+
+# Interval tree terpusat (centered interval tree) di atas array NumPy untuk interval
+# [start, end] per baris, misalnya rentang [Gaji Awal Min, Gaji Awal Max]. Setiap simpul
+# menyimpan interval yang memuat titik tengahnya, terurut menurut start (naik) dan end
+# (turun) dalam array datar, sehingga query titik cukup menelusuri satu jalur akar-daun
+# dengan searchsorted di tiap simpul: O(log n + k).
+class IntervalIndex:
+    def __init__(self, starts, ends):
+        starts = np.asarray(starts, dtype=float)
+        ends = np.asarray(ends, dtype=float)
+        self.n_rows = len(starts)
+        self.starts = starts
+        self.ends = ends
+        # Baris terurut menurut start dan menurut end (untuk rentang dan hitungan O(log n))
+        self.start_order = np.argsort(starts, kind='stable')
+        self.sorted_starts = starts[self.start_order]
+        self.sorted_ends = np.sort(ends)
+
+        # Simpul diproses berurutan (BFS); anak ditambahkan ke akhir daftar
+        centers, lefts, rights = [], [], []
+        by_start, by_end = [], []
+        pending = [np.arange(self.n_rows)] if self.n_rows else []
+        node = 0
+        while node < len(pending):
+            rows = pending[node]
+            center = float(np.median(np.concatenate([starts[rows], ends[rows]])))
+            left = ends[rows] < center
+            right = starts[rows] > center
+            here = rows[~left & ~right]
+            centers.append(center)
+            by_start.append(here[np.argsort(starts[here], kind='stable')])
+            by_end.append(here[np.argsort(-ends[here], kind='stable')])
+            lefts.append(-1)
+            rights.append(-1)
+            if left.any():
+                lefts[node] = len(pending)
+                pending.append(rows[left])
+            if right.any():
+                rights[node] = len(pending)
+                pending.append(rows[right])
+            pending[node] = None
+            node += 1
+
+        self.centers = np.array(centers, dtype=float)
+        self.lefts = np.array(lefts, dtype=np.int64)
+        self.rights = np.array(rights, dtype=np.int64)
+        # Array datar per simpul (offset ala CSR); nilai end disimpan negatif agar terurut naik
+        self.node_offsets = np.concatenate([[0], np.cumsum([len(rows) for rows in by_start])]).astype(np.int64)
+        self.node_rows_by_start = np.concatenate(by_start) if by_start else np.empty(0, dtype=np.int64)
+        self.node_rows_by_end = np.concatenate(by_end) if by_end else np.empty(0, dtype=np.int64)
+        self.node_starts = starts[self.node_rows_by_start]
+        self.node_neg_ends = -ends[self.node_rows_by_end]
+
+    @classmethod
+    def from_columns(cls, df, start_column, end_column):
+        return cls(df[start_column].to_numpy(dtype=float), df[end_column].to_numpy(dtype=float))
+
+    # Baris yang intervalnya memuat titik x (start <= x <= end)
+    def stab(self, x):
+        parts = [np.empty(0, dtype=np.int64)]
+        node = 0 if self.n_rows else -1
+        while node >= 0:
+            begin, end = self.node_offsets[node], self.node_offsets[node + 1]
+            center = self.centers[node]
+            if x <= center:
+                # Semua interval simpul ini berakhir >= center >= x; ambil yang start <= x
+                k = np.searchsorted(self.node_starts[begin:end], x, 'right')
+                parts.append(self.node_rows_by_start[begin:begin + k])
+                node = self.lefts[node] if x < center else -1
+            else:
+                # Semua interval simpul ini mulai <= center < x; ambil yang end >= x
+                k = np.searchsorted(self.node_neg_ends[begin:end], -x, 'right')
+                parts.append(self.node_rows_by_end[begin:begin + k])
+                node = self.rights[node]
+        return np.concatenate(parts)
+
+    # Posisi baris urut naik; untuk hasil besar mask O(n) lebih murah daripada sort O(k log k)
+    def _sorted(self, rows):
+        if len(rows) * 16 > self.n_rows:
+            mask = np.zeros(self.n_rows, dtype=bool)
+            mask[rows] = True
+            return np.flatnonzero(mask)
+        return np.sort(rows)
+
+    # Jumlah interval yang beririsan dengan [low, high] dalam O(log n):
+    # semua yang start <= high dikurangi yang sudah berakhir sebelum low
+    def count_overlaps(self, low, high):
+        return int(np.searchsorted(self.sorted_starts, high, 'right')
+                   - np.searchsorted(self.sorted_ends, low, 'left'))
+
+    # Baris yang beririsan dengan [low, high]: interval yang memuat low, ditambah
+    # interval yang dimulai di (low, high] (dua himpunan saling lepas)
+    def overlaps(self, low, high):
+        if low > high:
+            return np.empty(0, dtype=np.int64)
+        begin = np.searchsorted(self.sorted_starts, low, 'right')
+        end = np.searchsorted(self.sorted_starts, high, 'right')
+        return self._sorted(np.concatenate([self.stab(low), self.start_order[begin:end]]))
+
+    # Baris yang intervalnya mencakup seluruh [low, high] (start <= low dan end >= high)
+    def contains(self, low, high):
+        rows = self.stab(low)
+        return self._sorted(rows[self.ends[rows] >= high])
+
+    # Baris yang intervalnya berada di dalam [low, high] (start >= low dan end <= high)
+    def within(self, low, high):
+        begin = np.searchsorted(self.sorted_starts, low, 'left')
+        end = np.searchsorted(self.sorted_starts, high, 'right')
+        rows = self.start_order[begin:end]
+        return self._sorted(rows[self.ends[rows] <= high])
+
+
+# Token teks: huruf/angka berurutan dalam huruf kecil
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+
+# Trigram token dengan penanda awal/akhir, misalnya "data" -> " da", "dat", "ata", "ta "
+def trigrams(token):
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# Posisi semua elemen rentang CSR [start, start + count) tanpa loop Python
+def csr_positions(starts, counts):
+    ends = np.cumsum(counts)
+    if not len(ends) or ends[-1] == 0:
+        return np.empty(0, dtype=np.int64)
+    return np.arange(ends[-1]) + np.repeat(starts - (ends - counts), counts)
+
+
+# Indeks teks terbalik (inverted index) atas beberapa kolom teks. Setiap kolom difaktorkan
+# ke nilai unik, sehingga tokenisasi hanya dilakukan per nilai unik, bukan per baris.
+# Kosakata token terurut (pencarian prefiks dengan bisect), posting token -> nilai unik, dan
+# nilai unik -> baris disimpan sebagai array int32 dengan offset ala CSR. Token yang tidak
+# cocok secara prefiks dicari lewat indeks trigram kosakata (toleran salah ketik).
+class TextIndex:
+    def __init__(self, df, columns, weights=None):
+        self.n_rows = len(df)
+        self.columns = list(columns)
+        self.weights = np.array([(weights or {}).get(column, 1.0) for column in self.columns], dtype=np.float32)
+
+        # Nilai unik per kolom dan baris per nilai (CSR). Nilai unik semua kolom diberi id global
+        # (kolom diketahui dari value_base) dan baris semua kolom digabung dalam satu CSR
+        value_rows = []
+        value_offsets = []
+        value_tokens = []
+        value_base = [0]
+        for i, column in enumerate(self.columns):
+            codes, uniques = pd.factorize(df[column].astype(str), sort=True)
+            order = np.argsort(codes, kind='stable')
+            value_rows.append(order.astype(np.int32))
+            offsets = np.searchsorted(codes[order], np.arange(len(uniques) + 1)).astype(np.int64)
+            value_offsets.append(offsets[:-1] + i * self.n_rows)
+            value_tokens.extend(set(tokenize(value)) for value in uniques)
+            value_base.append(value_base[-1] + len(uniques))
+        self.value_base = np.array(value_base, dtype=np.int64)
+        self.value_columns = np.repeat(np.arange(len(self.columns)), np.diff(self.value_base)).astype(np.int32)
+        self.value_rows = np.concatenate(value_rows) if value_rows else np.empty(0, dtype=np.int32)
+        self.value_offsets = np.concatenate(value_offsets + [np.array([len(self.value_rows)], dtype=np.int64)])
+
+        # Kosakata terurut dan posting token -> id nilai
+        self.vocabulary = sorted(set().union(*value_tokens)) if value_tokens else []
+        token_ids = {token: i for i, token in enumerate(self.vocabulary)}
+        pairs = np.array([(token_ids[token], value) for value, tokens in enumerate(value_tokens)
+                          for token in tokens], dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        self.postings = pairs[:, 1].astype(np.int32)
+        self.posting_offsets = np.searchsorted(pairs[:, 0], np.arange(len(self.vocabulary) + 1)).astype(np.int64)
+
+        # Indeks trigram kosakata untuk pencocokan fuzzy
+        grams = sorted({gram for token in self.vocabulary for gram in trigrams(token)})
+        gram_ids = {gram: i for i, gram in enumerate(grams)}
+        pairs = np.array([(gram_ids[gram], token) for token, text in enumerate(self.vocabulary)
+                          for gram in trigrams(text)], dtype=np.int64).reshape(-1, 2)
+        pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+        self.trigram_keys = grams
+        self.trigram_tokens = pairs[:, 1].astype(np.int32)
+        self.trigram_offsets = np.searchsorted(pairs[:, 0], np.arange(len(grams) + 1)).astype(np.int64)
+        self.token_gram_counts = np.array([len(trigrams(token)) for token in self.vocabulary], dtype=np.int32)
+
+    # Id token yang diawali `prefix` (rentang kosakata terurut)
+    def _prefix_tokens(self, prefix):
+        start = bisect_left(self.vocabulary, prefix)
+        end = bisect_right(self.vocabulary, prefix + '\uffff')
+        return np.arange(start, end)
+
+    # Id token yang mirip `term` menurut kemiripan Jaccard trigram (>= min_similarity)
+    def _fuzzy_tokens(self, term, min_similarity):
+        query_grams = trigrams(term)
+        parts = []
+        for gram in query_grams:
+            i = bisect_left(self.trigram_keys, gram)
+            if i < len(self.trigram_keys) and self.trigram_keys[i] == gram:
+                parts.append(self.trigram_tokens[self.trigram_offsets[i]:self.trigram_offsets[i + 1]])
+        if not parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        tokens, shared = np.unique(np.concatenate(parts), return_counts=True)
+        similarity = shared / (len(query_grams) + self.token_gram_counts[tokens] - shared)
+        keep = similarity >= min_similarity
+        return tokens[keep], similarity[keep].astype(np.float32)
+
+    # Skor setiap nilai unik untuk satu kata kueri: token sama persis 1.0, berawalan kata 0.8,
+    # mirip (trigram, hanya bila tidak ada yang berawalan) 0.6 x kemiripan; dikali bobot kolom
+    def _value_scores(self, term, fuzzy, min_similarity):
+        tokens = self._prefix_tokens(term)
+        scores = np.full(len(tokens), 0.8)
+        # Kosakata terurut: token yang sama persis (bila ada) selalu yang pertama di rentang prefiks
+        if len(tokens) and self.vocabulary[tokens[0]] == term:
+            scores[0] = 1.0
+        if not len(tokens) and fuzzy and len(term) >= 3:
+            tokens, similarity = self._fuzzy_tokens(term, min_similarity)
+            scores = 0.6 * similarity
+        value_scores = np.zeros(self.value_base[-1], dtype=np.float32)
+        if len(tokens):
+            starts = self.posting_offsets[tokens]
+            counts = self.posting_offsets[tokens + 1] - starts
+            values = self.postings[csr_positions(starts, counts)]
+            np.maximum.at(value_scores, values, np.repeat(scores, counts).astype(np.float32))
+        return value_scores * self.weights[self.value_columns]
+
+    # Skor per baris dari skor nilai unik: hanya baris milik nilai yang cocok yang disentuh
+    # (satu baris dapat cocok di beberapa kolom; skornya dijumlahkan)
+    def _row_scores(self, value_scores):
+        matched = np.flatnonzero(value_scores)
+        starts = self.value_offsets[matched]
+        counts = self.value_offsets[matched + 1] - starts
+        rows = self.value_rows[csr_positions(starts, counts)]
+        weights = np.repeat(value_scores[matched], counts)
+        return np.bincount(rows, weights=weights, minlength=self.n_rows).astype(np.float32)
+
+    # Pencarian: setiap kata kueri harus cocok (prefiks atau fuzzy) di salah satu kolom.
+    # Mengembalikan (posisi `limit` baris terbaik, skornya, jumlah seluruh baris yang cocok).
+    def search(self, query, limit=20, fuzzy=True, min_similarity=0.4):
+        terms = tokenize(query)
+        if not terms or self.n_rows == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32), 0
+        total = None
+        for term in dict.fromkeys(terms):
+            scores = self._row_scores(self._value_scores(term, fuzzy, min_similarity))
+            if total is None:
+                total = scores
+            else:
+                # Baris yang tidak memuat kata ini gugur
+                total = np.where((total > 0) & (scores > 0), total + scores, 0)
+        n_matches = int(np.count_nonzero(total))
+        rows = top_k(total, min(limit, n_matches))
+        return rows, total[rows], n_matches
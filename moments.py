@@ -0,0 +1,214 @@
+# Statistik satu lintasan (streaming) untuk matriks korelasi: rata-rata, variansi dan
+# ko-momen dihitung per potongan data lalu digabung (Welford/Chan), sehingga dataset yang
+# tidak muat di memori cukup dibaca potongan demi potongan dan dapat diproses paralel.
+# Jalankan pada file besar:  python moments.py data.parquet --metode spearman
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+CORRELATION_METHODS = ('pearson', 'spearman')
+
+# Jumlah baris per potongan data
+CHUNK_ROWS = 100_000
+
+# Jumlah titik maksimum sketsa rank per kolom; di bawah batas ini rank dihitung persis
+SKETCH_SIZE = 4096
+
+# Di bawah ukuran ini DataFrame di memori diproses di proses yang sama
+PARALLEL_MIN_ROWS = 500_000
+
+
+# Akumulator momen yang dapat digabung: jumlah baris, rata-rata dan matriks ko-momen
+# (jumlah hasil kali simpangan). Baris yang mengandung NaN dilewati (complete-case).
+class MomentsAccumulator:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        self.comoment = np.zeros((len(self.columns), len(self.columns)))
+
+    def update(self, X):
+        X = X[~np.isnan(X).any(axis=1)]
+        if len(X) == 0:
+            return self
+        chunk = MomentsAccumulator(self.columns)
+        chunk.count = len(X)
+        chunk.mean = X.mean(axis=0)
+        deviation = X - chunk.mean
+        chunk.comoment = deviation.T @ deviation
+        return self.merge(chunk)
+
+    # Penggabungan Chan et al.: hasil sama dengan satu lintasan atas gabungan kedua potongan
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / count)
+        self.comoment = self.comoment + other.comoment + np.outer(delta, delta) * (self.count * other.count / count)
+        self.count = count
+        return self
+
+    def covariance(self, ddof=1):
+        return self.comoment / max(self.count - ddof, 1)
+
+    # Korelasi Pearson; kolom konstan bernilai NaN seperti DataFrame.corr
+    def correlation(self):
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.clip(self.comoment / np.outer(std, std), -1.0, 1.0)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    # Ringkasan per kolom: jumlah baris, rata-rata dan variansi sampel
+    def summary(self):
+        return pd.DataFrame({
+            'Jumlah Data': self.count,
+            'Rata-rata': self.mean,
+            'Variansi': np.diag(self.covariance()),
+        }, index=self.columns)
+
+
+# Sketsa distribusi satu kolom untuk rank mendekati: nilai unik terurut beserta bobotnya.
+# Bila jumlah nilai unik melebihi max_size, nilai bertetangga dipadatkan menjadi kelompok
+# berbobot sama (rata-rata berbobot), sehingga galat rank paling besar sekitar 1/max_size.
+class RankSketch:
+    def __init__(self, max_size=SKETCH_SIZE):
+        self.max_size = max_size
+        self.values = np.zeros(0)
+        self.weights = np.zeros(0)
+
+    def update(self, x):
+        values, counts = np.unique(x[~np.isnan(x)], return_counts=True)
+        return self._combine(values, counts.astype(np.float64))
+
+    def merge(self, other):
+        return self._combine(other.values, other.weights)
+
+    def _combine(self, values, weights):
+        values, inverse = np.unique(np.concatenate([self.values, values]), return_inverse=True)
+        weights = np.bincount(inverse, weights=np.concatenate([self.weights, weights]))
+        if len(values) > self.max_size:
+            cum = np.cumsum(weights)
+            bucket = np.minimum(((cum - weights / 2) / cum[-1] * self.max_size).astype(np.int64), self.max_size - 1)
+            total = np.bincount(bucket, weights=weights)
+            weighted = np.bincount(bucket, weights=values * weights)
+            keep = total > 0
+            values, weights = weighted[keep] / total[keep], total[keep]
+        self.values, self.weights = values, weights
+        return self
+
+    # Rank tengah ternormalisasi (0-1): rata-rata P(X < x) dan P(X <= x), sehingga nilai kembar
+    # mendapat rank rata-rata seperti pada korelasi Spearman
+    def rank(self, x):
+        cum = np.cumsum(self.weights)
+        mid = (cum - self.weights / 2) / cum[-1]
+        return np.interp(x, self.values, mid)
+
+
+# Potongan data numerik (float64) dari DataFrame, file Parquet (per batch) atau CSV (per chunk)
+def iter_chunks(source, columns, chunk_rows=CHUNK_ROWS):
+    if isinstance(source, pd.DataFrame):
+        X = source[columns].to_numpy(dtype=np.float64)
+        for start in range(0, len(X), chunk_rows):
+            yield X[start:start + chunk_rows]
+    elif str(source).endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()[columns].to_numpy(dtype=np.float64)
+    else:
+        for chunk in pd.read_csv(source, usecols=columns, chunksize=chunk_rows):
+            yield chunk[columns].to_numpy(dtype=np.float64)
+
+
+def _chunk_moments(columns, X):
+    return MomentsAccumulator(columns).update(X)
+
+
+def _chunk_sketches(X):
+    return [RankSketch().update(X[:, j]) for j in range(X.shape[1])]
+
+
+def _chunk_rank_moments(columns, sketches, X):
+    ranks = np.column_stack([sketch.rank(X[:, j]) for j, sketch in enumerate(sketches)])
+    ranks[np.isnan(X)] = np.nan
+    return MomentsAccumulator(columns).update(ranks)
+
+
+# Menjalankan func pada setiap potongan, di process pool bila workers > 1. Jumlah potongan
+# yang sedang diproses dibatasi agar memori tetap kecil; hasil dikembalikan sesuai urutan.
+def _map_chunks(func, chunks, workers):
+    if workers == 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+# Matriks korelasi dan ringkasan per kolom dalam satu lintasan data (Pearson) atau dua
+# lintasan (Spearman mendekati: lintasan pertama membangun sketsa rank per kolom, lintasan
+# kedua mengakumulasi momen atas rank). Mengembalikan (korelasi, ringkasan).
+def streaming_statistics(source, columns, method='pearson', chunk_rows=CHUNK_ROWS, workers=None):
+    if method not in CORRELATION_METHODS:
+        raise ValueError(f"Metode korelasi tidak dikenal: {method}")
+    columns = list(columns)
+    workers = workers or (os.cpu_count() or 1)
+    if isinstance(source, pd.DataFrame) and len(source) < PARALLEL_MIN_ROWS:
+        workers = 1
+
+    moments = MomentsAccumulator(columns)
+    for partial_moments in _map_chunks(partial(_chunk_moments, columns), iter_chunks(source, columns, chunk_rows), workers):
+        moments.merge(partial_moments)
+    if method == 'pearson':
+        return moments.correlation(), moments.summary()
+
+    sketches = [RankSketch() for _ in columns]
+    for partial_sketches in _map_chunks(_chunk_sketches, iter_chunks(source, columns, chunk_rows), workers):
+        for sketch, other in zip(sketches, partial_sketches):
+            sketch.merge(other)
+    rank_moments = MomentsAccumulator(columns)
+    rank_chunks = iter_chunks(source, columns, chunk_rows)
+    for partial_moments in _map_chunks(partial(_chunk_rank_moments, columns, sketches), rank_chunks, workers):
+        rank_moments.merge(partial_moments)
+    return rank_moments.correlation(), moments.summary()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Matriks korelasi streaming untuk dataset besar (CSV/Parquet)")
+    parser.add_argument('path', help="File dataset (.csv atau .parquet)")
+    parser.add_argument('--kolom', nargs='+', default=None, help="Kolom numerik (default: semua kolom numerik)")
+    parser.add_argument('--metode', choices=CORRELATION_METHODS, default='pearson')
+    parser.add_argument('--chunk', type=int, default=CHUNK_ROWS, help="Jumlah baris per potongan")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    columns = args.kolom
+    if columns is None:
+        # Kolom numerik ditentukan dari 1.000 baris pertama saja
+        if args.path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+
+            sample = next(pq.ParquetFile(args.path).iter_batches(batch_size=1000)).to_pandas()
+        else:
+            sample = pd.read_csv(args.path, nrows=1000)
+        columns = list(sample.select_dtypes('number').columns)
+    corr, summary = streaming_statistics(args.path, columns, args.metode, args.chunk, args.workers)
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(summary)
+        print()
+        print(corr.round(3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.neighbors import KDTree
+
+# Jumlah tetangga terdekat yang disimpan per jurusan
+DEFAULT_NEIGHBORS = 10
+
+# Jumlah baris per blok query
+BLOCK_ROWS = 8192
+
+# Di bawah ukuran ini graf dibangun di proses yang sama (biaya proses pool lebih besar dari hitungannya)
+PARALLEL_MIN_ROWS = 50_000
+
+
+# Fitur numerik distandarkan (z-score seperti StandardScaler)
+def scaled_features(df, features):
+    X = df[features].to_numpy(dtype=np.float64)
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    return (X - X.mean(axis=0)) / std
+
+
+def _init_worker(X):
+    global _worker_X, _worker_tree
+    _worker_X = X
+    _worker_tree = KDTree(X)
+
+
+# Tetangga terdekat untuk baris [start, stop): k + 1 titik terdekat dari KDTree, lalu baris itu
+# sendiri dikeluarkan (bila ada duplikat persis dan dirinya tidak ikut terambil, tetangga
+# terjauh yang dibuang)
+def _block_neighbors(task):
+    start, stop, k = task
+    distances, candidates = _worker_tree.query(_worker_X[start:stop], k=k + 1)
+    is_self = candidates == np.arange(start, stop)[:, None]
+    is_self[~is_self.any(axis=1), -1] = True
+    keep = ~is_self
+    candidates = candidates[keep].reshape(-1, k)
+    distances = distances[keep].reshape(-1, k)
+    return candidates.astype(np.int32), distances.astype(np.float32)
+
+
+# Graf k tetangga terdekat (jarak Euclidean pada fitur terstandar) dihitung per blok baris.
+# Ruang fiturnya berdimensi rendah, jadi setiap blok dijawab KDTree (O(log n) per baris) alih-alih
+# perkalian matriks blok x seluruh titik yang O(n^2). Blok dikerjakan di process pool bila datanya
+# besar; hasil disimpan sebagai array int32/float32.
+def knn_graph(X, k=DEFAULT_NEIGHBORS, workers=None):
+    n = len(X)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros((n, 0), dtype=np.int32), np.zeros((n, 0), dtype=np.float32)
+    tasks = [(start, min(start + BLOCK_ROWS, n), k) for start in range(0, n, BLOCK_ROWS)]
+    workers = workers or (os.cpu_count() or 1)
+    if workers == 1 or n < PARALLEL_MIN_ROWS:
+        _init_worker(X)
+        results = [_block_neighbors(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(X,)) as executor:
+            results = list(executor.map(_block_neighbors, tasks))
+    neighbors = np.vstack([rows for rows, _ in results])
+    distances = np.vstack([dist for _, dist in results])
+    return neighbors, distances
+
+
+# Graf "jurusan serupa" untuk seluruh katalog: neighbors[i] berisi posisi baris tetangga
+# terdekat jurusan i (terdekat lebih dulu) dan distances[i] jarak fiturnya
+class NeighborGraph:
+    def __init__(self, df, features, k=DEFAULT_NEIGHBORS, workers=None):
+        self.features = list(features)
+        self.neighbors, self.distances = knn_graph(scaled_features(df, self.features), k, workers)
+
+    @property
+    def k(self):
+        return self.neighbors.shape[1]
+
+    # Maksimal n tetangga terdekat dari satu baris: (posisi baris, jarak)
+    def similar(self, row, n=DEFAULT_NEIGHBORS):
+        return self.neighbors[row, :n], self.distances[row, :n]
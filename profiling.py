@@ -0,0 +1,191 @@
+import functools
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows tidak memiliki modul resource
+    resource = None
+
+
+# RSS puncak proses dalam MB (ru_maxrss dalam KB di Linux, byte di macOS)
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+# Rincian memori proses dalam MB (Linux, dari /proc/self/smaps_rollup): heap anonim milik
+# proses sendiri dan halaman file (mmap) yang dapat dibagi antar proses lewat page cache.
+def memory_breakdown_mb():
+    try:
+        with open('/proc/self/smaps_rollup', encoding='ascii') as f:
+            lines = f.readlines()[1:]  # baris pertama adalah rentang alamat
+    except OSError:
+        return None
+    kb = {}
+    for line in lines:
+        key, value = line.split(':', 1)
+        kb[key] = int(value.split()[0])
+    # Anonymous = heap milik proses sendiri; sisanya halaman file (mmap) yang dapat dibagi
+    return {
+        'rss_mb': round(kb.get('Rss', 0) / 1024, 1),
+        'anon_mb': round(kb.get('Anonymous', 0) / 1024, 1),
+        'file_mb': round((kb.get('Rss', 0) - kb.get('Anonymous', 0)) / 1024, 1),
+    }
+
+
+# Mencatat waktu wall, waktu CPU, RSS puncak dan ukuran artefak per tahap
+class StageRecorder:
+    def __init__(self, verbose=True):
+        self.stages = []
+        self.verbose = verbose
+
+    @contextmanager
+    def stage(self, name):
+        record = {'stage': name, 'artifacts': {}}
+        rss_before = peak_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_s'] = round(time.perf_counter() - wall_start, 4)
+            record['cpu_s'] = round(time.process_time() - cpu_start, 4)
+            record['peak_rss_mb'] = peak_rss_mb()
+            if rss_before is not None:
+                record['peak_rss_growth_mb'] = round(record['peak_rss_mb'] - rss_before, 2)
+            self.stages.append(record)
+            if self.verbose:
+                rss = record['peak_rss_mb']
+                rss_text = f"{rss:.1f} MB" if rss is not None else "-"
+                print(f"  [{name}] waktu: {record['wall_s']:.2f} detik, CPU: {record['cpu_s']:.2f} detik, RSS puncak: {rss_text}")
+
+    # Mencatat ukuran file artefak pada tahap yang sedang berjalan
+    def add_artifact(self, record, path):
+        record['artifacts'][os.path.basename(path)] = os.path.getsize(path)
+
+    def to_dict(self, **extra):
+        total_wall = sum(s['wall_s'] for s in self.stages)
+        total_cpu = sum(s['cpu_s'] for s in self.stages)
+        report = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': sys.version.split()[0],
+            'total_wall_s': round(total_wall, 4),
+            'total_cpu_s': round(total_cpu, 4),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': self.stages,
+        }
+        report.update(extra)
+        return report
+
+    # Menulis laporan terbaru (JSON) dan menambahkannya ke riwayat (JSON lines)
+    def write_report(self, path, history_path=None, **extra):
+        report = self.to_dict(**extra)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        if history_path is not None:
+            with open(history_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+        return report
+
+
+# Profiler per rerun Streamlit (opt-in lewat env INSIGHT_PROFILE=1 atau query ?profile=1).
+# Mencatat durasi setiap bagian halaman, builder grafik, dan ukuran payload plotly_chart.
+class RerunProfiler:
+    def __init__(self, enabled=False, log_path=None):
+        self.enabled = enabled
+        self.log_path = log_path or os.environ.get('INSIGHT_PROFILE_LOG', 'logs/rerun_profile.jsonl')
+        self.records = []
+        self.charts = []
+        self.open_sections = {}
+        self.started_at = time.perf_counter()
+
+    def _add(self, name, kind, elapsed):
+        self.records.append({'name': name, 'kind': kind, 'ms': round(elapsed * 1000, 3)})
+
+    @contextmanager
+    def section(self, name, kind='section'):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._add(name, kind, time.perf_counter() - start)
+
+    # Bagian yang tidak bisa dibungkus blok with (misalnya cabang menu if/elif)
+    def start(self, name):
+        if self.enabled:
+            self.open_sections[name] = time.perf_counter()
+
+    def stop(self, name, kind='menu'):
+        if self.enabled and name in self.open_sections:
+            self._add(name, kind, time.perf_counter() - self.open_sections.pop(name))
+
+    # Dekorator untuk mengukur setiap pemanggilan fungsi (builder create_*, rekomendasi)
+    def profile(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self.section(func.__name__, kind='function'):
+                return func(*args, **kwargs)
+        return wrapper
+
+    # Pengganti st.plotly_chart yang juga menghitung byte JSON figure yang dikirim ke browser
+    def plotly_chart(self, fig, **kwargs):
+        import streamlit as st
+
+        if not self.enabled:
+            return st.plotly_chart(fig, **kwargs)
+        title = fig.layout.title.text or f"chart {len(self.charts) + 1}"
+        payload_bytes = len(fig.to_json().encode('utf-8'))
+        start = time.perf_counter()
+        result = st.plotly_chart(fig, **kwargs)
+        elapsed = time.perf_counter() - start
+        self._add(title, 'plotly_chart', elapsed)
+        self.charts.append({'title': title, 'bytes': payload_bytes, 'ms': round(elapsed * 1000, 3)})
+        return result
+
+    def summary(self):
+        summary = {}
+        for record in self.records:
+            key = (record['kind'], record['name'])
+            item = summary.setdefault(key, {'kind': record['kind'], 'name': record['name'], 'calls': 0, 'total_ms': 0.0})
+            item['calls'] += 1
+            item['total_ms'] = round(item['total_ms'] + record['ms'], 3)
+        return sorted(summary.values(), key=lambda item: item['total_ms'], reverse=True)
+
+    # Menampilkan rincian rerun di sidebar dan menulis satu baris JSON ke log
+    def finish(self, **extra):
+        if not self.enabled:
+            return None
+        import streamlit as st
+
+        total_ms = round((time.perf_counter() - self.started_at) * 1000, 3)
+        entry = {
+            'created_at': datetime.now().isoformat(timespec='milliseconds'),
+            'total_ms': total_ms,
+            'chart_bytes': sum(chart['bytes'] for chart in self.charts),
+            'records': self.records,
+            'charts': self.charts,
+        }
+        entry.update(extra)
+
+        with st.sidebar.expander("⏱️ Profil Rerun", expanded=True):
+            st.markdown(f"**Total rerun:** {total_ms:.1f} ms  \n**Payload grafik:** {entry['chart_bytes'] / 1024:,.1f} KB")
+            st.dataframe(self.summary(), use_container_width=True, hide_index=True)
+            if self.charts:
+                st.dataframe(self.charts, use_container_width=True, hide_index=True)
+
+        log_dir = os.path.dirname(self.log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return entry
@@ -0,0 +1,159 @@
+import numpy as np
+
+from indexes import top_k
+
+# Tujuan prioritas "sepi peminat": arah 'min' berarti makin kecil makin baik
+OBJECTIVES = {
+    'Peminat 2024': 'min',
+    'Gaji Awal Max': 'max',
+    'Maks. Waktu Tunggu Kerja (Bulan)': 'min',
+    'Tingkat Kelulusan (%)': 'max',
+}
+
+# Bobot default skor gabungan (urutan di dalam Pareto front dan pengisi sisa top-k)
+DEFAULT_WEIGHTS = {
+    'Peminat 2024': 0.35,
+    'Gaji Awal Max': 0.35,
+    'Maks. Waktu Tunggu Kerja (Bulan)': 0.15,
+    'Tingkat Kelulusan (%)': 0.15,
+}
+
+BLOCK_SIZE = 1024
+
+
+# Matriks tujuan dengan konvensi "makin besar makin baik" (kolom 'min' dinegasikan)
+def objective_matrix(df, objectives=OBJECTIVES):
+    X = df[list(objectives)].to_numpy(dtype=float)
+    signs = np.array([1.0 if direction == 'max' else -1.0 for direction in objectives.values()])
+    return X * signs
+
+
+# Dominasi: baris pada `front` mendominasi titik bila >= di semua tujuan dan > di salah satunya.
+# Titik diproses per potongan agar array perbandingan (titik x front x tujuan) tetap kecil.
+def _dominated_by(points, front, chunk=8192):
+    dominated = np.zeros(len(points), dtype=bool)
+    if len(front) == 0:
+        return dominated
+    for start in range(0, len(points), chunk):
+        part = points[start:start + chunk, None, :]
+        ge = (front[None, :, :] >= part).all(axis=2)
+        gt = (front[None, :, :] > part).any(axis=2)
+        dominated[start:start + chunk] = (ge & gt).any(axis=1)
+    return dominated
+
+
+# Kode rank padat per kolom lalu satu kunci integer per kombinasi nilai, untuk memadatkan
+# baris duplikat jauh lebih cepat daripada np.unique(axis=0)
+def _unique_rows(X):
+    codes = []
+    cardinalities = []
+    for j in range(X.shape[1]):
+        values, code = np.unique(X[:, j], return_inverse=True)
+        codes.append(code.astype(np.int64))
+        cardinalities.append(len(values))
+    if np.prod(np.array(cardinalities, dtype=float)) < 2 ** 62:
+        key = np.zeros(len(X), dtype=np.int64)
+        for code, cardinality in zip(codes, cardinalities):
+            key = key * cardinality + code
+        _, first, inverse = np.unique(key, return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(np.column_stack(codes), axis=0, return_index=True, return_inverse=True)
+    dtype = np.int16 if max(cardinalities) < 2 ** 15 else np.int32
+    ranks = np.column_stack(codes)[first].astype(dtype)
+    return X[first], ranks, inverse.ravel()
+
+
+# Versi cepat untuk titik unik (kode rank): titik berbeda yang >= di semua tujuan pasti
+# mendominasi, jadi cukup satu perbandingan per kolom dengan array 2D (titik x front)
+def _dominated_unique(points, front, same_set=False, chunk=4096):
+    dominated = np.zeros(len(points), dtype=bool)
+    if len(front) == 0:
+        return dominated
+    for start in range(0, len(points), chunk):
+        part = points[start:start + chunk]
+        ge = part[:, 0][:, None] <= front[:, 0][None, :]
+        for j in range(1, points.shape[1]):
+            ge &= part[:, j][:, None] <= front[:, j][None, :]
+        if same_set:
+            # Titik tidak mendominasi dirinya sendiri
+            idx = np.arange(len(part))
+            ge[idx, start + idx] = False
+        dominated[start:start + chunk] = ge.any(axis=1)
+    return dominated
+
+
+# Skyline (Pareto front) dengan Sort-Filter-Skyline: titik unik diurutkan menurun menurut
+# jumlah rank per tujuan (O(n log n)). Dengan urutan ini titik belakangan tidak mungkin
+# mendominasi titik sebelumnya, sehingga front setiap blok sudah pasti anggota skyline dan
+# langsung dipakai memangkas seluruh titik sisa secara vektor. Setiap titik dibandingkan
+# paling banyak sekali dengan setiap anggota skyline.
+def pareto_mask(X):
+    X = np.asarray(X, dtype=float)
+    if len(X) == 0:
+        return np.zeros(0, dtype=bool)
+    unique, ranks, inverse = _unique_rows(X)
+    remaining = np.argsort(-ranks.sum(axis=1), kind='stable')
+
+    front = []
+    while len(remaining):
+        block, remaining = remaining[:BLOCK_SIZE], remaining[BLOCK_SIZE:]
+        block_ranks = ranks[block]
+        block_front = block[~_dominated_unique(block_ranks, block_ranks, same_set=True)]
+        front.append(block_front)
+        if len(remaining):
+            remaining = remaining[~_dominated_unique(ranks[remaining], ranks[block_front])]
+
+    on_front = np.zeros(len(unique), dtype=bool)
+    on_front[np.concatenate(front)] = True
+    return on_front[inverse]
+
+
+# Skor berbobot dari tujuan yang dinormalisasi min-max (0-1, makin besar makin baik)
+def weighted_score(X, weights):
+    lo = X.min(axis=0)
+    span = X.max(axis=0) - lo
+    span[span == 0] = 1.0
+    return ((X - lo) / span) @ weights
+
+
+# Pareto front yang dapat diperbarui secara inkremental saat baris baru ditambahkan:
+# titik baru yang didominasi front diabaikan, dan titik front yang didominasi titik baru dibuang.
+class ParetoIndex:
+    def __init__(self, df, objectives=OBJECTIVES):
+        self.objectives = objectives
+        X = objective_matrix(df, objectives)
+        self.rows = np.flatnonzero(pareto_mask(X))
+        self.points = X[self.rows]
+        self.n_rows = len(df)
+
+    def add(self, new_df):
+        X = objective_matrix(new_df, self.objectives)
+        rows = np.arange(self.n_rows, self.n_rows + len(X))
+        self.n_rows += len(X)
+        new = pareto_mask(X)
+        X, rows = X[new], rows[new]
+        alive = ~_dominated_by(X, self.points)
+        X, rows = X[alive], rows[alive]
+        if len(X):
+            keep = ~_dominated_by(self.points, X)
+            self.points = np.vstack([self.points[keep], X])
+            self.rows = np.concatenate([self.rows[keep], rows])
+        return self
+
+
+# Top-k multi-tujuan: jurusan di Pareto front lebih dulu (diurutkan menurut skor berbobot),
+# sisa slot diisi jurusan lain dengan skor tertinggi. `pareto` (ParetoIndex untuk df yang sama)
+# dapat diberikan agar skyline tidak dihitung ulang. Mengembalikan (DataFrame, jumlah front).
+def rank(df, k=10, weights=DEFAULT_WEIGHTS, objectives=OBJECTIVES, pareto=None):
+    if len(df) == 0:
+        return df, 0
+    X = objective_matrix(df, objectives)
+    scores = weighted_score(X, np.array([weights[column] for column in objectives]))
+    front_rows = np.flatnonzero(pareto_mask(X)) if pareto is None else pareto.rows
+    front_rows = front_rows[np.argsort(-scores[front_rows], kind='stable')]
+    if len(front_rows) >= k:
+        return df.iloc[front_rows[:k]], len(front_rows)
+    rest_scores = scores.copy()
+    rest_scores[front_rows] = -np.inf
+    rest = top_k(rest_scores, k - len(front_rows))
+    return df.iloc[np.concatenate([front_rows, rest])], len(front_rows)
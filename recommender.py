@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics.pairwise import cosine_similarity
+
+# Mode filter rentang gaji terhadap rentang target [low, high]
+SALARY_MODES = ('overlap', 'contains', 'within')
+
+
+# Posisi baris yang memenuhi batasan wajib {kolom: (min, max)} (None = tanpa batas). Dengan
+# `range_index` (RangeIndex untuk df yang sama) setiap predikat dijawab lewat searchsorted
+def constraint_rows(df, constraints, range_index=None):
+    if range_index is not None:
+        return range_index.query(constraints)
+    mask = np.ones(len(df), dtype=bool)
+    for column, (low, high) in constraints.items():
+        values = df[column].to_numpy(dtype=float)
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+    return np.flatnonzero(mask)
+
+
+# Posisi baris yang rentang [Gaji Awal Min, Gaji Awal Max]-nya beririsan dengan (overlap),
+# mencakup (contains) atau berada di dalam (within) rentang target. Dengan `interval_index`
+# (IntervalIndex untuk df yang sama) query berjalan O(log n + k) tanpa memindai tabel
+def salary_rows(df, salary_range, mode='overlap', interval_index=None):
+    low, high = salary_range
+    if mode not in SALARY_MODES:
+        raise ValueError(f"Mode rentang gaji tidak dikenal: {mode}")
+    if interval_index is not None:
+        query = {'overlap': interval_index.overlaps, 'contains': interval_index.contains,
+                 'within': interval_index.within}[mode]
+        return query(low, high)
+    starts = df['Gaji Awal Min'].to_numpy(dtype=float)
+    ends = df['Gaji Awal Max'].to_numpy(dtype=float)
+    if mode == 'overlap':
+        mask = (starts <= high) & (ends >= low)
+    elif mode == 'contains':
+        mask = (starts <= low) & (ends >= high)
+    else:
+        mask = (starts >= low) & (ends <= high)
+    return np.flatnonzero(mask)
+
+
+# Pra-filter batasan wajib dan rentang gaji; hasil kedua filter diiris pada posisi baris
+def apply_constraints(df, constraints=None, range_index=None, salary_range=None, salary_mode='overlap',
+                      interval_index=None):
+    rows = None
+    if constraints:
+        rows = constraint_rows(df, constraints, range_index)
+    if salary_range is not None:
+        salary = salary_rows(df, salary_range, salary_mode, interval_index)
+        rows = salary if rows is None else np.intersect1d(rows, salary, assume_unique=True)
+    return df if rows is None else df.iloc[rows]
+
+# Fungsi untuk sistem rekomendasi
+# `chances` (Series peluang masuk 0-1 ber-index sama dengan df) mengubah urutan menjadi
+# kecocokan preferensi dikali peluang masuk
+def get_recommendations(df, preferences, n=5, constraints=None, range_index=None, salary_range=None,
+                        salary_mode='overlap', interval_index=None, chances=None):
+    # Pra-filter batasan wajib dan rentang gaji sebelum menghitung similarity
+    df = apply_constraints(df, constraints, range_index, salary_range, salary_mode, interval_index)
+    if len(df) == 0:
+        return df
+    
+    # Fitur untuk perbandingan
+    features = ['Rasio Keketatan', 'Tingkat Kelulusan (%)', 'Maks. Waktu Tunggu Kerja (Bulan)', 
+                'Gaji Awal Min', 'Gaji Awal Max']
+    
+    # Membuat DataFrame preferensi
+    user_pref = pd.DataFrame([preferences], columns=features)
+    
+    # Gabungkan preferensi pengguna dengan data jurusan untuk perhitungan similarity
+    combined_data = pd.concat([df[features], user_pref])
+    
+    # Normalisasi data
+    scaler = StandardScaler()
+    scaled_data = scaler.fit_transform(combined_data)
+    
+    # Hitung similarity
+    similarity = cosine_similarity(scaled_data[-1].reshape(1, -1), scaled_data[:-1])[0]
+    
+    # Similarity (-1..1) dipetakan ke 0..1 lalu dibobot peluang masuk
+    if chances is not None:
+        similarity = (similarity + 1) / 2 * chances.reindex(df.index).fillna(0).to_numpy()
+    
+    # Dapatkan indeks jurusan dengan similarity tertinggi
+    similar_indices = similarity.argsort()[::-1][:n]
+    
+    # Kembalikan jurusan yang direkomendasikan
+    return df.iloc[similar_indices]
@@ -0,0 +1,163 @@
+# Analisis stabilitas cluster dengan bootstrap: model KMeans utama dilatih ulang pada ratusan
+# sampel bootstrap (paralel di process pool), centroid setiap sampel dicocokkan ke centroid
+# model utama, lalu dihitung keyakinan cluster per jurusan, Adjusted Rand Index antar sampel
+# dan interval kepercayaan rata-rata fitur per cluster. Hasilnya disimpan ke
+# models/cluster_stability.pkl dan dibaca halaman Analisis Cluster lewat artefak.
+# Jalankan setelah training.py:  python stability.py --bootstrap 500
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from scipy.optimize import linear_sum_assignment
+from sklearn.cluster import KMeans
+from sklearn.metrics import adjusted_rand_score
+
+from clusters import CONFIDENCE, ClusterStability, name_clusters
+from data_loader import MODELS_DIR, read_dataset, read_models
+
+STABILITY_PATH = 'cluster_stability.pkl'
+
+# Jumlah sampel bootstrap default
+DEFAULT_BOOTSTRAP = 500
+
+# Pencocokan centroid dengan mencoba semua permutasi (vektor) hanya sampai k ini;
+# di atasnya dipakai algoritma Hungarian per sampel
+MAX_PERMUTATION_K = 7
+
+# Batas elemen matriks jarak (sampel x baris x cluster) saat melabeli ulang seluruh data
+BLOCK_ELEMENTS = 1 << 24
+
+
+def _init_worker(X_scaled, X_values, k, seed):
+    global _worker_data
+    _worker_data = (X_scaled, X_values, k, seed)
+
+
+# Satu sampel bootstrap: KMeans dilatih pada baris hasil resampling, lalu dikembalikan
+# centroid (urutan label model bootstrap) dan rata-rata fitur asli per cluster pada sampel itu
+def _bootstrap_fit(b):
+    X_scaled, X_values, k, seed = _worker_data
+    rng = np.random.default_rng([seed, b])
+    rows = rng.integers(0, len(X_scaled), len(X_scaled))
+    model = KMeans(n_clusters=k, random_state=seed + b, n_init=3).fit(X_scaled[rows])
+    counts = np.bincount(model.labels_, minlength=k)
+    sums = np.zeros((k, X_values.shape[1]))
+    for j in range(X_values.shape[1]):
+        sums[:, j] = np.bincount(model.labels_, weights=X_values[rows, j], minlength=k)
+    with np.errstate(invalid='ignore'):
+        means = sums / counts[:, None]
+    return model.cluster_centers_, means
+
+
+# Pencocokan centroid semua sampel sekaligus: untuk setiap sampel dicari permutasi label
+# yang meminimalkan total jarak kuadrat ke centroid referensi. perm[b, j] = label bootstrap
+# yang dipetakan ke cluster referensi j.
+def match_centroids(centroids, reference):
+    cost = ((centroids[:, :, None, :] - reference[None, None, :, :]) ** 2).sum(axis=3)
+    k = reference.shape[0]
+    if k <= MAX_PERMUTATION_K:
+        perms = np.array(list(itertools.permutations(range(k))))
+        totals = cost[:, perms, np.arange(k)].sum(axis=2)
+        return perms[totals.argmin(axis=1)]
+    perm = np.empty((len(centroids), k), dtype=np.int64)
+    for b in range(len(centroids)):
+        rows, cols = linear_sum_assignment(cost[b])
+        perm[b, cols] = rows
+    return perm
+
+
+# Label seluruh data menurut setiap model bootstrap, sudah dalam ruang label referensi
+def matched_labels(X_scaled, centroids, perm):
+    n_boot, k, _ = centroids.shape
+    # inverse[b, label bootstrap] = cluster referensi
+    inverse = np.empty_like(perm)
+    np.put_along_axis(inverse, perm, np.arange(k)[None, :].repeat(n_boot, axis=0), axis=1)
+    labels = np.empty((n_boot, len(X_scaled)), dtype=np.int16)
+    block = max(1, BLOCK_ELEMENTS // max(1, n_boot * k))
+    norms = (centroids ** 2).sum(axis=2)
+    for start in range(0, len(X_scaled), block):
+        part = X_scaled[start:start + block]
+        distances = norms[:, None, :] - 2 * np.einsum('nd,bkd->bnk', part, centroids)
+        nearest = distances.argmin(axis=2)
+        labels[:, start:start + len(part)] = np.take_along_axis(inverse, nearest, axis=1)
+    return labels
+
+
+# Menjalankan bootstrap untuk model KMeans utama pada df. Setiap sampel memakai generator
+# acaknya sendiri sehingga hasil sama berapapun jumlah worker.
+def bootstrap_stability(df, models, features, cluster_names, n_bootstrap=DEFAULT_BOOTSTRAP, seed=42,
+                        workers=None, level=CONFIDENCE, dataset_version=None):
+    start = time.perf_counter()
+    kmeans = models['kmeans']
+    k = kmeans.n_clusters
+    X_values = df[features].to_numpy(dtype=np.float64)
+    X_scaled = models['scaler'].transform(df[features])
+    reference = kmeans.cluster_centers_
+    reference_labels = kmeans.predict(X_scaled)
+
+    workers = workers or (os.cpu_count() or 1)
+    if workers == 1:
+        _init_worker(X_scaled, X_values, k, seed)
+        results = [_bootstrap_fit(b) for b in range(n_bootstrap)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(X_scaled, X_values, k, seed)) as executor:
+            results = list(executor.map(_bootstrap_fit, range(n_bootstrap)))
+    centroids = np.stack([c for c, _ in results])
+    sample_means = np.stack([m for _, m in results])
+
+    perm = match_centroids(centroids, reference)
+    labels = matched_labels(X_scaled, centroids, perm)
+    confidence = (labels == reference_labels[None, :]).mean(axis=0).astype(np.float32)
+    ari = np.array([adjusted_rand_score(reference_labels, row) for row in labels], dtype=np.float32)
+
+    # Rata-rata sampel diurutkan ke label referensi lalu diambil persentilnya
+    matched_means = np.take_along_axis(sample_means, perm[:, :, None], axis=1)
+    tail = (1 - level) / 2 * 100
+    lower = np.nanpercentile(matched_means, tail, axis=0)
+    upper = np.nanpercentile(matched_means, 100 - tail, axis=0)
+    means = pd.DataFrame(X_values).groupby(reference_labels).mean().reindex(range(k)).to_numpy()
+
+    return ClusterStability(k, len(df), confidence, ari, means, lower, upper, features, cluster_names,
+                            reference, dataset_version=dataset_version, seconds=time.perf_counter() - start)
+
+
+def main():
+    from artifacts import CLUSTER_FEATURES
+    from data_loader import dataset_version
+
+    parser = argparse.ArgumentParser(description="Analisis stabilitas cluster KMeans dengan bootstrap")
+    parser.add_argument('--data', default=None, help="Path dataset (default: dataset/Dataset_Kelompok_10D.csv)")
+    parser.add_argument('--models-dir', default=MODELS_DIR, help="Direktori model hasil training.py")
+    parser.add_argument('--bootstrap', type=int, default=DEFAULT_BOOTSTRAP, help="Jumlah sampel bootstrap")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: semua CPU)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    df = read_dataset(args.data)
+    models = read_models(args.models_dir)
+    print(f"Menjalankan {args.bootstrap} sampel bootstrap KMeans (k={models['kmeans'].n_clusters}) "
+          f"pada {len(df)} jurusan...")
+    labels = models['kmeans'].predict(models['scaler'].transform(df[CLUSTER_FEATURES]))
+    result = bootstrap_stability(df, models, CLUSTER_FEATURES, name_clusters(df, labels, CLUSTER_FEATURES),
+                                 n_bootstrap=args.bootstrap, seed=args.seed, workers=args.workers,
+                                 dataset_version=dataset_version(args.data))
+
+    mean_ari, low_ari, high_ari = result.ari_summary()
+    print(f"Selesai dalam {result.seconds:.2f} detik")
+    print(f"Adjusted Rand Index: {mean_ari:.3f} (interval {CONFIDENCE:.0%}: {low_ari:.3f} - {high_ari:.3f})")
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(result.cluster_confidence(labels).round(3))
+
+    path = os.path.join(args.models_dir, STABILITY_PATH)
+    joblib.dump(result, path)
+    print(f"Hasil disimpan di {path}")
+
+
+if __name__ == '__main__':
+    main()
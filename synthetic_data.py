@@ -0,0 +1,236 @@
+# Generator dataset sintetis dengan skema yang sama seperti Dataset_Kelompok_10D.csv.
+# Distribusi marginal kolom numerik dipelajari dari kuantil data asli dan korelasinya
+# dari Gaussian copula; kolom kategorikal diambil dari baris asli sehingga komposisi
+# Fakultas, Lokasi dan Akreditasi serta keterkaitannya dengan kolom numerik tetap terjaga.
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr, ndtri
+
+from data_loader import DATASET_PATH, read_dataset
+
+# Kolom numerik yang dibangkitkan lewat copula
+COPULA_COLUMNS = ['Peminat 2024', 'Daya Tampung SNBP 2025', 'Daya Tampung SNBT 2025',
+                  'Lama Studi Rata-rata (Bulan)', 'Tingkat Kelulusan (%)',
+                  'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
+
+# Kolom milik institusi; dapat ditukar dengan institusi baris lain agar muncul
+# kombinasi program studi x PTN baru
+INSTITUTION_COLUMNS = ['Nama PTN', 'Lokasi', 'Sumber Data']
+
+
+# Mempelajari profil distribusi dari dataset asli
+def fit_profile(df):
+    n = len(df)
+    values = df[COPULA_COLUMNS].to_numpy(dtype=float)
+
+    # Skor normal dari rank setiap kolom (transformasi copula)
+    ranks = df[COPULA_COLUMNS].rank(method='average').to_numpy()
+    scores = ndtri((ranks - 0.5) / n)
+    corr = np.corrcoef(scores, rowvar=False)
+    # Jitter kecil di diagonal agar Cholesky stabil
+    chol = np.linalg.cholesky(corr + np.eye(len(COPULA_COLUMNS)) * 1e-6)
+
+    steps = {}
+    for column in COPULA_COLUMNS:
+        steps[column] = int(np.gcd.reduce(df[column].astype(np.int64).to_numpy())) or 1
+
+    return {
+        'columns': list(df.columns),
+        'template': df.reset_index(drop=True),
+        'scores': scores,
+        'sorted_values': np.sort(values, axis=0),
+        'chol': chol,
+        'steps': steps,
+        'lower': values.min(axis=0),
+        'upper': values.max(axis=0),
+    }
+
+
+# Membangkitkan n_rows baris. `anchor` mengatur seberapa kuat baris sintetis mengikuti
+# baris asli yang menjadi templat (1 = salinan persis, 0 = hanya copula)
+def sample(profile, n_rows, rng, anchor=0.7, institution_mix=0.3, start_id=1):
+    template = profile['template']
+    n_template = len(template)
+    idx = rng.integers(0, n_template, n_rows)
+    out = template.iloc[idx].reset_index(drop=True)
+
+    # Sebagian baris memakai institusi (PTN, Lokasi) dari baris asli lain
+    swap = rng.random(n_rows) < institution_mix
+    if swap.any():
+        donor = rng.integers(0, n_template, int(swap.sum()))
+        for column in INSTITUTION_COLUMNS:
+            column_values = out[column].to_numpy(dtype=object)
+            column_values[swap] = template[column].to_numpy(dtype=object)[donor]
+            out[column] = column_values
+
+    # Skor normal laten: campuran skor templat dan sampel copula baru sehingga
+    # marginal tetap N(0, 1) dan korelasi antar kolom tetap sama
+    fresh = rng.standard_normal((n_rows, len(COPULA_COLUMNS))) @ profile['chol'].T
+    latent = anchor * profile['scores'][idx] + np.sqrt(1 - anchor ** 2) * fresh
+    u = ndtr(latent)
+
+    # Invers CDF empiris (interpolasi kuantil) lalu dibulatkan ke granularitas data asli
+    sorted_values = profile['sorted_values']
+    positions = u * (n_template - 1)
+    lo = np.floor(positions).astype(np.int64)
+    hi = np.minimum(lo + 1, n_template - 1)
+    frac = positions - lo
+    for j, column in enumerate(COPULA_COLUMNS):
+        generated = sorted_values[lo[:, j], j] * (1 - frac[:, j]) + sorted_values[hi[:, j], j] * frac[:, j]
+        step = profile['steps'][column]
+        generated = np.clip(np.round(generated / step) * step, profile['lower'][j], profile['upper'][j])
+        out[column] = generated.astype(np.int64)
+
+    # Konsistensi antar kolom turunan
+    out['Daya Tampung SNBP 2025'] = out['Daya Tampung SNBP 2025'].clip(lower=1)
+    out['Daya Tampung SNBT 2025'] = out['Daya Tampung SNBT 2025'].clip(lower=1)
+    out['Gaji Awal Max'] = np.maximum(out['Gaji Awal Min'], out['Gaji Awal Max'])
+    daya_tampung = out['Daya Tampung SNBP 2025'] + out['Daya Tampung SNBT 2025']
+    out['Rasio Keketatan'] = (out['Peminat 2024'] / daya_tampung).round(1)
+    out['ID'] = np.arange(start_id, start_id + n_rows)
+
+    return out[profile['columns']]
+
+
+# Membangkitkan dataset langsung di memori (dipakai benchmark.py)
+def generate(n_rows, seed=42, source=None, **kwargs):
+    profile = fit_profile(source if source is not None else read_dataset())
+    return sample(profile, n_rows, np.random.default_rng(seed), **kwargs)
+
+
+# Worker proses: setiap chunk memakai seed turunan sendiri sehingga hasil
+# deterministik untuk seed yang sama, berapapun jumlah worker
+_worker_profile = None
+
+
+def _init_worker(profile):
+    global _worker_profile
+    _worker_profile = profile
+
+
+def _generate_chunk(task):
+    chunk_index, n_rows, start_id, seed, anchor, institution_mix = task
+    rng = np.random.default_rng([seed, chunk_index])
+    return sample(_worker_profile, n_rows, rng, anchor=anchor,
+                  institution_mix=institution_mix, start_id=start_id)
+
+
+def _tasks(n_rows, chunk_rows, seed, anchor, institution_mix):
+    for chunk_index, start in enumerate(range(0, n_rows, chunk_rows)):
+        yield (chunk_index, min(chunk_rows, n_rows - start), start + 1, seed, anchor, institution_mix)
+
+
+# Penulis keluaran streaming: CSV atau Parquet (kolumnar) sesuai ekstensi file
+class ChunkWriter:
+    def __init__(self, path):
+        self.path = path
+        self.format = 'parquet' if path.endswith('.parquet') else 'csv'
+        self.writer = None
+        self.first = True
+
+    def write(self, chunk):
+        if self.format == 'csv':
+            chunk.to_csv(self.path, mode='w' if self.first else 'a', header=self.first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+            self.writer.write_table(table)
+        self.first = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+# Membangkitkan dataset berukuran besar secara paralel dan menulisnya per chunk
+# sesuai urutan. Jumlah chunk yang sedang diproses dibatasi agar memori tetap kecil.
+def generate_to_file(path, n_rows, chunk_rows=100_000, workers=None, seed=42,
+                     anchor=0.7, institution_mix=0.3, source=None):
+    profile = fit_profile(source if source is not None else read_dataset())
+    workers = workers or os.cpu_count() or 1
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    writer = ChunkWriter(path)
+    tasks = _tasks(n_rows, chunk_rows, seed, anchor, institution_mix)
+    written = 0
+    try:
+        if workers == 1:
+            _init_worker(profile)
+            for task in tasks:
+                chunk = _generate_chunk(task)
+                writer.write(chunk)
+                written += len(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profile,)) as executor:
+                pending = []
+                for task in tasks:
+                    pending.append(executor.submit(_generate_chunk, task))
+                    if len(pending) >= workers * 2:
+                        chunk = pending.pop(0).result()
+                        writer.write(chunk)
+                        written += len(chunk)
+                for future in pending:
+                    chunk = future.result()
+                    writer.write(chunk)
+                    written += len(chunk)
+    finally:
+        writer.close()
+    return written
+
+
+# Ringkasan kemiripan data sintetis dengan data asli
+def compare_with_source(synthetic, source):
+    numeric = COPULA_COLUMNS + ['Rasio Keketatan']
+    summary = pd.DataFrame({
+        'mean asli': source[numeric].mean(),
+        'mean sintetis': synthetic[numeric].mean(),
+        'std asli': source[numeric].std(),
+        'std sintetis': synthetic[numeric].std(),
+    })
+    corr_gap = (synthetic[numeric].corr(method='spearman') - source[numeric].corr(method='spearman')).abs().to_numpy().max()
+    return summary, corr_gap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator dataset sintetis PTN untuk uji skala")
+    parser.add_argument('--rows', type=int, required=True, help="Jumlah baris yang dibangkitkan")
+    parser.add_argument('--output', required=True, help="File keluaran (.csv atau .parquet)")
+    parser.add_argument('--source', default=DATASET_PATH, help="Dataset asli yang dipelajari distribusinya")
+    parser.add_argument('--chunk-rows', type=int, default=100_000)
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: jumlah CPU)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--anchor', type=float, default=0.7,
+                        help="Keterikatan nilai numerik ke baris templat asli (0-1)")
+    parser.add_argument('--institution-mix', type=float, default=0.3,
+                        help="Proporsi baris yang PTN/Lokasi-nya diambil dari baris lain")
+    args = parser.parse_args()
+
+    source = read_dataset(args.source)
+    start = time.perf_counter()
+    written = generate_to_file(args.output, args.rows, chunk_rows=args.chunk_rows, workers=args.workers,
+                               seed=args.seed, anchor=args.anchor, institution_mix=args.institution_mix,
+                               source=source)
+    elapsed = time.perf_counter() - start
+    print(f"{written:,} baris ditulis ke {args.output} dalam {elapsed:.1f} detik")
+
+    check = sample(fit_profile(source), min(args.rows, 100_000), np.random.default_rng(args.seed),
+                   anchor=args.anchor, institution_mix=args.institution_mix)
+    summary, corr_gap = compare_with_source(check, source)
+    print("\nPerbandingan distribusi (sampel):")
+    print(summary.round(2))
+    print(f"Selisih korelasi Spearman maksimum: {corr_gap:.3f}")
+
+
+if __name__ == '__main__':
+    main()
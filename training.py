@@ -3,13 +3,34 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 from sklearn.preprocessing import StandardScaler
-from sklearn.decomposition import PCA
-from sklearn.cluster import KMeans
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import mean_squared_error, r2_score
+from clusters import K_VALUES, ClusterFamily, cluster_status, derive_cluster_names
+from profiling import StageRecorder
+from joblib import Parallel, delayed
+import argparse
+import hashlib
 import joblib
 import os
+import sklearn
+
+parser = argparse.ArgumentParser(description="Melatih model untuk dashboard Insight PTN")
+parser.add_argument('--data', default='dataset/Dataset_Kelompok_10D.csv',
+                    help="Path file CSV dataset")
+parser.add_argument('--skala-besar', action='store_true',
+                    help="Mode out-of-core: dataset dibaca per chunk sehingga tidak perlu muat di RAM")
+parser.add_argument('--chunksize', type=int, default=100_000,
+                    help="Jumlah baris per chunk pada mode skala besar")
+parser.add_argument('--epochs', type=int, default=3,
+                    help="Jumlah lintasan MiniBatchKMeans final pada mode skala besar")
+parser.add_argument('--rf-max-rows', type=int, default=500_000,
+                    help="Jumlah maksimal baris sampel untuk Random Forest pada mode skala besar")
+parser.add_argument('--rf-max-samples', type=float, default=0.3,
+                    help="Proporsi sampel bootstrap per pohon Random Forest pada mode skala besar")
+args = parser.parse_args()
 
 # Membuat direktori untuk menyimpan model jika belum ada
 if not os.path.exists('models'):
@@ -19,44 +40,316 @@ if not os.path.exists('models'):
 if not os.path.exists('dataset'):
     os.makedirs('dataset')
 
-# Memuat data
-print("Memuat dataset...")
-try:
-    df = pd.read_csv('dataset/Dataset_Kelompok_10D.csv')
-except FileNotFoundError:
-    try:
-        df = pd.read_csv('Dataset_Kelompok_10D.csv')
-        # Salin ke direktori dataset
-        df.to_csv('dataset/Dataset_Kelompok_10D.csv', index=False)
-    except FileNotFoundError:
-        print("Error: File Dataset_Kelompok_10D.csv tidak ditemukan.")
-        exit(1)
-
-print(f"Dataset dimuat dengan {df.shape[0]} baris dan {df.shape[1]} kolom")
-
 # Fitur untuk clustering dan rekomendasi
-features = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)', 
+features = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)',
             'Maks. Waktu Tunggu Kerja (Bulan)', 'Gaji Awal Min', 'Gaji Awal Max']
 
-X = df[features].copy()
+# Fitur dan target untuk prediksi gaji
+rf_features = ['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)', 'Maks. Waktu Tunggu Kerja (Bulan)']
+rf_target = 'Gaji Awal Max'
+
+# Memilih jumlah cluster
+optimal_clusters = 4  # Bisa disesuaikan berdasarkan plot elbow method
+
+# Pencatat waktu, CPU dan memori setiap tahap; hasilnya ditulis ke models/training_report.json
+recorder = StageRecorder()
+stage = recorder.stage
+
+
+# Hash SHA-256 file dataset untuk membandingkan laporan antar pembaruan data
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# Satu model KMeans untuk k cluster (dijalankan paralel per k)
+def fit_kmeans(X_scaled, k):
+    return KMeans(n_clusters=k, random_state=42, n_init=10).fit(X_scaled)
+
+
+# Keluarga model k=2..10 untuk slider jumlah cluster di aplikasi: centroid, rata-rata fitur,
+# ukuran, inertia dan nama otomatis per k, disimpan dalam tipe ringkas
+def build_cluster_family(models, scaler, sums, counts, overall_means):
+    family = {}
+    for k in K_VALUES:
+        model = models[k]
+        means = pd.DataFrame(sums[k] / np.maximum(counts[k], 1)[:, None], columns=features)
+        family[k] = {
+            'centroids': model.cluster_centers_.astype(np.float32),
+            'means': means.to_numpy(dtype=np.float32),
+            'sizes': counts[k],
+            'inertia': float(getattr(model, 'inertia_', np.nan)),
+            'names': derive_cluster_names(means, overall_means),
+        }
+    return ClusterFamily(features, scaler.mean_, scaler.scale_, family)
+
+
+# Jumlah dan total fitur per cluster untuk satu himpunan label
+def cluster_sums(values, labels, k):
+    counts = np.bincount(labels, minlength=k)
+    sums = np.zeros((k, values.shape[1]))
+    for j in range(values.shape[1]):
+        sums[:, j] = np.bincount(labels, weights=values[:, j], minlength=k)
+    return sums, counts
+
+
+# Membaca dataset per chunk. Chunk terakhir yang terlalu kecil digabung ke chunk
+# sebelumnya karena partial_fit IncrementalPCA/MiniBatchKMeans butuh minimal
+# n_components/n_clusters baris.
+def iter_chunks(path, columns, min_rows=10):
+    pending = None
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=args.chunksize):
+        if pending is not None and len(chunk) < min_rows:
+            pending = pd.concat([pending, chunk], ignore_index=True)
+            continue
+        if pending is not None:
+            yield pending
+        pending = chunk
+    if pending is not None:
+        yield pending
+
+
+def train_standard(df):
+    X = df[features].copy()
+
+    # Standarisasi data
+    print("Melakukan standarisasi data...")
+    with stage("scale"):
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+
+    # PCA untuk visualisasi
+    print("Melakukan reduksi dimensi dengan PCA...")
+    with stage("pca"):
+        pca = PCA(n_components=2)
+        pca.fit(X_scaled)
+    print(f"Variance explained oleh 2 komponen pertama: {pca.explained_variance_ratio_.sum():.2f}")
+
+    # Menentukan jumlah cluster optimal dengan metode Elbow; semua k dilatih paralel dan
+    # model k=2..10 sekaligus disimpan sebagai keluarga model untuk slider jumlah cluster.
+    # Thread (KMeans melepas GIL) agar waktu CPU dan RSS tahap ini tercatat di proses utama.
+    with stage("elbow"):
+        elbow_models = dict(zip(range(1, 11), Parallel(n_jobs=-1, prefer='threads')(
+            delayed(fit_kmeans)(X_scaled, k) for k in range(1, 11)
+        )))
+        inertia = [elbow_models[k].inertia_ for k in range(1, 11)]
+
+    with stage("cluster_family"):
+        values = df[features].to_numpy(dtype=float)
+        family_stats = {k: cluster_sums(values, elbow_models[k].labels_, k) for k in K_VALUES}
+        cluster_family = build_cluster_family(
+            elbow_models, scaler,
+            {k: stats[0] for k, stats in family_stats.items()},
+            {k: stats[1] for k, stats in family_stats.items()},
+            df[features].mean()
+        )
+
+    print(f"Melakukan clustering dengan {optimal_clusters} cluster...")
+
+    # Clustering dengan K-Means
+    with stage("kmeans"):
+        kmeans = KMeans(n_clusters=optimal_clusters, random_state=42, n_init=10)
+        cluster_labels = kmeans.fit_predict(X_scaled)
+
+        # Menambahkan label cluster ke dataframe
+        df['Cluster'] = cluster_labels
+
+        # Analisis karakteristik cluster
+        cluster_means = df.groupby('Cluster')[features].mean()
+        cluster_sizes = df['Cluster'].value_counts()
+        overall_means = df[features].mean()
+
+    # Melatih model Random Forest untuk memprediksi gaji berdasarkan fitur-fitur lain
+    print("\nMelatih model Random Forest untuk prediksi gaji...")
+
+    X_rf = df[rf_features]
+    y_rf = df[rf_target]  # Target: prediksi gaji maksimal
+
+    # Split data
+    X_train, X_test, y_train, y_test = train_test_split(X_rf, y_rf, test_size=0.2, random_state=42)
 
-# Standarisasi data
-print("Melakukan standarisasi data...")
-scaler = StandardScaler()
-X_scaled = scaler.fit_transform(X)
+    # Train Random Forest model
+    with stage("rf_fit"):
+        rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
+        rf_model.fit(X_train, y_train)
 
-# PCA untuk visualisasi
-print("Melakukan reduksi dimensi dengan PCA...")
-pca = PCA(n_components=2)
-X_pca = pca.fit_transform(X_scaled)
-print(f"Variance explained oleh 2 komponen pertama: {pca.explained_variance_ratio_.sum():.2f}")
+    # Evaluasi model
+    with stage("evaluation"):
+        y_pred = rf_model.predict(X_test)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
 
-# Menentukan jumlah cluster optimal dengan metode Elbow
-inertia = []
-for k in range(1, 11):
-    kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-    kmeans.fit(X_scaled)
-    inertia.append(kmeans.inertia_)
+    return {
+        'n_rows': len(df),
+        'scaler': scaler,
+        'pca': pca,
+        'inertia': inertia,
+        'kmeans': kmeans,
+        'cluster_family': cluster_family,
+        'cluster_means': cluster_means,
+        'cluster_sizes': cluster_sizes,
+        'overall_means': overall_means,
+        'rf_model': rf_model,
+        'mse': mse,
+        'r2': r2,
+    }
+
+
+# Mode skala besar: setiap tahap membaca ulang CSV per chunk sehingga memori
+# hanya bergantung pada chunksize, bukan jumlah baris dataset
+def train_scalable(path):
+    usecols = list(dict.fromkeys(features + rf_features + [rf_target]))
+
+    # Standarisasi data secara inkremental
+    print("Melakukan standarisasi data (partial_fit per chunk)...")
+    with stage("scale"):
+        scaler = StandardScaler()
+        for chunk in iter_chunks(path, usecols):
+            scaler.partial_fit(chunk[features])
+        n_rows = int(scaler.n_samples_seen_ if np.isscalar(scaler.n_samples_seen_) else scaler.n_samples_seen_[0])
+    print(f"Dataset berisi {n_rows} baris")
+
+    # PCA inkremental untuk visualisasi
+    print("Melakukan reduksi dimensi dengan IncrementalPCA...")
+    with stage("pca"):
+        pca = IncrementalPCA(n_components=2)
+        for chunk in iter_chunks(path, usecols):
+            pca.partial_fit(scaler.transform(chunk[features]))
+    print(f"Variance explained oleh 2 komponen pertama: {pca.explained_variance_ratio_.sum():.2f}")
+
+    # Elbow method dengan MiniBatchKMeans: satu lintasan untuk fitting semua k,
+    # satu lintasan untuk menghitung inertia pada seluruh data
+    print("Menghitung elbow method dengan MiniBatchKMeans...")
+    with stage("elbow"):
+        elbow_models = [MiniBatchKMeans(n_clusters=k, random_state=42, n_init=3) for k in range(1, 11)]
+        with Parallel(n_jobs=-1, prefer='threads') as parallel:
+            for chunk in iter_chunks(path, usecols):
+                X_chunk = scaler.transform(chunk[features])
+                parallel(delayed(model.partial_fit)(X_chunk) for model in elbow_models)
+        inertia = [0.0] * len(elbow_models)
+        for chunk in iter_chunks(path, usecols):
+            X_chunk = scaler.transform(chunk[features])
+            for i, model in enumerate(elbow_models):
+                inertia[i] += -model.score(X_chunk)
+
+    print(f"Melakukan clustering dengan {optimal_clusters} cluster (MiniBatchKMeans, {args.epochs} epoch)...")
+    with stage("kmeans"):
+        kmeans = MiniBatchKMeans(n_clusters=optimal_clusters, random_state=42, n_init=3)
+        for _ in range(args.epochs):
+            for chunk in iter_chunks(path, usecols):
+                kmeans.partial_fit(scaler.transform(chunk[features]))
+
+    # Rata-rata fitur per cluster diakumulasi per chunk, sekaligus mengambil
+    # sampel acak (Bernoulli) untuk Random Forest
+    print("Menghitung karakteristik cluster dan sampel Random Forest...")
+    with stage("cluster_stats"):
+        rng = np.random.default_rng(42)
+        sample_prob = min(1.0, args.rf_max_rows / max(n_rows, 1))
+        sums = np.zeros((optimal_clusters, len(features)))
+        counts = np.zeros(optimal_clusters, dtype=np.int64)
+        # Statistik keluarga model k=2..10 (model elbow) diakumulasi pada lintasan yang sama;
+        # hanya jumlah dan total per cluster, bukan label per baris, agar memori tetap terbatas
+        family_models = {k: elbow_models[k - 1] for k in K_VALUES}
+        family_sums = {k: np.zeros((k, len(features))) for k in K_VALUES}
+        family_counts = {k: np.zeros(k, dtype=np.int64) for k in K_VALUES}
+        samples = []
+        for chunk in iter_chunks(path, usecols):
+            values = chunk[features].to_numpy(dtype=float)
+            X_chunk = scaler.transform(chunk[features])
+            labels = kmeans.predict(X_chunk)
+            counts += np.bincount(labels, minlength=optimal_clusters)
+            for j in range(len(features)):
+                sums[:, j] += np.bincount(labels, weights=values[:, j], minlength=optimal_clusters)
+            for k, model in family_models.items():
+                k_labels = model.predict(X_chunk)
+                chunk_sums, chunk_counts = cluster_sums(values, k_labels, k)
+                family_sums[k] += chunk_sums
+                family_counts[k] += chunk_counts
+            if sample_prob < 1.0:
+                chunk = chunk[rng.random(len(chunk)) < sample_prob]
+            samples.append(chunk[rf_features + [rf_target]])
+        sample_df = pd.concat(samples, ignore_index=True)
+        del samples
+
+    cluster_means = pd.DataFrame(sums / np.maximum(counts, 1)[:, None], columns=features)
+    cluster_means.index.name = 'Cluster'
+    cluster_sizes = pd.Series(counts, index=cluster_means.index)
+    overall_means = pd.Series(scaler.mean_, index=features)
+    cluster_family = build_cluster_family(
+        family_models, scaler, family_sums, family_counts, overall_means
+    )
+
+    # Random Forest dilatih pada sampel; max_samples membatasi ukuran bootstrap per pohon
+    print(f"\nMelatih model Random Forest untuk prediksi gaji ({len(sample_df)} baris sampel)...")
+    X_train, X_test, y_train, y_test = train_test_split(
+        sample_df[rf_features], sample_df[rf_target], test_size=0.2, random_state=42
+    )
+    with stage("rf_fit"):
+        rf_model = RandomForestRegressor(
+            n_estimators=100,
+            random_state=42,
+            n_jobs=-1,
+            max_samples=args.rf_max_samples if len(X_train) > 1 else None
+        )
+        rf_model.fit(X_train, y_train)
+
+    with stage("evaluation"):
+        y_pred = rf_model.predict(X_test)
+        mse = mean_squared_error(y_test, y_pred)
+        r2 = r2_score(y_test, y_pred)
+
+    return {
+        'n_rows': n_rows,
+        'scaler': scaler,
+        'pca': pca,
+        'inertia': inertia,
+        'kmeans': kmeans,
+        'cluster_family': cluster_family,
+        'cluster_means': cluster_means,
+        'cluster_sizes': cluster_sizes,
+        'overall_means': overall_means,
+        'rf_model': rf_model,
+        'mse': mse,
+        'r2': r2,
+    }
+
+
+if args.skala_besar:
+    if not os.path.exists(args.data):
+        print(f"Error: File {args.data} tidak ditemukan.")
+        exit(1)
+    print(f"Mode skala besar: membaca {args.data} per {args.chunksize} baris")
+    result = train_scalable(args.data)
+else:
+    # Memuat data
+    print("Memuat dataset...")
+    with stage("load"):
+        try:
+            df = pd.read_csv(args.data)
+        except FileNotFoundError:
+            try:
+                df = pd.read_csv('Dataset_Kelompok_10D.csv')
+                # Salin ke direktori dataset
+                df.to_csv('dataset/Dataset_Kelompok_10D.csv', index=False)
+                args.data = 'dataset/Dataset_Kelompok_10D.csv'
+            except FileNotFoundError:
+                print("Error: File Dataset_Kelompok_10D.csv tidak ditemukan.")
+                exit(1)
+
+    print(f"Dataset dimuat dengan {df.shape[0]} baris dan {df.shape[1]} kolom")
+    result = train_standard(df)
+
+scaler = result['scaler']
+pca = result['pca']
+kmeans = result['kmeans']
+rf_model = result['rf_model']
+inertia = result['inertia']
+cluster_means = result['cluster_means']
+cluster_sizes = result['cluster_sizes']
+overall_means = result['overall_means']
 
 # Plot Elbow Method
 plt.figure(figsize=(10, 6))
@@ -67,62 +360,25 @@ plt.ylabel('Inertia')
 plt.savefig('elbow_method.png')
 plt.close()
 
-# Memilih jumlah cluster
-optimal_clusters = 4  # Bisa disesuaikan berdasarkan plot elbow method
-print(f"Melakukan clustering dengan {optimal_clusters} cluster...")
-
-# Clustering dengan K-Means
-kmeans = KMeans(n_clusters=optimal_clusters, random_state=42, n_init=10)
-cluster_labels = kmeans.fit_predict(X_scaled)
-
-# Menambahkan label cluster ke dataframe
-df['Cluster'] = cluster_labels
-
-# Analisis karakteristik cluster
-cluster_means = df.groupby('Cluster')[features].mean()
 print("\nKarakteristik rata-rata setiap cluster:")
 print(cluster_means)
 
 # Interpretasi cluster
 print("\nInterpretasi Cluster:")
 for cluster in range(optimal_clusters):
-    cluster_data = df[df['Cluster'] == cluster]
-    avg_peminat = cluster_data['Peminat 2024'].mean()
-    avg_gaji = cluster_data['Gaji Awal Max'].mean()
-    
-    if avg_peminat < df['Peminat 2024'].mean():
-        peminat_status = "Sepi Peminat"
-    else:
-        peminat_status = "Banyak Peminat"
-    
-    if avg_gaji > df['Gaji Awal Max'].mean():
-        gaji_status = "Prospek Bagus"
-    else:
-        gaji_status = "Prospek Sedang"
-    
+    avg_peminat = cluster_means.loc[cluster, 'Peminat 2024']
+    avg_gaji = cluster_means.loc[cluster, 'Gaji Awal Max']
+    peminat_status, gaji_status = cluster_status(
+        avg_peminat, avg_gaji, overall_means['Peminat 2024'], overall_means['Gaji Awal Max']
+    )
+
     print(f"Cluster {cluster}: {peminat_status}, {gaji_status}")
-    print(f"  - Jumlah jurusan: {len(cluster_data)}")
+    print(f"  - Jumlah jurusan: {cluster_sizes.get(cluster, 0)}")
     print(f"  - Rata-rata peminat: {avg_peminat:.2f}")
     print(f"  - Rata-rata gaji max: Rp {avg_gaji:,.2f}")
 
-# Melatih model Random Forest untuk memprediksi gaji berdasarkan fitur-fitur lain
-print("\nMelatih model Random Forest untuk prediksi gaji...")
-
-# Fitur untuk prediksi gaji
-X_rf = df[['Peminat 2024', 'Rasio Keketatan', 'Tingkat Kelulusan (%)', 'Maks. Waktu Tunggu Kerja (Bulan)']]
-y_rf = df['Gaji Awal Max']  # Target: prediksi gaji maksimal
-
-# Split data
-X_train, X_test, y_train, y_test = train_test_split(X_rf, y_rf, test_size=0.2, random_state=42)
-
-# Train Random Forest model
-rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
-rf_model.fit(X_train, y_train)
-
-# Evaluasi model
-y_pred = rf_model.predict(X_test)
-mse = mean_squared_error(y_test, y_pred)
-r2 = r2_score(y_test, y_pred)
+mse = result['mse']
+r2 = result['r2']
 
 print(f"Model Random Forest untuk prediksi gaji:")
 print(f"Mean Squared Error: {mse:.2f}")
@@ -169,40 +425,38 @@ kota_coords = {
     'Sorong': [-0.8663, 131.2507]
 }
 
-# Simpan data koordinat untuk digunakan di aplikasi utama
-joblib.dump(kota_coords, 'models/kota_coords.pkl')
+# Tambahan: simpan cluster_names untuk interpreatsi di aplikasi utama
+cluster_names = derive_cluster_names(cluster_means, overall_means)
 
 # Menyimpan model
 print("\nMenyimpan model...")
-joblib.dump(kmeans, 'models/kmeans_model.pkl')
-joblib.dump(scaler, 'models/scaler.pkl')
-joblib.dump(pca, 'models/pca_model.pkl')
-joblib.dump(rf_model, 'models/random_forest_model.pkl')
-
-# Tambahan: simpan cluster_names untuk interpreatsi di aplikasi utama
-cluster_names = {}
-for cluster in range(optimal_clusters):
-    cluster_data = df[df['Cluster'] == cluster]
-    avg_peminat = cluster_data['Peminat 2024'].mean()
-    avg_gaji = cluster_data['Gaji Awal Max'].mean()
-    
-    if avg_peminat < df['Peminat 2024'].mean():
-        peminat_status = "Sepi Peminat"
-    else:
-        peminat_status = "Banyak Peminat"
-    
-    if avg_gaji > df['Gaji Awal Max'].mean():
-        gaji_status = "Prospek Bagus"
-    else:
-        gaji_status = "Prospek Sedang"
-    
-    emoji = "🟢" if peminat_status == "Sepi Peminat" and gaji_status == "Prospek Bagus" else \
-            "🟡" if peminat_status == "Sepi Peminat" and gaji_status == "Prospek Sedang" else \
-            "🔵" if peminat_status == "Banyak Peminat" and gaji_status == "Prospek Bagus" else "🟠"
-    
-    cluster_names[cluster] = f"{emoji} {peminat_status}, {gaji_status}"
-
-joblib.dump(cluster_names, 'models/cluster_names.pkl')
+with stage("dump") as record:
+    artifacts = {
+        'models/kota_coords.pkl': kota_coords,  # Simpan data koordinat untuk digunakan di aplikasi utama
+        'models/kmeans_model.pkl': kmeans,
+        'models/scaler.pkl': scaler,
+        'models/pca_model.pkl': pca,
+        'models/random_forest_model.pkl': rf_model,
+        'models/cluster_names.pkl': cluster_names,
+        'models/cluster_family.pkl': result['cluster_family'],
+    }
+    for path, obj in artifacts.items():
+        joblib.dump(obj, path)
+        recorder.add_artifact(record, path)
+    recorder.add_artifact(record, 'elbow_method.png')
 
 print("Semua model berhasil disimpan di direktori 'models'")
-print("Training selesai!")
\ No newline at end of file
+
+# Laporan waktu dan memori training untuk memantau regresi biaya antar pembaruan data
+report = recorder.write_report(
+    'models/training_report.json',
+    history_path='models/training_history.jsonl',
+    mode='skala_besar' if args.skala_besar else 'standar',
+    dataset=args.data,
+    dataset_sha256=file_sha256(args.data),
+    n_rows=result['n_rows'],
+    sklearn=sklearn.__version__,
+    metrics={'mse': mse, 'r2': r2},
+)
+print(f"Laporan training disimpan di models/training_report.json (total {report['total_wall_s']:.2f} detik)")
+print("Training selesai!")
@@ -0,0 +1,86 @@
+# Warm-up sebelum deploy: membangun semua artefak runtime (dataset kolumnar, label cluster
+# dan PCA, kubus kontingensi, indeks terurut, grafik tampilan default) dan menyimpannya ke
+# direktori cache, sehingga proses Streamlit pertama langsung memuat artefak jadi.
+# Jalankan setelah training.py:  python warmup.py
+import argparse
+import multiprocessing
+import os
+import time
+
+from artifacts import CACHE_DIR, build_artifacts, load_cached_artifacts, save_artifacts, source_version
+from data_loader import MODELS_DIR
+from profiling import StageRecorder, memory_breakdown_mb
+
+
+# Dijalankan di proses terpisah: memuat cache (dengan/tanpa mmap), menyentuh data seperti
+# saat melayani halaman, lalu melaporkan waktu muat dan rincian memori proses
+def _measure_worker(version, cache_dir, mmap):
+    # Modul sklearn diimpor lebih dulu agar tidak ikut terhitung sebagai memori artefak
+    import sklearn.cluster, sklearn.decomposition, sklearn.ensemble, sklearn.preprocessing  # noqa: F401
+    before = memory_breakdown_mb()
+    start = time.perf_counter()
+    artifacts = load_cached_artifacts(version, cache_dir, mmap=mmap)
+    elapsed = time.perf_counter() - start
+    artifacts.df.select_dtypes('number').sum()
+    for order in artifacts.table_index.orders.values():
+        order.sum()
+    after = memory_breakdown_mb()
+    if before is None or after is None:
+        return elapsed, None
+    return elapsed, {key: round(after[key] - before[key], 1) for key in after}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bangun cache artefak runtime dashboard Insight PTN")
+    parser.add_argument('--data', default=None, help="Path dataset (default: dataset/Dataset_Kelompok_10D.csv)")
+    parser.add_argument('--models-dir', default=MODELS_DIR, help="Direktori model hasil training.py")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="Direktori cache artefak")
+    parser.add_argument('--keep', type=int, default=3, help="Jumlah versi cache yang dipertahankan")
+    parser.add_argument('--ukur', action='store_true',
+                        help="Bandingkan waktu siap aplikasi tanpa cache (dingin) dan dengan cache (panas)")
+    args = parser.parse_args()
+
+    recorder = StageRecorder()
+    version = source_version(args.data, args.models_dir)
+    print(f"Versi artefak: {version}")
+
+    with recorder.stage("build") as record:
+        artifacts = build_artifacts(args.data, args.models_dir, version=version, use_cache=False)
+        # Sumber bisa berubah sejak versi di atas dihitung; pakai versi yang benar-benar dibaca
+        version = artifacts.version
+        record['rows'] = len(artifacts.df)
+        record['figures'] = len(artifacts.figures)
+
+    with recorder.stage("save") as record:
+        path = save_artifacts(artifacts, args.cache_dir, keep=args.keep, overwrite=True)
+        for name in os.listdir(path):
+            recorder.add_artifact(record, os.path.join(path, name))
+
+    print(f"\nCache disimpan di {path}")
+    for name, size in recorder.stages[-1]['artifacts'].items():
+        print(f"  {name:<20} {size / (1024 * 1024):>8.2f} MB")
+
+    if args.ukur:
+        # Dingin: yang dibayar proses pertama tanpa cache; panas: memuat dari cache
+        cold = recorder.stages[0]['wall_s']
+        start = time.perf_counter()
+        load_cached_artifacts(version, args.cache_dir)
+        hot = time.perf_counter() - start
+        print(f"\nWaktu siap tanpa cache : {cold:.2f} detik")
+        print(f"Waktu siap dengan cache: {hot:.2f} detik ({cold / hot:.1f}x lebih cepat)")
+
+        # Memori per worker: salinan penuh vs memetakan artefak bersama (mmap)
+        context = multiprocessing.get_context('spawn')
+        with context.Pool(1, maxtasksperchild=1) as pool:
+            for mmap in (False, True):
+                elapsed, memory = pool.apply(_measure_worker, (version, args.cache_dir, mmap))
+                label = "mmap bersama" if mmap else "salinan penuh"
+                if memory is None:
+                    print(f"Worker {label:<14}: muat {elapsed:.2f} detik")
+                else:
+                    print(f"Worker {label:<14}: muat {elapsed:.2f} detik, heap privat +{memory['anon_mb']} MB, "
+                          f"halaman file bersama +{memory['file_mb']} MB")
+
+
+if __name__ == '__main__':
+    main()